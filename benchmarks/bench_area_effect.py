@@ -0,0 +1,87 @@
+"""
+Un cleave contra 20 enemigos al alcance.
+
+Compara resolverlo como 20 AttackAction (una query de AC, tiradas y un
+dispatch de daño por objetivo) contra un único AreaEffectAction en modo
+attack (AC en batch, d20 vectorizados y un solo evento area_damage).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_area_effect
+"""
+
+import time
+import uuid
+
+from src.core.character.character import Character
+from src.core.character.dndclass import CLASS_MAP
+from src.core.character.enemy import Enemy
+from src.core.character.race import RACE_MAP
+from src.core.combat.phase import Phase
+from src.core.game.Action import AreaEffectAction, AttackAction
+from src.core.game.bootstrap import register_core_rules
+from src.core.game.commands import AreaEffectCommand, AttackCommand
+from src.core.game.Event import GameState
+from src.core.game.rng import DiceRNG
+from src.core.items.item import ItemInstance
+from src.core.items.items import ITEMS, LONG_SWORD
+
+TARGETS = 20
+ITERATIONS = 300
+
+
+def build_state() -> tuple[GameState, uuid.UUID, tuple[uuid.UUID, ...]]:
+    state = GameState(current_phase=Phase.COMBAT, rng=DiceRNG(1))
+    register_core_rules(state)
+
+    hero = Character(
+        id=uuid.uuid4(), owner_id=uuid.uuid4(), name="Heroe",
+        race=RACE_MAP["Human"], dnd_class=CLASS_MAP["Barbaro"](),
+    )
+    sword = ItemInstance(item=ITEMS[LONG_SWORD])
+    hero.add_item(sword)
+    hero.equip(sword)
+    state.add_character(hero)
+
+    for i in range(TARGETS):
+        # HP alto: nadie muere durante la medición
+        state.add_enemy(Enemy(
+            id=uuid.uuid4(), owner_id=None, name=f"Goblin {i}",
+            hp=10**9, max_hp=10**9, ac=13, asset_url="none",
+        ))
+
+    state.current_actor = hero.id
+    return state, hero.id, tuple(state.enemies)
+
+
+def one_by_one(state: GameState, hero_id, target_ids) -> None:
+    for target_id in target_ids:
+        state.resources[hero_id] = {"action": 1}
+        AttackAction(AttackCommand(hero_id, target_id, "melee", False, False)).execute(state)
+
+
+def batched(state: GameState, hero_id, target_ids) -> None:
+    state.resources[hero_id] = {"action": 1}
+    AreaEffectAction(AreaEffectCommand(
+        actor_id=hero_id, target_ids=target_ids, name="Cleave", mode="attack"
+    )).execute(state)
+
+
+def measure(resolve) -> float:
+    state, hero_id, target_ids = build_state()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        resolve(state, hero_id, target_ids)
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main() -> None:
+    single = measure(one_by_one)
+    area = measure(batched)
+
+    print(f"Cleave contra {TARGETS} objetivos")
+    print(f"  {TARGETS} AttackAction:     {single * 1e3:8.3f} ms")
+    print(f"  1 AreaEffectAction:  {area * 1e3:8.3f} ms  ({single / area:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
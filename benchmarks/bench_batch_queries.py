@@ -0,0 +1,95 @@
+"""
+Refresco de la lista de entidades del DM para un encuentro de 50 combatientes.
+
+Compara AC + 6 modificadores de atributo por actor resueltos:
+- query por query (una ShadowState por consulta, sin caché)
+- con GetArmorClassBatch + GetStatModifiersBatch (una ShadowState por batch, sin caché)
+- con los batch y la caché caliente (refrescos sucesivos)
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_batch_queries
+"""
+
+import time
+import uuid
+
+from src.core.character.character import Character
+from src.core.character.dndclass import CLASS_MAP
+from src.core.character.enemy import Enemy
+from src.core.character.race import RACE_MAP
+from src.core.game.Event import GameState
+from src.core.game.query_cache import QueryCache
+from src.core.game.querys import (
+    STAT_ATTRIBUTES,
+    GetArmorClass,
+    GetArmorClassBatch,
+    GetArmorClassBatchHandler,
+    GetArmorClassHandler,
+    GetStatModifier,
+    GetStatModifierHandler,
+    GetStatModifiersBatch,
+    GetStatModifiersBatchHandler,
+)
+
+CHARACTERS = 6
+ENEMIES = 44
+ITERATIONS = 20
+
+
+def build_state(cache_enabled: bool) -> tuple[GameState, tuple[uuid.UUID, ...]]:
+    state = GameState(query_cache=QueryCache(enabled=cache_enabled))
+    state.register_query_handler(GetArmorClass, GetArmorClassHandler())
+    state.register_query_handler(GetStatModifier, GetStatModifierHandler())
+    state.register_query_handler(GetArmorClassBatch, GetArmorClassBatchHandler())
+    state.register_query_handler(GetStatModifiersBatch, GetStatModifiersBatchHandler())
+
+    for i in range(CHARACTERS):
+        state.add_character(Character(
+            id=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            name=f"Heroe {i}",
+            race=RACE_MAP["Human"],
+            dnd_class=CLASS_MAP["Barbaro"](),
+        ))
+    for i in range(ENEMIES):
+        state.add_enemy(Enemy(
+            id=uuid.uuid4(), owner_id=None, name=f"Goblin {i}",
+            hp=7, max_hp=7, ac=15, asset_url="none",
+        ))
+
+    return state, (*state.characters, *state.enemies)
+
+
+def refresh_one_by_one(state: GameState, actor_ids: tuple[uuid.UUID, ...]) -> None:
+    for actor_id in actor_ids:
+        state.query(GetArmorClass(actor_id=actor_id, context="ui"))
+        for attribute in STAT_ATTRIBUTES:
+            state.query(GetStatModifier(actor_id=actor_id, attribute=attribute))
+
+
+def refresh_batch(state: GameState, actor_ids: tuple[uuid.UUID, ...]) -> None:
+    state.query(GetArmorClassBatch(actor_ids=actor_ids, context="ui"))
+    state.query(GetStatModifiersBatch(actor_ids=actor_ids))
+
+
+def measure(refresh, state: GameState, actor_ids: tuple[uuid.UUID, ...]) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        refresh(state, actor_ids)
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main() -> None:
+    single = measure(refresh_one_by_one, *build_state(cache_enabled=False))
+    batch = measure(refresh_batch, *build_state(cache_enabled=False))
+    warm_state, warm_ids = build_state(cache_enabled=True)
+    warm = measure(refresh_batch, warm_state, warm_ids)
+
+    print(f"Refresco de entidades · {CHARACTERS + ENEMIES} combatientes · AC + {len(STAT_ATTRIBUTES)} modificadores")
+    print(f"  query por query:        {single * 1e3:8.2f} ms/refresco")
+    print(f"  batch (una pasada):     {batch * 1e3:8.2f} ms/refresco  ({single / batch:.1f}x)")
+    print(f"  batch + caché caliente: {warm * 1e3:8.2f} ms/refresco  ({single / warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
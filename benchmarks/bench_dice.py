@@ -0,0 +1,68 @@
+"""
+Tiradas de dados: parseo por tirada (RollAction anterior) contra expresiones
+compiladas, tirada a tirada (módulo random y DiceRNG con buffers) y en lote
+con NumPy.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_dice
+"""
+
+import random
+import time
+
+from src.core.game.dice import compile_dice
+from src.core.game.rng import DiceRNG
+
+EXPRESSIONS = ("1d20+5", "2d6+3", "1d8+1d6+2", "4d6kh3")
+N_ROLLS = 20_000
+N_BATCH = 1_000_000
+
+
+def legacy_roll(dice: str) -> int:
+    """Parseo de RollAction antes del motor compilado (solo NdS+B)"""
+    count, rest = dice.lower().split("d")
+    count = int(count)
+    if "+" in rest:
+        size, bonus = rest.split("+")
+        size = int(size)
+        bonus = int(bonus)
+    else:
+        size = int(rest)
+        bonus = 0
+    return sum(random.randint(1, size) for _ in range(count)) + bonus
+
+
+def measure(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def main() -> None:
+    import numpy as np
+
+    rng = DiceRNG(seed=7)
+    generator = rng.generator
+
+    print(f"Tiradas de dados · {N_ROLLS} tiradas individuales · lotes de {N_BATCH}")
+    for dice in EXPRESSIONS:
+        expression = compile_dice(dice)
+        legacy = measure(lambda: legacy_roll(dice), N_ROLLS) if dice in ("1d20+5", "2d6+3") else None
+        compiled = measure(lambda: compile_dice(dice).roll(), N_ROLLS)
+        buffered = measure(lambda: compile_dice(dice).roll(rng=rng), N_ROLLS)
+
+        start = time.perf_counter()
+        totals = expression.roll_batch(N_BATCH, generator=generator)
+        batch = (time.perf_counter() - start) / N_BATCH
+
+        legacy_str = f"{legacy * 1e9:7.0f} ns" if legacy is not None else "    n/a   "
+        print(
+            f"  {dice:>10}: parseo por tirada {legacy_str} · compilada {compiled * 1e9:7.0f} ns"
+            f" · con DiceRNG {buffered * 1e9:7.0f} ns"
+            f" · lote NumPy {batch * 1e9:5.1f} ns/tirada (media {totals.mean():.2f}, esperada {expression.average:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
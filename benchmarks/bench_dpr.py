@@ -0,0 +1,71 @@
+"""
+Tabla de daño por ronda: 12 clases × 20 niveles × armas × 11 AC.
+
+Compara el cálculo exacto vectorizado (DprService) contra estimarlo
+tirando dados uno por uno (Monte Carlo con DiceExpression.roll), y el
+costo de servir la tabla ya cacheada.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_dpr
+"""
+
+import random
+import tempfile
+import time
+
+from src.core.character.dndclass import CLASS_MAP
+from src.features.analytics.application.dpr_calculator import ability_score, proficiency_bonus
+from src.features.analytics.application.dpr_service import DEFAULT_TARGET_ACS, LEVELS, DprService, combat_weapons
+from src.features.analytics.infrastructure.file_analytics_cache import FileAnalyticsCache
+
+SAMPLES = 200  # tiradas por celda en la versión Monte Carlo (muy por debajo de lo necesario)
+
+
+def monte_carlo_table() -> None:
+    rng = random.Random(1)
+    for cls in CLASS_MAP.values():
+        dnd_class = cls()
+        for weapon in combat_weapons():
+            proficient = weapon.proficiency_type in dnd_class.weapon_proficiencies
+            dice = weapon.damage_dice
+            for level in LEVELS:
+                mod = (ability_score(level) - 10) // 2
+                bonus = weapon.bonus + mod + (proficiency_bonus(level) if proficient else 0)
+                for ac in DEFAULT_TARGET_ACS:
+                    total = 0
+                    for _ in range(SAMPLES):
+                        natural = rng.randint(1, 20)
+                        if natural == 20 or natural + bonus >= ac:
+                            total += max(0, dice.roll(rng, critical=natural == 20).total + mod)
+                    total / SAMPLES
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        DprService(FileAnalyticsCache(directory)).damage_table()
+        exact = time.perf_counter() - start
+
+        start = time.perf_counter()
+        DprService(FileAnalyticsCache(directory)).damage_table()
+        disk = time.perf_counter() - start
+
+        service = DprService(FileAnalyticsCache(directory))
+        service.damage_table()
+        start = time.perf_counter()
+        service.damage_table()
+        memory = time.perf_counter() - start
+
+    start = time.perf_counter()
+    monte_carlo_table()
+    sampled = time.perf_counter() - start
+
+    print(f"Tabla DPR · {len(CLASS_MAP)} clases × {len(LEVELS)} niveles × {len(combat_weapons())} armas × {len(DEFAULT_TARGET_ACS)} AC")
+    print(f"  Monte Carlo ({SAMPLES} tiradas/celda): {sampled * 1e3:9.1f} ms")
+    print(f"  exacto vectorizado:              {exact * 1e3:9.1f} ms  ({sampled / exact:.0f}x)")
+    print(f"  desde disco:                     {disk * 1e3:9.1f} ms")
+    print(f"  desde memoria:                   {memory * 1e3:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Fin de turno con muchos actores con estados: recorrer todos los `status`
+y decrementar contadores (implementación anterior) contra EffectScheduler.
+
+Cada actor tiene un par de estados largos y, cada pocos turnos, alguno
+recibe un estado corto nuevo. Se mide el costo por fin de turno.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_effect_scheduler
+"""
+
+import time
+import uuid
+
+from src.core.game.effect_scheduler import EffectScheduler
+
+ACTOR_COUNTS = (20, 200, 2000)
+TURNS = 2000
+APPLY_EVERY = 3
+
+
+class Actor:
+    def __init__(self):
+        self.id = uuid.uuid4()
+        self.status = {}
+
+
+def build(count: int) -> list[Actor]:
+    actors = [Actor() for _ in range(count)]
+    for actor in actors:
+        actor.status["bendecido"] = {"turns": 10 * TURNS}
+        actor.status["resistencia"] = {"turns": 10 * TURNS}
+    return actors
+
+
+def legacy_end_turns(actors: list[Actor]) -> int:
+    expired = 0
+    for turn in range(TURNS):
+        if turn % APPLY_EVERY == 0:
+            actors[turn % len(actors)].status["aturdido"] = {"turns": 2}
+
+        for actor in actors:
+            for name, data in list(actor.status.items()):
+                if not isinstance(data, dict) or "turns" not in data:
+                    continue
+                data["turns"] -= 1
+                if data["turns"] <= 0:
+                    del actor.status[name]
+                    expired += 1
+    return expired
+
+
+def scheduler_end_turns(actors: list[Actor]) -> int:
+    scheduler = EffectScheduler.from_statuses(actors)
+    expired = 0
+    for turn in range(TURNS):
+        if turn % APPLY_EVERY == 0:
+            actor = actors[turn % len(actors)]
+            actor.status["aturdido"] = {"turns": 2}
+            scheduler.schedule_expiry(actor.id, "aturdido", 2)
+
+        for actor_id, status in scheduler.advance():
+            expired += 1
+    return expired
+
+
+def measure(fn, count: int) -> tuple[int, float]:
+    actors = build(count)
+    start = time.perf_counter()
+    expired = fn(actors)
+    return expired, time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{TURNS} fines de turno · 2 estados largos por actor · un estado corto cada {APPLY_EVERY} turnos")
+    for count in ACTOR_COUNTS:
+        legacy_expired, legacy = measure(legacy_end_turns, count)
+        sched_expired, sched = measure(scheduler_end_turns, count)
+        assert legacy_expired == sched_expired
+        print(
+            f"  {count:5d} actores: recorrido {legacy * 1e6 / TURNS:9.1f} µs/turno · "
+            f"scheduler {sched * 1e6 / TURNS:6.2f} µs/turno · {legacy / sched:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
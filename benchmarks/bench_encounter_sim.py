@@ -0,0 +1,74 @@
+"""
+Simulación Monte Carlo de un encuentro: 4 héroes contra 6 goblins.
+
+Mide corridas por segundo del EncounterSimulator en un solo proceso y con
+el pool de procesos, y muestra el reporte resultante.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_encounter_sim
+"""
+
+import time
+import uuid
+
+from src.core.character.character import Character
+from src.core.character.dndclass import CLASS_MAP
+from src.core.character.enemy import Enemy, EnemyAttack
+from src.core.character.race import RACE_MAP
+from src.core.items.item import ItemInstance
+from src.core.items.items import ITEMS, LONG_SWORD
+from src.features.simulation.application.encounter_simulator import EncounterSimulator
+
+HEROES = 4
+GOBLINS = 6
+RUNS = 2000
+SEED = 1234
+
+
+def build_encounter() -> tuple[list[Character], list[Enemy]]:
+    party = []
+    for i in range(HEROES):
+        hero = Character(
+            id=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            name=f"Heroe {i}",
+            race=RACE_MAP["Human"],
+            dnd_class=CLASS_MAP["Barbaro"](),
+        )
+        sword = ItemInstance(item=ITEMS[LONG_SWORD])
+        hero.add_item(sword)
+        hero.equip(sword)
+        party.append(hero)
+
+    goblin = Enemy(
+        id=uuid.uuid4(), owner_id=None, name="Goblin", hp=7, max_hp=7, ac=15, asset_url="none",
+        attacks=[EnemyAttack(name="Scimitar", dice_count=1, dice_size=6, damage_bonus=2, attack_bonus=4)],
+    )
+    # El simulador le asigna un id propio a cada copia
+    return party, [goblin] * GOBLINS
+
+
+def measure(simulator: EncounterSimulator, party, enemies):
+    start = time.perf_counter()
+    report = simulator.simulate(party, enemies, runs=RUNS, seed=SEED)
+    return report, time.perf_counter() - start
+
+
+def main() -> None:
+    party, enemies = build_encounter()
+
+    _, single = measure(EncounterSimulator(workers=1), party, enemies)
+    pooled_sim = EncounterSimulator()
+    measure(pooled_sim, party, enemies)  # calentar el pool
+    report, pooled = measure(pooled_sim, party, enemies)
+    pooled_sim.shutdown()
+
+    print(f"Encuentro · {HEROES} héroes vs {GOBLINS} goblins · {RUNS} combates")
+    print(f"  1 proceso:              {single:8.2f} s  ({RUNS / single:8.0f} combates/s)")
+    print(f"  pool ({pooled_sim.workers:2d} workers):     {pooled:8.2f} s  ({RUNS / pooled:8.0f} combates/s)")
+    print(f"  victorias: {report.win_rate:.1%} · rondas promedio: {report.average_rounds_to_win or 0:.1f}"
+          f" · HP perdido esperado: {report.expected_hp_loss:.1f} · dificultad: {report.difficulty()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Planificador de turnos de enemigos: tiempo de planificación de un grupo
+grande de minions y latencia del loop de eventlet mientras se planifica.
+
+Un greenlet "latido" mide cada cuánto consigue correr el hub (como lo haría
+cualquier otra campaña del nodo). Se compara planificar dentro del loop
+contra planificar en el pool con eventlet.tpool.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_enemy_planner
+"""
+
+import time
+import uuid
+
+import eventlet
+from eventlet import tpool
+
+from src.features.enemies.application.enemy_turn_planner import (
+    EnemyTurnPlanner,
+    PlanAttack,
+    PlanAttacker,
+    PlanTarget,
+    TurnRequest,
+    plan_turn,
+)
+
+MINIONS = 5000
+HEROES = 6
+TURNS = 20
+BEAT_MS = 1
+
+
+def build_request() -> TurnRequest:
+    attacks = (
+        PlanAttack(name="Scimitar", dice="1d6+2", attack_bonus=4),
+        PlanAttack(name="Bite", dice="2d4", attack_bonus=5),
+        PlanAttack(name="Shortbow", dice="1d6+2", attack_bonus=4, range_ft=80),
+    )
+    targets = tuple(
+        PlanTarget(id=uuid.uuid4(), hp=20 + 10 * i, ac=12 + i, x=i, y=0, conditions=0)
+        for i in range(HEROES)
+    )
+    attackers = tuple(
+        PlanAttacker(id=uuid.uuid4(), x=i % 8, y=1 + (i // 8) % 4, conditions=0, attacks=attacks)
+        for i in range(MINIONS)
+    )
+    # Sin límite de tiempo: se mide el costo completo
+    return TurnRequest(turn_id=uuid.uuid4(), turn_number=1, attackers=attackers, targets=targets, budget_ms=10_000)
+
+
+def worst_loop_gap(plan) -> tuple[float, float]:
+    """Corre `plan` TURNS veces y devuelve (segundos totales, mayor hueco del hub en ms)"""
+    gaps = []
+    running = True
+
+    def heartbeat():
+        last = time.perf_counter()
+        while running:
+            eventlet.sleep(BEAT_MS / 1000)
+            now = time.perf_counter()
+            gaps.append((now - last) * 1000)
+            last = now
+
+    beat = eventlet.spawn(heartbeat)
+    eventlet.sleep(0.01)
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        plan()
+    elapsed = time.perf_counter() - start
+    running = False
+    beat.wait()
+    return elapsed, max(gaps)
+
+
+def main() -> None:
+    request = build_request()
+    planner = EnemyTurnPlanner(budget_ms=10_000)
+    planner.plan(request)  # calentar el pool
+
+    inline, inline_gap = worst_loop_gap(lambda: plan_turn(request))
+    pooled, pooled_gap = worst_loop_gap(lambda: tpool.execute(planner.plan, request))
+    planner.shutdown()
+
+    plan = plan_turn(request)
+    print(f"{MINIONS} minions vs {HEROES} héroes · {TURNS} turnos planificados")
+    print(f"  plan de un turno:          {plan.elapsed_ms:8.2f} ms ({len(plan.attacks)} ataques)")
+    print(f"  en el loop:   {inline / TURNS * 1000:8.2f} ms/turno · peor hueco del hub {inline_gap:8.2f} ms")
+    print(f"  pool + tpool: {pooled / TURNS * 1000:8.2f} ms/turno · peor hueco del hub {pooled_gap:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
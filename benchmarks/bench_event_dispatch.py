@@ -0,0 +1,116 @@
+"""
+Micro-benchmark de Event + EventDispatcher.
+
+Mide:
+- Costo de construir eventos (ns y bytes retenidos por evento), comparando
+  el Event compacto con __slots__ contra el dataclass anterior (uuid4 +
+  datetime.utcnow + dict de payload siempre alocado)
+- Eventos/segundo a través de GameState.dispatch y bloques alocados por evento
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_event_dispatch
+"""
+
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+from src.core.game.Event import Event, EventContext, GameState
+from src.core.game.event_log import EventLog
+from src.core.game.EventHandlers import TokenMovedHandler
+
+N_EVENTS = 50_000
+
+
+@dataclass(frozen=True)
+class LegacyEvent:
+    """Representación anterior de Event, solo para comparar."""
+    id: UUID = field(default_factory=uuid4)
+    type: str = ""
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    source: Optional[str] = None
+    context: Optional[EventContext] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    cancelable: bool = False
+
+
+def _build_events(event_cls: type, actor_id: UUID) -> list:
+    return [
+        event_cls(type="ac_requested", context=EventContext(actor_id=actor_id))
+        for _ in range(N_EVENTS)
+    ]
+
+
+def bench_construction(event_cls: type, actor_id: UUID) -> tuple[float, float]:
+    """Devuelve (ns por evento, bytes retenidos por evento)."""
+    start = time.perf_counter()
+    _build_events(event_cls, actor_id)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    events = _build_events(event_cls, actor_id)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return elapsed / N_EVENTS * 1e9, (after - before) / N_EVENTS
+
+
+def build_state() -> tuple[GameState, str]:
+    state = GameState(event_log=EventLog(retention=1000))
+    state.dispatcher.register("token_moved", TokenMovedHandler())
+    token_id = str(uuid.uuid4())
+    state.add_token({"id": token_id, "x": 0, "y": 0})
+    return state, token_id
+
+
+def bench_dispatch() -> tuple[float, float]:
+    """Devuelve (eventos por segundo, bytes retenidos por evento una vez llena la retención)."""
+    state, token_id = build_state()
+    events = [
+        Event(type="token_moved", payload={"token_id": token_id, "x": i, "y": i})
+        for i in range(N_EVENTS)
+    ]
+    # Calentar hasta llenar la ventana de retención del log
+    for event in events[:2000]:
+        state.dispatch(event)
+
+    start = time.perf_counter()
+    for event in events[2000:]:
+        state.dispatch(event)
+    elapsed = time.perf_counter() - start
+
+    extra = [
+        Event(type="token_moved", payload={"token_id": token_id, "x": i, "y": i})
+        for i in range(10_000)
+    ]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for event in extra:
+        state.dispatch(event)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (N_EVENTS - 2000) / elapsed, (after - before) / len(extra)
+
+
+def main() -> None:
+    actor_id = uuid.uuid4()
+    legacy_ns, legacy_bytes = bench_construction(LegacyEvent, actor_id)
+    current_ns, current_bytes = bench_construction(Event, actor_id)
+    events_per_sec, retained_per_event = bench_dispatch()
+
+    print(f"Construcción de eventos ({N_EVENTS} eventos ac_requested)")
+    print(f"  dataclass anterior: {legacy_ns:8.0f} ns/evento  {legacy_bytes:8.0f} bytes/evento")
+    print(f"  Event con slots:    {current_ns:8.0f} ns/evento  {current_bytes:8.0f} bytes/evento")
+    print("Dispatch (token_moved + TokenMovedHandler, log con retención 1000)")
+    print(f"  {events_per_sec:,.0f} eventos/s")
+    print(f"  {retained_per_event:.1f} bytes retenidos por evento en régimen (memoria plana ≈ 0)")
+
+
+if __name__ == "__main__":
+    main()
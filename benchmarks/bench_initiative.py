@@ -0,0 +1,82 @@
+"""
+Orden de iniciativa en encuentros grandes: lista + index()/remove()/any()
+(implementación anterior) contra InitiativeTracker.
+
+Simula rondas completas en las que cada turno avanza al siguiente actor y,
+cada pocos turnos, muere un monstruo y se verifica si terminó el combate.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_initiative
+"""
+
+import time
+import uuid
+
+from src.core.combat.initiative_tracker import InitiativeTracker
+
+PLAYERS = 5
+ENCOUNTER_SIZES = (20, 100, 500)
+KILL_EVERY = 3
+
+
+def legacy_round_trip(players: list, monsters: list) -> int:
+    order = players + monsters
+    characters = set(players)
+    enemies = set(monsters)
+    current = order[0]
+    turns = 0
+    victims = iter(monsters)
+
+    while True:
+        turns += 1
+        if turns % KILL_EVERY == 0:
+            victim = next(victims)
+            if victim in order:
+                order.remove(victim)
+            players_alive = any(a in characters for a in order)
+            enemies_alive = any(a in enemies for a in order)
+            if not players_alive or not enemies_alive:
+                return turns
+        index = order.index(current) if current in order else 0
+        current = order[(index + 1) % len(order)]
+
+
+def tracker_round_trip(players: list, monsters: list) -> int:
+    characters = set(players)
+    tracker = InitiativeTracker.from_order(
+        players + monsters, lambda a: "players" if a in characters else "enemies"
+    )
+    current = tracker.first
+    turns = 0
+    victims = iter(monsters)
+
+    while True:
+        turns += 1
+        if turns % KILL_EVERY == 0:
+            tracker.remove(next(victims))
+            if tracker.is_combat_over():
+                return turns
+        current, _ = tracker.next_of(current)
+
+
+def measure(fn, players: list, monsters: list) -> tuple[float, int]:
+    start = time.perf_counter()
+    turns = fn(players, monsters)
+    return (time.perf_counter() - start) / turns, turns
+
+
+def main() -> None:
+    players = [uuid.uuid4() for _ in range(PLAYERS)]
+    print(f"Iniciativa · {PLAYERS} jugadores · muere un monstruo cada {KILL_EVERY} turnos")
+    for size in ENCOUNTER_SIZES:
+        monsters = [uuid.uuid4() for _ in range(size)]
+        legacy, turns = measure(legacy_round_trip, players, monsters)
+        current, _ = measure(tracker_round_trip, players, monsters)
+        print(
+            f"  {size:>4} monstruos ({turns} turnos): lista {legacy * 1e9:8.0f} ns/turno"
+            f" · tracker {current * 1e9:6.0f} ns/turno ({legacy / current:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+150 goblins en combate: 150 Enemy individuales contra un MinionGroup.
+
+Mide la memoria del estado (actores + tokens + iniciativa) con tracemalloc
+y el costo de una ronda completa de fin de turno (EndTurnAction por cada
+lugar de la iniciativa).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_minion_group
+"""
+
+import time
+import tracemalloc
+import uuid
+
+from src.core.character.character import Character
+from src.core.character.dndclass import CLASS_MAP
+from src.core.character.enemy import Enemy, EnemyAttack
+from src.core.character.race import RACE_MAP
+from src.core.game.Action import EndTurnAction, StartCombatAction
+from src.core.game.bootstrap import register_core_rules
+from src.core.game.commands import EndTurnCommand, StartCombatCommand
+from src.core.game.Event import Event, GameState
+from src.core.game.rng import DiceRNG
+
+MONSTERS = 150
+ROUNDS = 50
+
+GOBLIN = {
+    "name": "Goblin", "hp": 7, "max_hp": 7, "ac": 15, "asset_url": "none", "size": (1, 1),
+    "attacks": [{"name": "Scimitar", "dice_count": 1, "dice_size": 6, "damage_bonus": 2, "attack_bonus": 4}],
+}
+
+
+def base_state() -> tuple[GameState, uuid.UUID]:
+    state = GameState(rng=DiceRNG(1))
+    register_core_rules(state)
+    hero = Character(
+        id=uuid.uuid4(), owner_id=uuid.uuid4(), name="Heroe",
+        race=RACE_MAP["Human"], dnd_class=CLASS_MAP["Barbaro"](),
+    )
+    state.add_character(hero)
+    return state, hero.id
+
+
+def individual() -> tuple[GameState, list]:
+    state, hero_id = base_state()
+    ids = [hero_id]
+    for _ in range(MONSTERS):
+        enemy_id = str(uuid.uuid4())
+        state.dispatch(Event(type="create_enemy", payload={**GOBLIN, "id": enemy_id}, cancelable=False))
+        ids.append(uuid.UUID(enemy_id))
+    return state, ids
+
+
+def grouped() -> tuple[GameState, list]:
+    from src.core.character.minion_group import new_group_id
+
+    state, hero_id = base_state()
+    group_id = new_group_id()
+    state.dispatch(Event(
+        type="create_minion_group",
+        payload={**GOBLIN, "id": str(group_id), "count": MONSTERS},
+        cancelable=False
+    ))
+    return state, [hero_id, group_id]
+
+
+def measure(build) -> tuple[float, float]:
+    tracemalloc.start()
+    state, participants = build()
+    StartCombatAction(StartCombatCommand(participant_ids=participants)).execute(state)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    slots = len(state.initiative)
+    start = time.perf_counter()
+    for _ in range(ROUNDS * slots):
+        EndTurnAction(EndTurnCommand(state.current_actor)).execute(state)
+    return memory, (time.perf_counter() - start) / ROUNDS
+
+
+def main() -> None:
+    # Calentar imports y cachés de módulo antes de medir memoria
+    measure(grouped)
+    single_mem, single_round = measure(individual)
+    group_mem, group_round = measure(grouped)
+
+    print(f"{MONSTERS} goblins en combate")
+    print(f"  Enemy individuales: {single_mem / 1024:8.1f} KiB · {single_round * 1e3:7.3f} ms/ronda")
+    print(f"  MinionGroup:        {group_mem / 1024:8.1f} KiB · {group_round * 1e3:7.3f} ms/ronda"
+          f"  ({single_mem / group_mem:.1f}x memoria, {single_round / group_round:.1f}x por ronda)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Movimiento de tokens: un evento + un broadcast por mensaje vs el agregador
+por ticks (último destino por token, un lote cada 1/20 s).
+
+Simula CLIENTS clientes arrastrando tokens a MESSAGES_PER_SECOND mensajes
+por segundo cada uno durante SECONDS segundos y mide el CPU del servidor
+por segundo simulado, eventos despachados y broadcasts emitidos.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_movement_ticks
+"""
+
+import json
+import random
+import time
+
+from benchmarks.synthetic_campaign import MAP_SIZE, CampaignSpec, generate_campaign
+from src.core.game.Event import MoveTokenEvent
+from src.features.sync.application.delta_service import StateDeltaService
+from src.features.sync.application.movement_aggregator import DEFAULT_TICK_HZ, MovementAggregator
+
+CLIENTS = 8
+MESSAGES_PER_SECOND = 60
+SECONDS = 5
+
+
+def campaign():
+    state = generate_campaign(CampaignSpec(characters=20, enemies=200, history=0))
+    deltas = StateDeltaService()
+    deltas.attach(state)
+    return state, deltas
+
+
+def traffic(state) -> list[tuple[float, str, int, int]]:
+    """(instante, token, x, y): cada cliente arrastra su propio token"""
+    rnd = random.Random(1234)
+    tokens = rnd.sample(list(state.tokens), CLIENTS)
+    messages = []
+    for client, token_id in enumerate(tokens):
+        for i in range(MESSAGES_PER_SECOND * SECONDS):
+            at = (i + client / CLIENTS) / MESSAGES_PER_SECOND
+            messages.append((at, token_id, rnd.randrange(MAP_SIZE), rnd.randrange(MAP_SIZE)))
+    messages.sort()
+    return messages
+
+
+def per_message(state, deltas, messages) -> tuple[float, int, int]:
+    broadcasts = 0
+    events_before = state.last_event_id
+    start = time.perf_counter()
+    for _, token_id, x, y in messages:
+        state.dispatch(MoveTokenEvent(token_id=token_id, x=x, y=y))
+        batch = deltas.take()
+        if batch:
+            json.dumps(batch)
+            broadcasts += 1
+    return time.perf_counter() - start, state.last_event_id - events_before, broadcasts
+
+
+def ticked(state, deltas, messages) -> tuple[float, int, int]:
+    aggregator = MovementAggregator()
+    broadcasts = 0
+    events_before = state.last_event_id
+    next_tick = aggregator.tick_seconds
+    start = time.perf_counter()
+    for at, token_id, x, y in messages:
+        while at >= next_tick:
+            if aggregator.flush(state):
+                json.dumps(deltas.take())
+                broadcasts += 1
+            next_tick += aggregator.tick_seconds
+        aggregator.submit(token_id, x, y)
+    if aggregator.flush(state):
+        json.dumps(deltas.take())
+        broadcasts += 1
+    return time.perf_counter() - start, state.last_event_id - events_before, broadcasts
+
+
+def main() -> None:
+    print(f"{CLIENTS} clientes × {MESSAGES_PER_SECOND} mensajes/s × {SECONDS} s · ticks a {DEFAULT_TICK_HZ} Hz")
+    for name, run in (("un evento por mensaje", per_message), ("agregador por ticks", ticked)):
+        state, deltas = campaign()
+        messages = traffic(state)
+        elapsed, events, broadcasts = run(state, deltas, messages)
+        print(
+            f"  {name:<22} {elapsed / SECONDS * 1000:7.2f} ms CPU/s · "
+            f"{events / SECONDS:6.0f} eventos/s · {broadcasts / SECONDS:6.0f} broadcasts/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Arrastres por el canal efímero vs como move_token reales.
+
+Un DM arrastra tokens por el mapa durante SECONDS segundos mandando
+HOVER_PER_SECOND posiciones intermedias por segundo y soltando cada token
+cada DRAG_SECONDS. Se compara mandar cada posición como move_token (evento,
+handlers, event_log) contra mandarlas como preview y solo el drop como
+move_token. Se mide CPU por segundo simulado y cuánto crece el event_log.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_preview_relay
+"""
+
+import json
+import random
+import time
+
+from benchmarks.synthetic_campaign import MAP_SIZE, CampaignSpec, generate_campaign
+from src.core.game.Event import MoveTokenEvent
+from src.features.sync.application.delta_service import StateDeltaService
+from src.features.sync.application.preview_relay import PreviewRelay
+
+HOVER_PER_SECOND = 30
+DRAG_SECONDS = 2
+SECONDS = 20
+
+
+def campaign():
+    state = generate_campaign(CampaignSpec(characters=20, enemies=200, history=0))
+    deltas = StateDeltaService()
+    deltas.attach(state)
+    return state, deltas
+
+
+def drags(state) -> list[tuple[float, str, int, int, bool]]:
+    """(instante, token, x, y, es el drop)"""
+    rnd = random.Random(1234)
+    tokens = list(state.tokens)
+    steps = HOVER_PER_SECOND * DRAG_SECONDS
+    messages = []
+    for drag in range(SECONDS // DRAG_SECONDS):
+        token_id = rnd.choice(tokens)
+        for step in range(steps):
+            at = drag * DRAG_SECONDS + step / HOVER_PER_SECOND
+            messages.append((at, token_id, rnd.randrange(MAP_SIZE), rnd.randrange(MAP_SIZE), step == steps - 1))
+    return messages
+
+
+def as_moves(state, deltas, messages) -> float:
+    start = time.perf_counter()
+    for _, token_id, x, y, _ in messages:
+        state.dispatch(MoveTokenEvent(token_id=token_id, x=x, y=y))
+        json.dumps(deltas.take())
+    return time.perf_counter() - start
+
+
+def as_previews(state, deltas, messages) -> float:
+    clock = [0.0]
+    relay = PreviewRelay(clock=lambda: clock[0])
+    next_tick = relay.tick_seconds
+    start = time.perf_counter()
+    for at, token_id, x, y, drop in messages:
+        clock[0] = at
+        while at >= next_tick:
+            if relay.has_pending():
+                json.dumps({"items": relay.take()})
+            next_tick += relay.tick_seconds
+        if drop:
+            relay.submit("dm", "drag", {"token_id": token_id, "done": True})
+            state.dispatch(MoveTokenEvent(token_id=token_id, x=x, y=y))
+            json.dumps(deltas.take())
+        else:
+            relay.submit("dm", "drag", {"token_id": token_id, "x": x, "y": y})
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{HOVER_PER_SECOND} posiciones/s · un drop cada {DRAG_SECONDS} s · {SECONDS} s")
+    for name, run in (("todo como move_token", as_moves), ("previews + drop", as_previews)):
+        state, deltas = campaign()
+        log_before = len(state.event_log)
+        elapsed = run(state, deltas, drags(state))
+        print(
+            f"  {name:<21} {elapsed / SECONDS * 1000:7.3f} ms CPU/s · "
+            f"event_log +{len(state.event_log) - log_before} eventos"
+        )
+
+
+if __name__ == "__main__":
+    main()
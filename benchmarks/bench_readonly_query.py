@@ -0,0 +1,107 @@
+"""
+Latencia de GetArmorClass con un event_log grande.
+
+Compara la simulación de solo lectura actual (ShadowState copy-on-write)
+contra la implementación anterior basada en deepcopy del GameState completo
+(con un handler escuchando ac_requested para forzar la simulación), contra
+el ModifierStack sin simulación y contra la query servida desde la caché.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_readonly_query
+"""
+
+import time
+import uuid
+from copy import deepcopy
+
+from src.core.character.character import Character
+from src.core.character.dndclass import CLASS_MAP
+from src.core.character.race import RACE_MAP
+from src.core.game.Event import Event, EventContext, EventHandler, GameState
+from src.core.game.event_log import EventLog
+from src.core.game.query_cache import QueryCache
+from src.core.game.querys import GetArmorClass, GetArmorClassHandler
+
+LOG_SIZE = 10_000
+CHARACTERS = 8
+ITERATIONS = 200
+
+
+class DeepcopyGameState(GameState):
+    """run_readonly_event tal como estaba antes del overlay copy-on-write."""
+
+    def run_readonly_events(self, root_events: list[Event]) -> list[list[Event]]:
+        collected = []
+        for root_event in root_events:
+            shadow_state = deepcopy(self)
+            shadow_state.event_log = EventLog(retention=None)
+            self.dispatcher.dispatch(root_event, shadow_state)
+            collected.append(list(shadow_state.event_log))
+        return collected
+
+
+class AcRequestedProbe(EventHandler):
+    """Handler vacío: su sola presencia obliga a simular ac_requested"""
+    def handle(self, event, state) -> None:
+        pass
+
+
+def build_state(state_cls: type[GameState], listening: bool = True) -> tuple[GameState, uuid.UUID]:
+    state = state_cls(event_log=EventLog(retention=LOG_SIZE))
+    state.register_query_handler(GetArmorClass, GetArmorClassHandler())
+    if listening:
+        state.dispatcher.register("ac_requested", AcRequestedProbe())
+
+    for i in range(CHARACTERS):
+        state.add_character(Character(
+            id=uuid.uuid4(),
+            owner_id=uuid.uuid4(),
+            name=f"Heroe {i}",
+            race=RACE_MAP["Human"],
+            dnd_class=CLASS_MAP["Barbaro"](),
+        ))
+
+    actor_ids = list(state.characters)
+    for i in range(LOG_SIZE):
+        state.event_log.append(Event(
+            type="roll_result",
+            context=EventContext(actor_id=actor_ids[i % len(actor_ids)]),
+            payload={"value": i % 20 + 1, "reason": "benchmark"},
+        ))
+
+    return state, actor_ids[0]
+
+
+def measure(state: GameState, actor_id: uuid.UUID, iterations: int) -> float:
+    query = GetArmorClass(actor_id=actor_id, context="attack")
+    start = time.perf_counter()
+    for _ in range(iterations):
+        state.query(query)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    legacy_state, legacy_actor = build_state(DeepcopyGameState)
+    legacy_state.query_cache = QueryCache(enabled=False)
+    state, actor = build_state(GameState)
+    state.query_cache = QueryCache(enabled=False)
+    stack_state, stack_actor = build_state(GameState, listening=False)
+    stack_state.query_cache = QueryCache(enabled=False)
+    cached_state, cached_actor = build_state(GameState)
+
+    legacy = measure(legacy_state, legacy_actor, max(1, ITERATIONS // 20))
+    current = measure(state, actor, ITERATIONS)
+    stacked = measure(stack_state, stack_actor, ITERATIONS * 50)
+    cached = measure(cached_state, cached_actor, ITERATIONS * 50)
+
+    print(f"GetArmorClass · {CHARACTERS} personajes · event_log de {LOG_SIZE} eventos")
+    print(f"  antes (deepcopy):       {legacy * 1e6:10.1f} µs/query")
+    print(f"  ahora (copy-on-write):  {current * 1e6:10.1f} µs/query")
+    print(f"  modifier stack:         {stacked * 1e6:10.1f} µs/query  (sin oyentes de ac_requested)")
+    print(f"  ahora (caché):          {cached * 1e6:10.1f} µs/query  {cached_state.query_cache.stats()}")
+    print(f"  speedup copy-on-write:  {legacy / current:10.1f}x")
+    print(f"  speedup caché:          {legacy / cached:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
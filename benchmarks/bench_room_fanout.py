@@ -0,0 +1,79 @@
+"""
+Fan-out de broadcasts: emisión global vs RoomRouter por salas.
+
+Levanta CAMPAIGNS campañas con PLAYERS jugadores + un DM cada una
+(clientes de prueba de Flask-SocketIO en el mismo proceso) y emite
+UPDATES actualizaciones por campaña. Se cuentan los paquetes que recibe
+cada cliente: con la emisión global cada update llega a todo el nodo;
+con el router solo a la campaña (o al DM / a un usuario).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_room_fanout
+"""
+
+import time
+
+from flask import Flask, request
+from flask_socketio import SocketIO
+
+from src.interfaces.websocket.room_router import RoomRouter
+
+CAMPAIGNS = 20
+PLAYERS = 5
+UPDATES = 50
+
+
+def node():
+    app = Flask(__name__)
+    socketio = SocketIO(app, async_mode="threading")
+    router = RoomRouter(socketio)
+
+    @socketio.on("join")
+    def join(data):
+        router.join(request.sid, data["campaign"], data["user_id"], data["is_dm"])
+
+    clients = []
+    for c in range(CAMPAIGNS):
+        for p in range(PLAYERS + 1):
+            client = socketio.test_client(app)
+            client.emit("join", {"campaign": f"C{c}", "user_id": f"u{c}-{p}", "is_dm": p == 0})
+            client.get_received()
+            clients.append(client)
+    return socketio, router, clients
+
+
+def global_emit(socketio, router):
+    for c in range(CAMPAIGNS):
+        for _ in range(UPDATES):
+            socketio.emit("state_delta", {"campaign": f"C{c}"})
+
+
+def routed(socketio, router):
+    for c in range(CAMPAIGNS):
+        for i in range(UPDATES):
+            # Mezcla realista: casi todo a la campaña, algo solo al DM o a un jugador
+            if i % 10 == 0:
+                router.to_dm(f"C{c}", "enemy_autoplay", {})
+            elif i % 10 == 1:
+                router.to_user(f"C{c}", f"u{c}-1", "item_equipped_toggled", {})
+            else:
+                router.to_campaign(f"C{c}", "state_delta", {})
+
+
+def main() -> None:
+    total = CAMPAIGNS * (PLAYERS + 1)
+    print(f"{CAMPAIGNS} campañas × {PLAYERS + 1} clientes ({total}) · {UPDATES} updates por campaña")
+    for name, run in (("emit global", global_emit), ("RoomRouter", routed)):
+        socketio, router, clients = node()
+        start = time.perf_counter()
+        run(socketio, router)
+        elapsed = time.perf_counter() - start
+        delivered = sum(len(client.get_received()) for client in clients)
+        print(
+            f"  {name:<12} {delivered:7d} paquetes entregados · "
+            f"{delivered / total:6.1f} por cliente · {elapsed * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Prueba de escala del motor: campañas sintéticas cada vez más grandes
+(benchmarks/synthetic_campaign.py) con una mezcla fija de comandos.
+
+Por cada punto de escala:
+- genera la campaña (personajes, enemigos con tokens, historial largo)
+- inicia un combate con todos los actores
+- empuja OPS comandos mezclados: mover tokens, atacar, terminar turno y queries
+- reporta throughput, percentiles de latencia y memoria
+
+Cada punto corre en su propio proceso para que el pico de RSS sea solo suyo.
+El tamaño del estado se mide con tracemalloc al generar (no durante los
+comandos: tracemalloc ralentiza todo lo que se mide después).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_scale
+    python -m benchmarks.bench_scale --ops 20000 --scale 400:4000:500000
+    python -m benchmarks.bench_scale --retention 5000    # log acotado como en el servidor
+"""
+
+import argparse
+import multiprocessing
+import random
+import resource
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from benchmarks.synthetic_campaign import MAP_SIZE, CampaignSpec, generate_campaign
+from src.core.combat.phase import Phase
+from src.core.game.Action import AttackAction, EndTurnAction, StartCombatAction
+from src.core.game.commands import AttackCommand, EndTurnCommand, StartCombatCommand
+from src.core.game.Event import Event, GameState
+from src.core.game.querys import GetArmorClass, GetStatModifier
+
+# (personajes, enemigos, eventos de historial)
+DEFAULT_SCALES = (
+    (20, 200, 10_000),
+    (100, 1_000, 50_000),
+    (200, 2_000, 200_000),
+)
+DEFAULT_OPS = 5_000
+
+# Mezcla de comandos (tipo, peso)
+COMMAND_MIX = (
+    ("move", 0.50),
+    ("attack", 0.20),
+    ("end_turn", 0.10),
+    ("query", 0.20),
+)
+ATTRIBUTES = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+
+
+@dataclass
+class ScaleResult:
+    characters: int
+    enemies: int
+    history: int
+    log_events: int = 0
+    generate_s: float = 0.0
+    state_mb: float = 0.0
+    peak_rss_mb: float = 0.0
+    ops: int = 0
+    elapsed_s: float = 0.0
+    latencies_us: dict[str, list[float]] = field(default_factory=dict)
+
+
+class CommandDriver:
+    """Empuja la mezcla de comandos contra un GameState en combate"""
+
+    def __init__(self, state: GameState, seed: int):
+        self.state = state
+        self.rnd = random.Random(seed)
+        self.token_ids = list(state.tokens)
+        self.character_ids = list(state.characters)
+        self.enemy_ids = list(state.enemies)
+        self.participants = self.character_ids + self.enemy_ids
+        self.start_combat()
+
+    def start_combat(self) -> None:
+        state = self.state
+        state.current_phase = Phase.EXPLORATION
+        state.initiative.clear()
+        # HP alto: el combate no debe terminar en medio de la medición
+        for actor_id in self.participants:
+            actor = state.get_actor(actor_id)
+            actor.hp = actor.max_hp = 10**9
+        StartCombatAction(StartCombatCommand(participant_ids=self.participants)).execute(state)
+
+    def run(self, kind: str) -> str:
+        """Ejecuta un comando del tipo pedido; devuelve el tipo que realmente corrió"""
+        state = self.state
+        if state.current_phase != Phase.COMBAT:
+            self.start_combat()
+
+        if kind == "move":
+            state.dispatch(Event(
+                type="token_moved",
+                payload={
+                    "token_id": self.rnd.choice(self.token_ids),
+                    "x": self.rnd.randrange(MAP_SIZE),
+                    "y": self.rnd.randrange(MAP_SIZE),
+                },
+            ))
+            return kind
+
+        if kind == "attack":
+            actor_id = state.current_actor
+            # Sin acción disponible el jugador termina el turno en vez de atacar
+            if not state.resources.get(actor_id, {}).get("action"):
+                return self.run("end_turn")
+            targets = self.enemy_ids if actor_id in state.characters else self.character_ids
+            AttackAction(AttackCommand(
+                actor_id=actor_id,
+                target_id=self.rnd.choice(targets),
+                mode="melee",
+                advantage=False,
+                disadvantage=False,
+                attack_name=None,     # los enemigos eligen por daño esperado
+            )).execute(state)
+            return kind
+
+        if kind == "end_turn":
+            EndTurnAction(EndTurnCommand(actor_id=state.current_actor)).execute(state)
+            return kind
+
+        if self.rnd.random() < 0.5:
+            state.query(GetArmorClass(actor_id=self.rnd.choice(self.participants), context="attack"))
+        else:
+            state.query(GetStatModifier(
+                actor_id=self.rnd.choice(self.character_ids),
+                attribute=self.rnd.choice(ATTRIBUTES),
+            ))
+        return kind
+
+
+def run_scale(characters: int, enemies: int, history: int, ops: int, retention: Optional[int], seed: int) -> ScaleResult:
+    result = ScaleResult(characters=characters, enemies=enemies, history=history, ops=ops)
+    spec = CampaignSpec(characters=characters, enemies=enemies, history=history, log_retention=retention, seed=seed)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    state = generate_campaign(spec)
+    result.generate_s = time.perf_counter() - start
+    result.state_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+
+    driver = CommandDriver(state, seed)
+    rnd = random.Random(seed)
+    kinds, weights = zip(*COMMAND_MIX)
+    latencies: dict[str, list[float]] = {kind: [] for kind in kinds}
+
+    start = time.perf_counter()
+    for kind in rnd.choices(kinds, weights, k=ops):
+        t0 = time.perf_counter_ns()
+        ran = driver.run(kind)
+        latencies[ran].append((time.perf_counter_ns() - t0) / 1000)
+    result.elapsed_s = time.perf_counter() - start
+
+    result.latencies_us = latencies
+    result.log_events = len(state.event_log)
+    # ru_maxrss viene en KiB en Linux
+    result.peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def report(results: list[ScaleResult]) -> None:
+    print(
+        f"{'actores':>8} {'historial':>10} {'log final':>10} {'generar':>8} {'estado':>9} "
+        f"{'pico RSS':>9} {'ops/s':>9} {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for r in results:
+        every = [v for values in r.latencies_us.values() for v in values]
+        print(
+            f"{r.characters + r.enemies:>8} {r.history:>10} {r.log_events:>10} {r.generate_s:>7.2f}s "
+            f"{r.state_mb:>7.1f}MB {r.peak_rss_mb:>7.1f}MB {r.ops / r.elapsed_s:>9.0f} "
+            f"{percentile(every, 50):>6.1f}µs {percentile(every, 95):>6.1f}µs {percentile(every, 99):>6.1f}µs"
+        )
+
+    print()
+    print("p50 / p99 por comando (µs)")
+    kinds = [kind for kind, _ in COMMAND_MIX]
+    print(f"{'actores':>8} " + " ".join(f"{kind:>17}" for kind in kinds))
+    for r in results:
+        cells = []
+        for kind in kinds:
+            values = r.latencies_us.get(kind, [])
+            cells.append(f"{percentile(values, 50):>8.1f}/{percentile(values, 99):<8.1f}")
+        print(f"{r.characters + r.enemies:>8} " + " ".join(cells))
+
+
+def parse_scale(text: str) -> tuple[int, int, int]:
+    try:
+        characters, enemies, history = (int(part) for part in text.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("formato: personajes:enemigos:historial")
+    return characters, enemies, history
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=parse_scale, action="append",
+                        help="punto de escala personajes:enemigos:historial (se puede repetir)")
+    parser.add_argument("--ops", type=int, default=DEFAULT_OPS, help="comandos por punto de escala")
+    parser.add_argument("--retention", type=int, default=None,
+                        help="eventos que guarda el log (por defecto, todos)")
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    results = []
+    for characters, enemies, history in args.scale or DEFAULT_SCALES:
+        # Un proceso nuevo por punto: el pico de RSS no arrastra el punto anterior
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results.append(pool.submit(
+                run_scale, characters, enemies, history, args.ops, args.retention, args.seed
+            ).result())
+        print(f"  listo: {characters} personajes, {enemies} enemigos, {history} eventos", flush=True)
+    print()
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Deltas de estado vs snapshots completos: bytes y CPU de serialización por
+acción en una campaña grande (benchmarks/synthetic_campaign.py).
+
+Antes, después de cada acción los clientes pedían tokens_sync y
+entities_result enteros; ahora viaja un state_delta con lo que cambió.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_state_delta
+"""
+
+import json
+import random
+import time
+
+from benchmarks.synthetic_campaign import MAP_SIZE, CampaignSpec, generate_campaign
+from src.core.game.Action import AttackAction, EndTurnAction, StartCombatAction
+from src.core.game.commands import AttackCommand, EndTurnCommand, StartCombatCommand
+from src.core.game.Event import MoveTokenEvent
+from src.core.game.querys import GetArmorClassBatch
+from src.features.sync.application.delta_service import StateDeltaService
+from src.shared.utils.tokens_utils import serialize_token
+
+CHARACTERS = 50
+ENEMIES = 1000
+ACTIONS = 300
+
+
+def full_snapshot(state) -> str:
+    """Lo que mandaban get_tokens + get_entities (sin modificadores)"""
+    actors = [*state.characters.values(), *state.enemies.values()]
+    armor = state.query(GetArmorClassBatch(actor_ids=tuple(a.id for a in actors), context="ui")).values
+    return json.dumps({
+        "tokens": [serialize_token(t) for t in state.tokens.values()],
+        "entities": [
+            {"id": str(a.id), "name": a.name, "hp": a.hp, "max_hp": a.max_hp, "ac": armor[a.id].value}
+            for a in actors
+        ],
+    })
+
+
+def main() -> None:
+    state = generate_campaign(CampaignSpec(characters=CHARACTERS, enemies=ENEMIES, history=0))
+    deltas = StateDeltaService()
+    deltas.attach(state)
+
+    participants = [*state.characters, *state.enemies]
+    StartCombatAction(StartCombatCommand(participant_ids=participants)).execute(state)
+    deltas.take()
+
+    rnd = random.Random(1234)
+    token_ids = list(state.tokens)
+    snapshot_bytes = delta_bytes = 0
+    snapshot_s = delta_s = 0.0
+
+    for _ in range(ACTIONS):
+        actor_id = state.current_actor
+        state.dispatch(MoveTokenEvent(token_id=rnd.choice(token_ids), x=rnd.randrange(MAP_SIZE), y=rnd.randrange(MAP_SIZE)))
+        targets = list(state.enemies) if actor_id in state.characters else list(state.characters)
+        AttackAction(AttackCommand(
+            actor_id=actor_id, target_id=rnd.choice(targets), mode="melee",
+            advantage=False, disadvantage=False, attack_name=None
+        )).execute(state)
+        EndTurnAction(EndTurnCommand(actor_id=actor_id)).execute(state)
+
+        start = time.perf_counter()
+        batch = deltas.take()
+        payload = json.dumps(batch) if batch else ""
+        delta_s += time.perf_counter() - start
+        delta_bytes += len(payload)
+
+        start = time.perf_counter()
+        snapshot_bytes += len(full_snapshot(state))
+        snapshot_s += time.perf_counter() - start
+
+    print(f"{CHARACTERS} personajes + {ENEMIES} enemigos · {ACTIONS} acciones (mover + atacar + fin de turno)")
+    print(f"  snapshot completo: {snapshot_bytes / ACTIONS / 1024:9.1f} KiB/acción · {snapshot_s / ACTIONS * 1000:7.3f} ms/acción")
+    print(f"  state_delta:       {delta_bytes / ACTIONS / 1024:9.3f} KiB/acción · {delta_s / ACTIONS * 1000:7.3f} ms/acción")
+
+
+if __name__ == "__main__":
+    main()
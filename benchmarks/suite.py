@@ -0,0 +1,477 @@
+"""
+Suite de micro-benchmarks del motor de juego (src/core) con baselines.
+
+Cada caso mide ns por operación (la más rápida de varias repeticiones) y
+se compara contra una referencia:
+
+- `--against REF`: el src/ de un commit o rama medido en esta misma corrida
+  (misma máquina, mismo momento). Es la comparación que vale para --check
+- si no, benchmarks/baselines.json. Junto a cada caso se mide una carga fija
+  de Python puro (calibración) que compensa la carga de la máquina, pero no
+  la diferencia entre procesadores: --check solo falla contra baselines
+  grabadas en esta misma máquina
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.suite                      # corre y compara con las baselines
+    python -m benchmarks.suite --check --against master  # código de salida 1 si algún caso empeoró
+    python -m benchmarks.suite --update             # guarda los resultados como baselines
+    python -m benchmarks.suite -k query             # solo los casos que contienen "query"
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from src.core.character.character import Character
+    from src.core.character.enemy import Enemy
+    from src.core.game.Event import GameState
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BASELINES_VERSION = 1
+DEFAULT_TOLERANCE = 0.25      # 25% más lento que la baseline = regresión
+REPEATS = 15
+MIN_REPEAT_SECONDS = 0.02
+SEED = 1234
+
+COMBAT_PARTICIPANTS = 50
+END_TURN_ACTORS = 20
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], object]]   # arma el estado y devuelve la operación a medir
+    tolerance: float = DEFAULT_TOLERANCE
+
+
+CASES: list[Case] = []
+
+
+def case(name: str, tolerance: float = DEFAULT_TOLERANCE):
+    def register(setup: Callable[[], Callable[[], object]]):
+        CASES.append(Case(name, setup, tolerance))
+        return setup
+    return register
+
+
+# =========================
+# ESCENARIOS
+# =========================
+
+# Los imports de src/ van dentro de cada escenario: contra un --against viejo,
+# una API que todavía no existía rompe solo los casos que la usan
+
+def new_state(retention: int = 256) -> "GameState":
+    from src.core.game.bootstrap import register_core_rules
+    from src.core.game.event_log import EventLog
+    from src.core.game.Event import GameState
+    from src.core.game.rng import DiceRNG
+
+    state = GameState(current_turn=1, event_log=EventLog(retention=retention), rng=DiceRNG(SEED))
+    return register_core_rules(state)
+
+
+def new_hero(name: str = "Subaru") -> "Character":
+    from src.core.character.character import Character
+    from src.core.character.dndclass import CLASS_MAP
+    from src.core.character.race import RACE_MAP
+    from src.core.items.item import ItemInstance
+    from src.core.items.items import ITEMS, LONG_SWORD
+
+    hero = Character(
+        id=uuid.uuid4(),
+        owner_id=uuid.uuid4(),
+        name=name,
+        race=RACE_MAP["Human"],
+        dnd_class=CLASS_MAP["Barbaro"](),
+    )
+    sword = ItemInstance(item=ITEMS[LONG_SWORD])
+    hero.add_item(sword)
+    hero.equip(sword)
+    return hero
+
+
+def new_goblin(hp: int = 7) -> "Enemy":
+    from src.core.character.enemy import Enemy, EnemyAttack
+
+    return Enemy(
+        id=uuid.uuid4(), owner_id=None, name="Goblin", hp=hp, max_hp=hp, ac=15, asset_url="none",
+        attacks=[EnemyAttack(name="Scimitar", dice_count=1, dice_size=6, damage_bonus=2, attack_bonus=4)],
+    )
+
+
+def character_row(hero: "Character") -> dict:
+    """Fila como la guarda CharacterRepository (lo que lee Character.from_dict)"""
+    attrs = hero.attributes
+    return {
+        "id": str(hero.id),
+        "owner_id": str(hero.owner_id),
+        "name": hero.name,
+        "level": hero.level,
+        "strength": attrs["STR"],
+        "dexterity": attrs["DEX"],
+        "constitution": attrs["CON"],
+        "intelligence": attrs["INT"],
+        "wisdom": attrs["WIS"],
+        "charisma": attrs["CHA"],
+        "max_hp": hero.max_hp,
+        "hp": hero.hp,
+        "texture": None,
+        "saving_throw_proficiencies": list(hero.saving_throw_proficiencies),
+        "weapon_proficiencies": list(hero.weapon_proficiencies),
+        "armor_proficiencies": list(hero.armor_proficiencies),
+        "skill_proficiencies": list(hero.skill_proficiencies),
+        "inventory": [
+            {"item_id": i.item.item_id, "quantity": i.quantity, "equipped": i.equipped}
+            for i in hero.inventory
+        ],
+    }
+
+
+@case("dispatch.token_moved")
+def bench_dispatch():
+    from src.core.game.event_log import EventLog
+    from src.core.game.Event import Event, GameState
+    from src.core.game.EventHandlers import TokenMovedHandler
+
+    state = GameState(event_log=EventLog(retention=1000))
+    state.dispatcher.register("token_moved", TokenMovedHandler())
+    token_id = str(uuid.uuid4())
+    state.add_token({"id": token_id, "x": 0, "y": 0})
+
+    def op():
+        state.dispatch(Event(type="token_moved", payload={"token_id": token_id, "x": 1, "y": 2}))
+    return op
+
+
+@case("query.armor_class.cold")
+def bench_ac_cold():
+    from src.core.game.querys import GetArmorClass
+
+    state = new_state()
+    hero = new_hero()
+    state.add_character(hero)
+    query = GetArmorClass(actor_id=hero.id, context="attack")
+
+    def op():
+        state.query_cache.clear()
+        return state.query(query)
+    return op
+
+
+@case("query.armor_class.cached")
+def bench_ac_cached():
+    from src.core.game.querys import GetArmorClass
+
+    state = new_state()
+    hero = new_hero()
+    state.add_character(hero)
+    query = GetArmorClass(actor_id=hero.id, context="attack")
+    state.query(query)
+    return lambda: state.query(query)
+
+
+@case("query.stat_modifier.cold")
+def bench_stat_cold():
+    from src.core.game.querys import GetStatModifier
+
+    state = new_state()
+    hero = new_hero()
+    state.add_character(hero)
+    query = GetStatModifier(actor_id=hero.id, attribute="STR")
+
+    def op():
+        state.query_cache.clear()
+        return state.query(query)
+    return op
+
+
+@case("action.attack", tolerance=0.30)
+def bench_attack():
+    from src.core.game.Action import AttackAction, StartCombatAction
+    from src.core.game.commands import AttackCommand, StartCombatCommand
+
+    state = new_state()
+    hero = new_hero()
+    goblin = new_goblin(hp=10**9)
+    state.add_character(hero)
+    state.add_enemy(goblin)
+    StartCombatAction(StartCombatCommand(participant_ids=[hero.id, goblin.id])).execute(state)
+    command = AttackCommand(actor_id=hero.id, target_id=goblin.id, mode="melee", advantage=False, disadvantage=False)
+
+    def op():
+        # Siempre el turno del héroe con su acción disponible
+        state.current_actor = hero.id
+        state.resources[hero.id]["action"] = 1
+        return AttackAction(command).execute(state)
+    return op
+
+
+@case(f"action.start_combat.{COMBAT_PARTICIPANTS}", tolerance=0.30)
+def bench_start_combat():
+    from src.core.combat.phase import Phase
+    from src.core.game.Action import StartCombatAction
+    from src.core.game.commands import StartCombatCommand
+
+    state = new_state()
+    participants = []
+    for i in range(5):
+        hero = new_hero(f"Heroe {i}")
+        state.add_character(hero)
+        participants.append(hero.id)
+    for _ in range(COMBAT_PARTICIPANTS - 5):
+        goblin = new_goblin()
+        state.add_enemy(goblin)
+        participants.append(goblin.id)
+    command = StartCombatCommand(participant_ids=participants)
+
+    def op():
+        state.current_phase = Phase.EXPLORATION
+        state.initiative.clear()
+        return StartCombatAction(command).execute(state)
+    return op
+
+
+@case("character.to_json")
+def bench_to_json():
+    hero = new_hero()
+    return hero.to_json
+
+
+@case("character.from_dict")
+def bench_from_dict():
+    from src.core.character.character import Character
+    from src.core.character.dndclass import CLASS_MAP
+    from src.core.character.race import RACE_MAP
+
+    hero = new_hero()
+    row = character_row(hero)
+    race, dnd_class = RACE_MAP["Human"], CLASS_MAP["Barbaro"]
+    return lambda: Character.from_dict(row, race=race, dnd_class=dnd_class())
+
+
+@case(f"state.end_turn.{END_TURN_ACTORS}")
+def bench_end_turn():
+    state = new_state()
+    heroes = []
+    for i in range(END_TURN_ACTORS):
+        hero = new_hero(f"Heroe {i}")
+        state.add_character(hero)
+        heroes.append(hero)
+        for status in ("bendecido", "resistencia"):
+            hero.status[status] = {"expires_at": state.effects.schedule_expiry(hero.id, status, 10**9)}
+    turn = [0]
+
+    def op():
+        # Un estado corto nuevo por turno: siempre hay algo que vence
+        hero = heroes[turn[0] % END_TURN_ACTORS]
+        turn[0] += 1
+        hero.status["aturdido"] = {"expires_at": state.effects.schedule_expiry(hero.id, "aturdido", 1)}
+        return state.end_turn()
+    return op
+
+
+# =========================
+# MEDICIÓN
+# =========================
+
+def _calibration_op() -> Callable[[], object]:
+    """Carga fija de Python puro (dicts, tuplas, orden) para normalizar entre máquinas"""
+    data = [(i * 7919) % 100 for i in range(100)]
+
+    def op():
+        counts = {}
+        for value in data:
+            counts[value] = counts.get(value, 0) + 1
+        return sorted(counts.items(), key=lambda item: (item[1], item[0]))[:10]
+    return op
+
+
+def _loops_for(op: Callable[[], object]) -> int:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            op()
+        if time.perf_counter() - start >= MIN_REPEAT_SECONDS:
+            return loops
+        loops *= 2
+
+
+def _run(op: Callable[[], object], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        op()
+    return (time.perf_counter() - start) / loops * 1e9
+
+
+def measure(op: Callable[[], object]) -> tuple[float, float]:
+    """
+    (ns por operación, ns de la calibración) tomando la repetición más
+    rápida de cada uno: el ruido de la máquina solo puede sumar tiempo.
+    Caso y calibración se alternan, así ambos ven la misma carga de la máquina.
+    """
+    calibration = _calibration_op()
+    loops, calibration_loops = _loops_for(op), _loops_for(calibration)
+
+    samples, calibration_samples = [], []
+    for _ in range(REPEATS):
+        samples.append(_run(op, loops))
+        calibration_samples.append(_run(calibration, calibration_loops))
+    return min(samples), min(calibration_samples)
+
+
+def machine_id() -> str:
+    """Máquina + intérprete: las baselines absolutas solo se comparan en la misma"""
+    return f"{platform.node()}/{platform.machine()}/{platform.processor() or '?'}/{platform.python_version()}"
+
+
+def _read_baselines(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    baselines = json.loads(path.read_text(encoding="utf-8"))
+    if baselines.get("version") != BASELINES_VERSION:
+        raise RuntimeError(f"Versión de baselines incompatible en {path}")
+    return baselines
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> dict:
+    return _read_baselines(path).get("cases", {})
+
+
+def recorded_machine(path: Path = BASELINES_PATH) -> Optional[str]:
+    return _read_baselines(path).get("machine")
+
+
+def save_baselines(results: dict[str, tuple[float, float]], path: Path = BASELINES_PATH) -> None:
+    # Los casos que no se corrieron conservan su baseline
+    cases = load_baselines(path)
+    cases.update({
+        name: {"ns": round(ns, 1), "calibration_ns": round(calibration, 1)}
+        for name, (ns, calibration) in results.items()
+    })
+    path.write_text(json.dumps({
+        "version": BASELINES_VERSION,
+        "python": platform.python_version(),
+        "machine": machine_id(),
+        "cases": dict(sorted(cases.items())),
+    }, indent=2) + "\n", encoding="utf-8")
+
+
+def measure_reference(ref: str, pattern: str) -> dict:
+    """
+    Corre esta misma suite contra el src/ de `ref` (commit, rama o tag) en un
+    proceso aparte y devuelve sus resultados con el formato de las baselines.
+    Los casos que `ref` no puede correr (API que todavía no existía) no vuelven.
+    """
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", ref, "src"], cwd=REPO_ROOT, capture_output=True
+    )
+    if archive.returncode != 0:
+        raise RuntimeError(f"No se pudo leer '{ref}': {archive.stderr.decode().strip()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with tarfile.open(fileobj=io.BytesIO(archive.stdout)) as tar:
+            tar.extractall(tmp, filter="data")
+        output = Path(tmp) / "results.json"
+        # Por ruta y con PYTHONPATH al árbol extraído: `src` se importa desde ref
+        run = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "-k", pattern, "--output", str(output)],
+            cwd=tmp,
+            env={**os.environ, "PYTHONPATH": tmp},
+        )
+        if run.returncode != 0 or not output.exists():
+            raise RuntimeError(f"La suite no pudo correr contra '{ref}'")
+        return load_baselines(output)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks del motor de juego")
+    parser.add_argument("--check", action="store_true", help="fallar si algún caso supera su tolerancia")
+    parser.add_argument("--against", metavar="REF", help="comparar contra REF de git medido en esta corrida")
+    parser.add_argument("--update", action="store_true", help="guardar los resultados como baselines")
+    parser.add_argument("--output", metavar="FILE", help="guardar los resultados en FILE (formato de baselines)")
+    parser.add_argument("-k", dest="pattern", default="", help="solo los casos cuyo nombre contiene el texto")
+    args = parser.parse_args(argv)
+
+    selected = [c for c in CASES if args.pattern in c.name]
+    if not selected:
+        print(f"Ningún caso coincide con '{args.pattern}'")
+        return 1
+
+    # Con baselines de otra máquina la comparación es orientativa: --check no falla
+    enforce = True
+    if args.against:
+        print(f"Referencia: {args.against}")
+        try:
+            baselines = measure_reference(args.against, args.pattern)
+        except RuntimeError as e:
+            print(e)
+            return 1
+        reference = args.against
+    else:
+        baselines = load_baselines()
+        reference = "baseline"
+        recorded = recorded_machine()
+        if baselines and recorded != machine_id():
+            enforce = False
+            print(f"Baselines grabadas en otra máquina ({recorded or 'desconocida'}): "
+                  f"solo orientativas, para --check usar --against <ref>")
+
+    print(f"Motor de juego · {len(selected)} casos · Python {platform.python_version()}")
+
+    results = {}
+    regressions = []
+    broken = []
+    for bench in selected:
+        try:
+            ns, calibration = results[bench.name] = measure(bench.setup())
+        except Exception as e:
+            broken.append(bench.name)
+            print(f"  {bench.name:<28} no corre: {e!r}")
+            continue
+
+        baseline = baselines.get(bench.name)
+        if baseline is None:
+            print(f"  {bench.name:<28} {ns:12,.0f} ns/op    (sin dato en {reference})")
+            continue
+
+        # Baseline llevada a la velocidad actual de la máquina
+        expected = baseline["ns"] * calibration / baseline["calibration_ns"]
+        ratio = ns / expected
+        status = "ok"
+        if ratio > 1 + bench.tolerance:
+            status = f"REGRESIÓN (> {bench.tolerance:.0%})"
+            regressions.append(bench.name)
+        elif ratio < 1 - bench.tolerance:
+            status = "mejora"
+        print(f"  {bench.name:<28} {ns:12,.0f} ns/op  {ratio:6.2f}x {reference}  {status}")
+
+    if args.update:
+        save_baselines(results)
+        print(f"Baselines guardadas en {BASELINES_PATH}")
+    if args.output:
+        save_baselines(results, Path(args.output))
+
+    if regressions:
+        print(f"{len(regressions)} caso(s) más lentos que {reference}: {', '.join(regressions)}")
+    if args.check and (broken or (enforce and regressions)):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
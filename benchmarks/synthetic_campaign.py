@@ -0,0 +1,208 @@
+"""
+Generador de campañas sintéticas grandes para pruebas de escala.
+
+Arma un GameState con las reglas reales (register_core_rules):
+- personajes reconstruidos con Character.from_dict, como los carga la DB,
+  con raza/clase de RACE_MAP/CLASS_MAP, nivel, atributos e inventario de ITEMS
+- enemigos creados con el evento create_enemy (el mismo camino que el DM),
+  así cada uno tiene su token
+- un historial largo de eventos ya registrado en el event_log
+
+Los actores quedan todos en position (0, 0) como en el motor real (los
+tokens y la posición del actor van por separado), así cualquier par está
+a rango de ataque; los tokens sí se reparten por el mapa.
+
+Todo sale de una semilla: la misma configuración genera la misma campaña.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.character.character import Character
+from src.core.character.dndclass import CLASS_MAP
+from src.core.character.race import RACE_MAP
+from src.core.game.bootstrap import register_core_rules
+from src.core.game.Event import Event, EventContext, GameState
+from src.core.game.event_log import EventLog
+from src.core.game.rng import DiceRNG
+from src.core.items.item import Armor, Shield, Weapon
+from src.core.items.items import HEAL_POTION, ITEMS
+from src.features.world.domain.token import Token
+
+MAP_SIZE = 200
+ATTRIBUTE_KEYS = (
+    ("STR", "strength"),
+    ("DEX", "dexterity"),
+    ("CON", "constitution"),
+    ("INT", "intelligence"),
+    ("WIS", "wisdom"),
+    ("CHA", "charisma"),
+)
+
+ENEMY_TEMPLATES = (
+    {"name": "Goblin", "hp": 7, "ac": 15, "attacks": [
+        {"name": "Scimitar", "dice_count": 1, "dice_size": 6, "damage_bonus": 2, "attack_bonus": 4},
+        {"name": "Shortbow", "dice_count": 1, "dice_size": 6, "damage_bonus": 2, "attack_bonus": 4,
+         "damage_type": "piercing"},
+    ]},
+    {"name": "Orc", "hp": 15, "ac": 13, "attacks": [
+        {"name": "Greataxe", "dice_count": 1, "dice_size": 12, "damage_bonus": 3, "attack_bonus": 5},
+    ]},
+    {"name": "Skeleton", "hp": 13, "ac": 13, "attacks": [
+        {"name": "Shortsword", "dice_count": 1, "dice_size": 6, "damage_bonus": 2, "attack_bonus": 4,
+         "damage_type": "piercing"},
+    ]},
+    {"name": "Ogre", "hp": 59, "ac": 11, "attacks": [
+        {"name": "Greatclub", "dice_count": 2, "dice_size": 8, "damage_bonus": 4, "attack_bonus": 6,
+         "damage_type": "bludgeoning"},
+    ]},
+)
+
+# Mezcla de eventos del historial (tipo, peso)
+HISTORY_MIX = (
+    ("token_moved", 0.55),
+    ("roll_result", 0.25),
+    ("attack_hit", 0.10),
+    ("chat_message", 0.10),
+)
+
+
+@dataclass(frozen=True)
+class CampaignSpec:
+    characters: int = 200
+    enemies: int = 2000
+    history: int = 100_000
+    log_retention: Optional[int] = None      # None = historial completo
+    seed: int = 1234
+
+
+def generate_campaign(spec: CampaignSpec) -> GameState:
+    rnd = random.Random(spec.seed)
+    state = register_core_rules(GameState(
+        current_turn=1,
+        event_log=EventLog(retention=spec.log_retention),
+        rng=DiceRNG(spec.seed),
+    ))
+
+    for _ in range(spec.characters):
+        character = Character.from_dict(*_character_row(rnd))
+        state.add_character(character)
+        token = Token(
+            id=character.id,
+            actor_id=character.id,
+            x=rnd.randrange(MAP_SIZE),
+            y=rnd.randrange(MAP_SIZE),
+            owner_user_id=character.owner_id,
+            label=character.name,
+        ).to_dict()
+        token["character_id"] = token["actor_id"]
+        state.add_token(token)
+
+    for i in range(spec.enemies):
+        event = _create_enemy_event(rnd, i)
+        state.dispatch(event)
+        # CreateEnemyHandler deja el token en (0, 0): el DM lo arrastra después
+        state.move_token(event.payload["id"], rnd.randrange(MAP_SIZE), rnd.randrange(MAP_SIZE))
+
+    _fill_history(state, rnd, spec.history)
+    return state
+
+
+# =========================
+# PERSONAJES
+# =========================
+
+def _character_row(rnd: random.Random) -> tuple[dict, object, object]:
+    """(fila como la de la DB, raza, clase) para Character.from_dict"""
+    race = RACE_MAP[rnd.choice(sorted(RACE_MAP))]
+    dnd_class = CLASS_MAP[rnd.choice(sorted(CLASS_MAP))]()
+    level = rnd.randint(1, 12)
+    con = rnd.randint(8, 18)
+    hit_points = dnd_class.hit_die + (level - 1) * (dnd_class.hit_die // 2 + 1) + level * ((con - 10) // 2)
+
+    row = {
+        "id": str(uuid.UUID(int=rnd.getrandbits(128))),
+        "owner_id": str(uuid.UUID(int=rnd.getrandbits(128))),
+        "name": f"Aventurero {rnd.randrange(10**6)}",
+        "level": level,
+        "max_hp": max(1, hit_points),
+        "hp": max(1, hit_points),
+        "saving_throw_proficiencies": list(getattr(dnd_class, "saving_throw_proficiencies", ())),
+        "weapon_proficiencies": list(getattr(dnd_class, "weapon_proficiencies", ())),
+        "armor_proficiencies": list(getattr(dnd_class, "armor_proficiencies", ())),
+        "skill_proficiencies": [],
+        "inventory": _inventory(rnd),
+    }
+    for short, column in ATTRIBUTE_KEYS:
+        row[column] = con if short == "CON" else rnd.randint(8, 18)
+    return row, race, dnd_class
+
+
+def _inventory(rnd: random.Random) -> list[dict]:
+    """Un arma equipada, armadura/escudo la mayoría de las veces y algunas pociones"""
+    weapons = sorted(k for k, item in ITEMS.items() if isinstance(item, Weapon))
+    armors = sorted(k for k, item in ITEMS.items() if isinstance(item, Armor))
+    shields = sorted(k for k, item in ITEMS.items() if isinstance(item, Shield))
+
+    inventory = [{"item_id": rnd.choice(weapons), "quantity": 1, "equipped": True}]
+    if armors and rnd.random() < 0.8:
+        inventory.append({"item_id": rnd.choice(armors), "quantity": 1, "equipped": True})
+    if shields and rnd.random() < 0.4:
+        inventory.append({"item_id": rnd.choice(shields), "quantity": 1, "equipped": True})
+    potions = rnd.randint(0, 5)
+    if potions:
+        inventory.append({"item_id": HEAL_POTION, "quantity": potions, "equipped": False})
+    return inventory
+
+
+# =========================
+# ENEMIGOS
+# =========================
+
+def _create_enemy_event(rnd: random.Random, index: int) -> Event:
+    template = rnd.choice(ENEMY_TEMPLATES)
+    return Event(
+        type="create_enemy",
+        payload={
+            "id": str(uuid.UUID(int=rnd.getrandbits(128))),
+            "name": f"{template['name']} {index + 1}",
+            "hp": template["hp"],
+            "max_hp": template["hp"],
+            "ac": template["ac"],
+            "asset_url": None,
+            "size": (1, 1),
+            "attributes": {short: rnd.randint(6, 18) for short, _ in ATTRIBUTE_KEYS},
+            "attacks": [dict(attack) for attack in template["attacks"]],
+        },
+        cancelable=False,
+    )
+
+
+# =========================
+# HISTORIAL
+# =========================
+
+def _fill_history(state: GameState, rnd: random.Random, count: int) -> None:
+    """
+    Historial ya jugado: se registra directo en el log (record_event), sin
+    volver a correr los handlers, como quedaría tras una sesión larga.
+    """
+    if count <= 0:
+        return
+    token_ids = list(state.tokens)
+    actor_ids = list(state.characters) + list(state.enemies)
+    types, weights = zip(*HISTORY_MIX)
+
+    for event_type in rnd.choices(types, weights, k=count):
+        actor_id = rnd.choice(actor_ids)
+        if event_type == "token_moved":
+            payload = {"token_id": rnd.choice(token_ids), "x": rnd.randrange(MAP_SIZE), "y": rnd.randrange(MAP_SIZE)}
+        elif event_type == "roll_result":
+            payload = {"dice": "1d20", "value": rnd.randint(1, 20)}
+        elif event_type == "attack_hit":
+            payload = {"target_id": rnd.choice(actor_ids), "damage": rnd.randint(1, 12), "critical": False}
+        else:
+            payload = {"message": "..."}
+        state.record_event(Event(type=event_type, context=EventContext(actor_id=actor_id), payload=payload))
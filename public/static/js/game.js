@@ -14,6 +14,17 @@ let selectedCombatants = new Set();
 let selectedToken = null;
 let inCombat = false;
 let selectedTarget = null;
+// Versión del estado de la campaña que refleja este cliente (deltas del servidor)
+let stateVersion = null;
+let currentActorId = null;
+let initiativeOrder = [];
+const actorStatuses = {};
+// Previews efímeras (arrastres, reglas, pings) de otros clientes
+const PREVIEW_INTERVAL_MS = 33;
+const PING_LIFETIME_MS = 1500;
+const previewElements = {};
+let lastPreviewAt = 0;
+let lastPreviewTile = null;
 /* ================================
    SOCKET.IO - CONEXIÓN
 ================================ */
@@ -124,27 +135,13 @@ window.onload = () => {
         }
     });
 
-    socket.on('token_moved', d => {
-        const token = document.querySelector(`[data-token-id="${d.token_id}"]`);
-        if (!token) return;
-
-        token.style.left = `${d.x * TILE_SIZE + TILE_SIZE / 2}px`;
-        token.style.top = `${d.y * TILE_SIZE + TILE_SIZE / 2}px`;
-
-        const oldX = parseInt(token.dataset.gridX || 0);
-        const oldY = parseInt(token.dataset.gridY || 0);
-
-        if (typeof updateGridState === 'function') {
-            updateGridState(d.token_id, oldX, oldY, d.x, d.y);
-        }
-
-        token.dataset.gridX = d.x;
-        token.dataset.gridY = d.y;
-    });
+    socket.on('state_delta', applyStateDelta);
+    socket.on('previews', d => d.items.forEach(renderPreview));
 
     socket.on('error', d => console.error('❌ Error del servidor:', d));
 
     socket.on('entities_result', data => {
+        stateVersion = data.version;
         dm_player_list = data.players || [];
         dm_enemies_list = data.enemies || [];
         renderDMEntities(data);
@@ -157,22 +154,11 @@ window.onload = () => {
     socket.on("attack_recieved", data => {
         renderAttack(data)
     })
-    socket.on("enemy_created", data => {
-        if (document.querySelector(`[data-token-id="${data.id}"]`)) return;
-        const token = createTokenElement(data);
-        document.getElementById("tokens-container").appendChild(token);
-        updateGridState(data.id, null, null, data.x, data.y);
-        socket.emit("get_entities", {campaign_code : campaignCode})
-    });
-
-    socket.on("tokens_sync", tokens => {
+    socket.on("tokens_sync", data => {
+        stateVersion = data.version;
         document.querySelectorAll(".token").forEach(t => t.remove());
         initializeGrid();
-        tokens.forEach(data => {
-            const token = createTokenElement(data);
-            document.getElementById("tokens-container").appendChild(token);
-            updateGridState(data.id, null, null, data.x, data.y);
-        });
+        data.tokens.forEach(addTokenElement);
     });
 
     socket.on("inventory_updated", d => renderCharacterGearAndInventory(d));
@@ -421,6 +407,159 @@ function renderCharacterGearAndInventory(character) {
     });
 }
 
+/* ================================
+   STATE DELTAS
+================================ */
+function requestFullSync() {
+    stateVersion = null;
+    socket.emit("get_tokens", { campaign_code: campaignCode });
+    if (isDM) socket.emit("get_entities", { campaign_code: campaignCode });
+}
+
+function applyStateDelta(delta) {
+    // Sin snapshot todavía, o se perdió un lote: pedir el estado completo
+    if (stateVersion === null || delta.from !== stateVersion) {
+        if (stateVersion !== null) requestFullSync();
+        return;
+    }
+    delta.changes.forEach(change => {
+        switch (change.t) {
+            case "token": moveTokenElement(change.id, change.x, change.y); break;
+            case "token+": addTokenElement(change.token); break;
+            case "entity+": addDMEntity(change.entity); break;
+            case "hp": updateActorHp(change.id, change.hp); break;
+            case "status": updateActorStatus(change.id, change.status, change.on); break;
+            case "turn": updateTurn(change.actor, change.phase); break;
+            case "initiative": initiativeOrder = change.order; break;
+            case "initiative-": initiativeOrder = initiativeOrder.filter(id => id !== change.id); break;
+        }
+    });
+    stateVersion = delta.version;
+}
+
+function addTokenElement(data) {
+    if (document.querySelector(`[data-token-id="${data.id}"]`)) return;
+    const token = createTokenElement(data);
+    document.getElementById("tokens-container").appendChild(token);
+    updateGridState(data.id, null, null, data.x, data.y);
+}
+
+function moveTokenElement(tokenId, x, y) {
+    const token = document.querySelector(`[data-token-id="${tokenId}"]`);
+    if (!token) return;
+
+    token.style.left = `${x * TILE_SIZE + TILE_SIZE / 2}px`;
+    token.style.top = `${y * TILE_SIZE + TILE_SIZE / 2}px`;
+
+    const oldX = parseInt(token.dataset.gridX || 0);
+    const oldY = parseInt(token.dataset.gridY || 0);
+    updateGridState(tokenId, oldX, oldY, x, y);
+
+    token.dataset.gridX = x;
+    token.dataset.gridY = y;
+}
+
+function updateActorHp(actorId, hp) {
+    const token = document.querySelector(`[data-token-id="${actorId}"]`);
+    if (token) token.dataset.hp = hp;
+
+    const entity = [...dm_player_list, ...dm_enemies_list].find(e => e.id === actorId);
+    if (entity) {
+        entity.hp = hp;
+        const li = document.querySelector(`#dm-panel [data-char-id="${actorId}"]`);
+        if (li) renderEntityHp(li, entity);
+    }
+
+    if (actorId === myCharacterId) {
+        const hpEl = document.getElementById('char-hp');
+        if (hpEl) hpEl.textContent = hpEl.textContent.replace(/^\S+/, hp);
+    }
+}
+
+function updateActorStatus(actorId, status, on) {
+    const statuses = actorStatuses[actorId] ??= new Set();
+    if (on) statuses.add(status); else statuses.delete(status);
+
+    const token = document.querySelector(`[data-token-id="${actorId}"]`);
+    if (token) token.title = [...statuses].join(", ");
+}
+
+function updateTurn(actorId, phase) {
+    inCombat = phase === "combat";
+    document.querySelector(".token.active-turn")?.classList.remove("active-turn");
+    currentActorId = actorId;
+    if (inCombat && actorId) {
+        document.querySelector(`[data-token-id="${actorId}"]`)?.classList.add("active-turn");
+    }
+}
+
+function addDMEntity(entity) {
+    if (!isDM || dm_enemies_list.some(e => e.id === entity.id)) return;
+    dm_enemies_list.push(entity);
+    renderDMEntities({ characters: dm_player_list, enemies: dm_enemies_list });
+}
+
+/* ================================
+   PREVIEWS EFÍMERAS
+================================ */
+function sendPreview(kind, data, force = false) {
+    // Se limita del lado del cliente; el servidor además descarta el exceso
+    const now = performance.now();
+    if (!force && now - lastPreviewAt < PREVIEW_INTERVAL_MS) return;
+    lastPreviewAt = now;
+    socket.emit("preview", { kind, data });
+}
+
+function tileCenter(x, y) {
+    return [x * TILE_SIZE + TILE_SIZE / 2, y * TILE_SIZE + TILE_SIZE / 2];
+}
+
+function removePreview(id) {
+    previewElements[id]?.remove();
+    delete previewElements[id];
+}
+
+function renderPreview(item) {
+    if (item.from === socket.id) return;
+    const id = `${item.from}:${item.kind}:${item.key}`;
+    const data = item.data;
+    if (!data) {
+        removePreview(id);
+        return;
+    }
+
+    let el = previewElements[id];
+    if (!el) {
+        el = document.createElement("div");
+        el.className = `preview-${item.kind}`;
+        if (item.kind === "drag") {
+            const source = document.querySelector(`[data-token-id="${data.token_id}"] img`);
+            if (source) el.appendChild(source.cloneNode());
+        }
+        document.getElementById("tokens-container").appendChild(el);
+        previewElements[id] = el;
+    }
+
+    if (item.kind === "ruler") {
+        const [x1, y1] = tileCenter(data.from_x, data.from_y);
+        const [x2, y2] = tileCenter(data.to_x, data.to_y);
+        el.style.left = `${x1}px`;
+        el.style.top = `${y1}px`;
+        el.style.width = `${Math.hypot(x2 - x1, y2 - y1)}px`;
+        el.style.transform = `rotate(${Math.atan2(y2 - y1, x2 - x1)}rad)`;
+        el.dataset.feet = Math.max(Math.abs(data.to_x - data.from_x), Math.abs(data.to_y - data.from_y)) * 5;
+        return;
+    }
+
+    const [left, top] = tileCenter(data.x, data.y);
+    el.style.left = `${left}px`;
+    el.style.top = `${top}px`;
+    if (item.kind === "ping") {
+        clearTimeout(el.pingTimer);
+        el.pingTimer = setTimeout(() => removePreview(id), PING_LIFETIME_MS);
+    }
+}
+
 /* ================================
    CREATE TOKEN ELEMENT
 ================================ */
@@ -779,6 +918,17 @@ function updateGridState(tokenId, oldX, oldY, newX, newY) {
 /* ================================
    DM ENTITIES RENDER
 ================================ */
+function renderEntityHp(li, entity) {
+    const pct = Math.round((entity.hp / entity.max_hp) * 100);
+    const bar = li.querySelector('.entity-hp-bar');
+    if (bar) {
+        bar.style.width = `${pct}%`;
+        bar.style.background = pct > 50 ? '#4ade80' : pct > 25 ? '#f59e0b' : '#f87171';
+    }
+    const text = li.querySelector('.entity-hp-text');
+    if (text) text.textContent = `${entity.hp} / ${entity.max_hp} HP`;
+}
+
 function renderDMEntities(data) {
     const playerList = document.getElementById('dm-player-list');
     const enemyList = document.getElementById('dm-enemy-list');
@@ -994,6 +1144,7 @@ function setupTokenControls() {
                 return;
             }
 
+            endDragPreview();
             document.querySelectorAll('.token').forEach(t => t.classList.remove('selected'));
             selectedToken = token;
             token.classList.add('selected');
@@ -1001,18 +1152,57 @@ function setupTokenControls() {
         }
 
         if (isDM && selectedToken && !e.target.closest('.token')) {
+            endDragPreview();
             selectedToken.classList.remove('selected');
             selectedToken = null;
         }
     });
 
+    function tileAt(e, canvas) {
+        const rect = canvas.getBoundingClientRect();
+        return [
+            Math.floor((e.clientX - rect.left) / (TILE_SIZE * mapScale)),
+            Math.floor((e.clientY - rect.top) / (TILE_SIZE * mapScale)),
+        ];
+    }
+
+    function endDragPreview() {
+        if (!selectedToken || !lastPreviewTile) return;
+        const tokenId = selectedToken.dataset.tokenId;
+        sendPreview("drag", { token_id: tokenId, done: true }, true);
+        sendPreview("ruler", { done: true }, true);
+        lastPreviewTile = null;
+    }
+
+    // Mientras el DM tiene un token elegido, el resto ve hacia dónde lo lleva.
+    // No pasa por el GameState: solo el click final es un move_token.
+    function handleGridHover(e, canvas) {
+        if (!isDM || !selectedToken) return;
+        const [tileX, tileY] = tileAt(e, canvas);
+        if (!isValidGridPosition(tileX, tileY)) return;
+        if (lastPreviewTile && lastPreviewTile[0] === tileX && lastPreviewTile[1] === tileY) return;
+        if (performance.now() - lastPreviewAt < PREVIEW_INTERVAL_MS) return;
+
+        lastPreviewTile = [tileX, tileY];
+        const fromX = parseInt(selectedToken.dataset.gridX || 0);
+        const fromY = parseInt(selectedToken.dataset.gridY || 0);
+        sendPreview("drag", { token_id: selectedToken.dataset.tokenId, x: tileX, y: tileY }, true);
+        sendPreview("ruler", { from_x: fromX, from_y: fromY, to_x: tileX, to_y: tileY }, true);
+    }
+
     function handleGridClick(e, canvas) {
+        if (e.altKey) {
+            // Alt + click: ping para toda la mesa
+            e.stopPropagation();
+            const [tileX, tileY] = tileAt(e, canvas);
+            if (isValidGridPosition(tileX, tileY)) sendPreview("ping", { x: tileX, y: tileY }, true);
+            return;
+        }
         if (!isDM || !selectedToken) return;
         e.stopPropagation();
-        const rect = canvas.getBoundingClientRect();
-        const tileX = Math.floor((e.clientX - rect.left) / (TILE_SIZE * mapScale));
-        const tileY = Math.floor((e.clientY - rect.top) / (TILE_SIZE * mapScale));
+        const [tileX, tileY] = tileAt(e, canvas);
         if (!isValidGridPosition(tileX, tileY) || isCellOccupied(tileX, tileY)) return;
+        endDragPreview();
         const oldX = parseInt(selectedToken.dataset.gridX || 0);
         const oldY = parseInt(selectedToken.dataset.gridY || 0);
         updateGridState(selectedToken.dataset.tokenId, oldX, oldY, tileX, tileY);
@@ -1025,6 +1215,8 @@ function setupTokenControls() {
 
     gridCanvas.addEventListener('click', e => handleGridClick(e, gridCanvas));
     mapCanvas.addEventListener('click', e => handleGridClick(e, mapCanvas));
+    gridCanvas.addEventListener('mousemove', e => handleGridHover(e, gridCanvas));
+    mapCanvas.addEventListener('mousemove', e => handleGridHover(e, mapCanvas));
 }
 
 /* ================================
@@ -70,13 +70,14 @@ class Actor(ABC):
         return self.bardic_inspiration_die != 0
 
 
-    def consume_bardic_inspiration(self) -> int:
+    def consume_bardic_inspiration(self, rng=random) -> int:
+        """rng: RNG de la campaña (state.rng); el módulo random si no hay partida"""
         if self.bardic_inspiration_die == 0:
             raise RuntimeError("No bardic inspiration available")
 
         die = self.bardic_inspiration_die
         self.bardic_inspiration_die = 0
-        return random.randint(1, die)
+        return rng.randint(1, die)
     
     def __init__(self, id: UUID, name: str, attributes: dict):
         self.id = id
@@ -84,6 +85,10 @@ class Actor(ABC):
         self.attributes = attributes
         self.active_effects = []
         self.features = []
+        # Se incrementa cada vez que cambian las features (invalida cachés del dispatcher)
+        self.features_version = 0
+        # Se incrementa al cambiar equipo, atributos o nivel (invalida la caché de queries)
+        self.stats_version = 0
         self.proficiency_bonus = 2
         self.skill_proficiencies: set[str] = set()
         self.saving_throw_proficiencies: set[str] = set()
@@ -132,6 +137,7 @@ class Actor(ABC):
             raise ValueError(f"Item type '{item_type}' cannot be equipped")
 
         instance.equipped = True
+        self.stats_version += 1
 
     
     def unequip(self, instance):
@@ -146,11 +152,20 @@ class Actor(ABC):
             self.shield = None
 
         instance.equipped = False
+        self.stats_version += 1
 
 
     def calculate_base_ac(self):
         self.base_ac = self.calc_ac()
 
+    def grant_feature(self, feature) -> None:
+        self.features.append(feature)
+        self.features_version += 1
+
+    def clear_features(self) -> None:
+        self.features.clear()
+        self.features_version += 1
+
     def get_feature(self, name: str):
         for feature in self.features:
             if feature.name == name:
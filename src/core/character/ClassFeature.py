@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-import random
 from uuid import UUID
 
 from src.core.base import Actor
 from src.core.game.Event import EventContext, Event, GameState
-from typing import Optional
+from src.core.game.modifiers import Modifier, ModifierKind
+from typing import Iterable, Optional
 
 class ClassFeature(ABC):
     name: str
@@ -12,6 +12,9 @@ class ClassFeature(ABC):
     description: str
     level: int
     type: str
+    # Tipos de evento que la feature escucha. El dispatcher solo llama a on_event
+    # para estos tipos (una feature sin suscripciones nunca es invocada).
+    event_types: tuple[str, ...] = ()
     
     def is_available(self, actor) -> bool:
             return (
@@ -22,6 +25,13 @@ class ClassFeature(ABC):
     def on_event(self, event: Event, state: GameState) -> Optional[Event]:
         pass
 
+    def modifiers(self, actor) -> Iterable[Modifier]:
+        """
+        Modificadores pasivos que la feature aporta a los stats del actor.
+        Se compilan en el ModifierStack del actor (ver core/game/modifiers.py).
+        """
+        return ()
+
 
     @classmethod
     def info(cls) -> dict:
@@ -37,35 +47,19 @@ class UnarmoredDefense(ClassFeature):
     description = "Mientras no lleves armadura, tu CA es igual a 10 + tu modificador de Destreza + tu modificador de Constitución."
     level = 1
     required_level = 1
-    def on_event(self, event: Event, state: GameState) -> Optional[Event]:
-        if event.type != "ac_requested":
-            return None
 
-        ctx = event.context
-        if ctx is None:
-            return None
-
-        actor_id = ctx.actor_id
-        if actor_id is None:
-            return None
-
-        actor = state.characters.get(actor_id)
-        if actor is None:
-            return None
+    def on_event(self, event: Event, state: GameState) -> Optional[Event]:
+        return None
 
+    def modifiers(self, actor) -> Iterable[Modifier]:
         # Condición: sin armadura
         if actor.armor is not None:
-            return None
-
-        ac = 10 + actor.dex_mod + actor.con_mod
-        return Event(
-            type="ac_base_calculated",
-            context=ctx,
-            payload={
-                "source": self.name,
-                "value": ac
-            },
-            cancelable=False
+            return
+        yield Modifier(
+            stat="ac",
+            kind=ModifierKind.BASE,
+            source=self.name,
+            value=10 + actor.dex_mod + actor.con_mod
         )
 
 class Rage(ClassFeature):
@@ -75,6 +69,7 @@ class Rage(ClassFeature):
     required_level = 1
     level = 1
     RAGE_DURATION_TURNS = 3 
+    event_types = ("rage_requested",)
 
     def on_event(self, event: Event, state: GameState) -> Optional[Event]:
         if event.type != "rage_requested":
@@ -103,9 +98,10 @@ class Rage(ClassFeature):
         # Consumir recurso
         resources["rage_uses"] = uses - 1
 
-        # Aplicar estado
+        # Aplicar estado (vence en un tick absoluto del scheduler)
+        expires_at = state.effects.schedule_expiry(actor.id, "rage", self.RAGE_DURATION_TURNS)
         actor.status["rage"] = {
-            "turns": self.RAGE_DURATION_TURNS,
+            "expires_at": expires_at,
             "bonus": resources.get("rage_bonus", 0)
         }
 
@@ -164,7 +160,7 @@ class SongOfRest(ClassFeature):
             target_actor = state.characters.get(t)
             if target_actor is None:
                 continue
-            amount = random.randint(1, self.die)  # dado según level
+            amount = state.rng.randint(1, self.die)  # dado según level
             target_actor.hp = min(target_actor.max_hp, target_actor.hp + amount)
             healed.append({"target": t, "amount": amount})
 
@@ -7,33 +7,28 @@ class ProgressionSystem:
             ProgressionSystem._barbarian(actor, state)
 
     @staticmethod
-    def _barbarian(actor, state):
-        lvl = actor.level
-
-        if lvl < 3:
-            rage_uses = 2
-            rage_bonus = 2
-        elif lvl < 6:
-            rage_uses = 3
-            rage_bonus = 2
-        elif lvl < 9:
-            rage_uses = 4
-            rage_bonus = 2
-        elif lvl < 12:
-            rage_uses = 4
-            rage_bonus = 3
-        elif lvl < 16:
-            rage_uses = 5
-            rage_bonus = 3
-        elif lvl < 17:
-            rage_uses = 5
-            rage_bonus = 4
-        elif lvl < 20:
-            rage_uses = 6
-            rage_bonus = 4
+    def rage_progression(level: int) -> tuple[int, int]:
+        """(usos de furia, bonus de daño) del bárbaro según nivel"""
+        if level < 3:
+            return 2, 2
+        elif level < 6:
+            return 3, 2
+        elif level < 9:
+            return 4, 2
+        elif level < 12:
+            return 4, 3
+        elif level < 16:
+            return 5, 3
+        elif level < 17:
+            return 5, 4
+        elif level < 20:
+            return 6, 4
         else:
-            rage_uses = 999
-            rage_bonus = 4
+            return 999, 4
+
+    @staticmethod
+    def _barbarian(actor, state):
+        rage_uses, rage_bonus = ProgressionSystem.rage_progression(actor.level)
 
         state.resources.setdefault(actor.id, {})
         state.resources[actor.id]["rage_uses"] = rage_uses
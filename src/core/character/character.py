@@ -57,6 +57,7 @@ class Character(Actor):
             return False
 
         self.level += 1
+        self.stats_version += 1
 
         # Aumento de vida por nivel
         hp_gained = self.roll_hit_die(
@@ -84,6 +85,7 @@ class Character(Actor):
 
         self.attributes[attribute] += value
         self.points -= value
+        self.stats_version += 1
         self.max_weight = self.attributes["STR"] * 15
         return True
 
@@ -100,7 +102,7 @@ class Character(Actor):
             feature = feature_cls()
             feature.level = self.level  # asigna nivel del personaje
             # 2) Registrar la feature en el actor
-            self.features.append(feature)
+            self.grant_feature(feature)
 
     def current_weight(self) -> float:
         return sum(
@@ -156,7 +158,7 @@ class Character(Actor):
         return {
             "attack": "Ataque con arma",
             "weapon_name": self.weapon.name,
-            "damage": f"{self.weapon.dice_count}{self.weapon.dice_size}"
+            "damage": f"{self.weapon.damage_dice}"
                     f"{f' + {self.weapon.bonus}' if self.weapon.bonus else ''}",
             "damage_type": self.weapon.damage_type,
             "attribute": self.weapon.attribute,
@@ -299,14 +301,14 @@ class Character(Actor):
         char.armor_proficiencies = set(data.get("armor_proficiencies", []))
         char.skill_proficiencies = set(data.get("skill_proficiencies", []))
         # ---- features ----
-        char.features.clear()
+        char.clear_features()
         for lvl in range(1, char.level + 1):
             feature_classes = dnd_class.features_by_level().get(lvl, [])
             for feature_cls in feature_classes:
                 feature = feature_cls()
                 feature.level = lvl
                 feature.type = feature_cls.type
-                char.features.append(feature)
+                char.grant_feature(feature)
         char.load_inventory(data.get("inventory", []))
         return char
 
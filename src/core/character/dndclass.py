@@ -81,7 +81,7 @@ class DnDClass(ABC):
 
             for feature_cls in feature_classes:
                 if not any(isinstance(f, feature_cls) for f in actor.features):
-                    actor.features.append(feature_cls())
+                    actor.grant_feature(feature_cls())
 
 
     # =======================
@@ -1,6 +1,8 @@
 from uuid import UUID, uuid4
 from src.core.base import Movement
 from dataclasses import dataclass
+from src.core.game.dice import DiceExpression, compile_dice
+from src.core.combat.expected_damage import expected_damage
 
 @dataclass
 class EnemyAttack:
@@ -17,6 +19,10 @@ class EnemyAttack:
         """
         bonus_str = f"+{self.damage_bonus}" if self.damage_bonus else ""
         return f"{self.dice_count}d{self.dice_size}{bonus_str}"
+
+    @property
+    def damage_dice(self) -> DiceExpression:
+        return compile_dice(self.get_dice())
     
 
 class Enemy:
@@ -37,6 +43,7 @@ class Enemy:
         self.action_available = True
         self.reaction_available = True
         self.active_conditions = []
+        self.status = {}
         self.temp_bonuses = []
         self.position = (0,0)
         self.owner_id = owner_id
@@ -65,6 +72,7 @@ class Enemy:
         self.movement.reset()
     def clear_combat_effects(self) -> None:
         self.active_conditions.clear()
+        self.status.clear()
         self.temp_bonuses.clear()
 
     def calc_ac(self):
@@ -77,7 +85,14 @@ class Enemy:
         raise ValueError(f"Attack {attack_name} not found")
     
     def choose_attack(self, target) -> EnemyAttack:
-        return self.attacks[0]
+        """El ataque con más daño esperado contra la AC del objetivo (empate: el primero)"""
+        if len(self.attacks) == 1:
+            return self.attacks[0]
+        target_ac = target.calc_ac() if hasattr(target, "calc_ac") else 10
+        return max(
+            self.attacks,
+            key=lambda attack: expected_damage(attack.damage_dice, attack.attack_bonus, target_ac)
+        )
     
     def to_json(self) -> dict:
         return {
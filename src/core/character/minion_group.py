@@ -0,0 +1,223 @@
+from array import array
+from typing import Iterable, Iterator, Optional
+from uuid import UUID, uuid4
+
+from src.core.character.enemy import Enemy
+from src.core.combat.conditions import condition_bit, condition_names
+
+# Los 16 bits bajos del id de un grupo quedan en cero: ahí va el índice de
+# cada miembro (+1), así el id de un minion se resuelve sin diccionarios
+_INDEX_MASK = 0xFFFF
+MAX_GROUP_SIZE = _INDEX_MASK - 1
+# Lo que el DM puede invocar de una vez desde la UI
+MAX_INVOKE_COUNT = 100
+
+
+def new_group_id() -> UUID:
+    return UUID(int=uuid4().int & ~_INDEX_MASK)
+
+
+def split_member_id(actor_id: UUID) -> tuple[UUID, int]:
+    """id de minion -> (id del grupo, índice). Índice -1 si es el id del grupo."""
+    value = actor_id.int
+    return UUID(int=value & ~_INDEX_MASK), (value & _INDEX_MASK) - 1
+
+
+class MinionGroup:
+    """
+    N enemigos idénticos que comparten un único Enemy de plantilla.
+
+    - HP, posición y condiciones de cada miembro viven en arrays compactos
+      (4 bytes por valor), no en un objeto por enemigo
+    - el grupo ocupa un solo lugar en la iniciativa (turno compartido) y tiene
+      tantas acciones por turno como miembros vivos, una por miembro (`acted`)
+    - el daño se aplica por índice; `member(i)` da una vista tipo Enemy para
+      las reglas (AttackAction, queries) sin crear estado nuevo
+    """
+
+    def __init__(
+        self,
+        template: Enemy,
+        count: int,
+        positions: Optional[Iterable[tuple[int, int]]] = None,
+        id: Optional[UUID] = None,
+    ):
+        if not 0 < count <= MAX_GROUP_SIZE:
+            raise RuntimeError(f"Un grupo debe tener entre 1 y {MAX_GROUP_SIZE} miembros")
+        if id is not None and id.int & _INDEX_MASK:
+            raise RuntimeError("Id de grupo inválido: los 16 bits bajos deben ser 0")
+
+        self.id = id or new_group_id()
+        self.template = template
+        self.count = count
+        self.hp = array("i", [template.hp]) * count
+        self.conditions = array("I", [0]) * count
+        self.x = array("i", [0]) * count
+        self.y = array("i", [0]) * count
+        # 1 si el miembro ya gastó su acción este turno
+        self.acted = array("B", [0]) * count
+        for i, (x, y) in enumerate(positions or ()):
+            self.x[i] = x
+            self.y[i] = y
+        self.alive = count if template.hp > 0 else 0
+
+    # =========================
+    # MIEMBROS
+    # =========================
+
+    def member_id(self, index: int) -> UUID:
+        return UUID(int=self.id.int | (index + 1))
+
+    def member(self, index: int) -> "Minion":
+        if not 0 <= index < self.count:
+            raise RuntimeError(f"El grupo no tiene miembro {index}")
+        return Minion(self, index)
+
+    def alive_indexes(self) -> Iterator[int]:
+        return (i for i, hp in enumerate(self.hp) if hp > 0)
+
+    def set_hp(self, index: int, value: int) -> None:
+        was_alive = self.hp[index] > 0
+        self.hp[index] = value
+        if was_alive and value <= 0:
+            self.alive -= 1
+        elif not was_alive and value > 0:
+            self.alive += 1
+
+    def damage(self, index: int, amount: int) -> bool:
+        """Aplica daño a un miembro. Devuelve True si murió con este golpe."""
+        if self.hp[index] <= 0:
+            return False
+        self.set_hp(index, max(0, self.hp[index] - amount))
+        return self.hp[index] == 0
+
+    def move(self, index: int, x: int, y: int) -> None:
+        self.x[index] = x
+        self.y[index] = y
+
+    def has_acted(self, index: int) -> bool:
+        return bool(self.acted[index])
+
+    def mark_acted(self, index: int) -> None:
+        self.acted[index] = 1
+
+    # =========================
+    # CONDICIONES
+    # =========================
+
+    def add_condition(self, index: int, condition: str) -> None:
+        self.conditions[index] |= condition_bit(condition)
+
+    def remove_condition(self, index: int, condition: str) -> None:
+        self.conditions[index] &= ~condition_bit(condition)
+
+    def has_condition(self, index: int, condition: str) -> bool:
+        return bool(self.conditions[index] & condition_bit(condition))
+
+    def condition_names(self, index: int) -> list[str]:
+        return condition_names(self.conditions[index])
+
+    # =========================
+    # COMO COMBATIENTE (un lugar en la iniciativa)
+    # =========================
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def attributes(self) -> dict[str, int]:
+        return self.template.attributes
+
+    @property
+    def action_count(self) -> int:
+        # Turno compartido: una acción por miembro vivo
+        return self.alive
+
+    def calc_ac(self) -> int:
+        return self.template.ac
+
+    def reset_turn_resources(self) -> None:
+        self.template.reset_turn_resources()
+        for i in range(self.count):
+            self.acted[i] = 0
+
+    def clear_combat_effects(self) -> None:
+        for i in range(self.count):
+            self.conditions[i] = 0
+
+    def to_json(self) -> dict:
+        return {
+            "id": str(self.id),
+            "name": self.template.name,
+            "max_hp": self.template.max_hp,
+            "ac": self.template.ac,
+            "asset_url": self.template.asset_url,
+            "size": self.template.size,
+            "alive": self.alive,
+            "members": [
+                {
+                    "id": str(self.member_id(i)),
+                    "index": i,
+                    "hp": self.hp[i],
+                    "x": self.x[i],
+                    "y": self.y[i],
+                    "conditions": self.condition_names(i),
+                }
+                for i in range(self.count)
+            ],
+        }
+
+
+class Minion(Enemy):
+    """
+    Vista de un miembro de un MinionGroup con la interfaz de Enemy.
+    No guarda estado propio: HP y posición se leen y escriben en los arrays
+    del grupo, y el resto (nombre, AC, ataques...) sale de la plantilla.
+    Se crea al vuelo en cada GameState.get_actor.
+    """
+
+    def __init__(self, group: MinionGroup, index: int):
+        # Sin Enemy.__init__: los datos del enemigo están en la plantilla
+        self.__dict__["group"] = group
+        self.__dict__["index"] = index
+        self.__dict__["id"] = group.member_id(index)
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") or "group" not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.group.template, name)
+
+    @property
+    def initiative_id(self) -> UUID:
+        return self.group.id
+
+    @property
+    def hp(self) -> int:
+        return self.group.hp[self.index]
+
+    @hp.setter
+    def hp(self, value: int) -> None:
+        self.group.set_hp(self.index, value)
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return self.group.x[self.index], self.group.y[self.index]
+
+    @position.setter
+    def position(self, value: tuple[int, int]) -> None:
+        self.group.move(self.index, *value)
+
+    @property
+    def conditions(self) -> list[str]:
+        return self.group.condition_names(self.index)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": str(self.id),
+            "name": f"{self.group.name} {self.index + 1}",
+            "hp": self.hp,
+            "max_hp": self.group.template.max_hp,
+            "ac": self.group.template.ac,
+            "asset_url": self.group.template.asset_url,
+        }
@@ -46,4 +46,4 @@ class CombatService:
         state.current_phase = Phase.EXPLORATION
         state.current_actor = None
         state.current_turn = 0
-        state.initiative_order = []
\ No newline at end of file
+        state.initiative.clear()
\ No newline at end of file
@@ -0,0 +1,201 @@
+from enum import IntEnum, IntFlag
+from typing import Iterable, Optional
+
+
+class Condition(IntFlag):
+    """
+    Condiciones estándar de 5e, un bit cada una.
+    El orden de los primeros 8 bits es el de los minions (se persiste en sus arrays).
+    """
+
+    ATURDIDO = 1 << 0
+    ENVENENADO = 1 << 1
+    DERRIBADO = 1 << 2
+    ASUSTADO = 1 << 3
+    AGARRADO = 1 << 4
+    RESTRINGIDO = 1 << 5
+    CEGADO = 1 << 6
+    PARALIZADO = 1 << 7
+    INCAPACITADO = 1 << 8
+    INCONSCIENTE = 1 << 9
+    PETRIFICADO = 1 << 10
+    HECHIZADO = 1 << 11
+    ENSORDECIDO = 1 << 12
+    INVISIBLE = 1 << 13
+
+
+class Roll(IntEnum):
+    """Tipo de tirada: índice de las tablas de ventaja / fallo automático"""
+
+    ATTACK_MELEE = 0
+    ATTACK_RANGED = 1
+    ABILITY_CHECK = 2
+    SAVE_STR = 3
+    SAVE_DEX = 4
+    SAVE_CON = 5
+    SAVE_INT = 6
+    SAVE_WIS = 7
+    SAVE_CHA = 8
+
+
+class Act(IntEnum):
+    """Lo que un actor intenta hacer en su turno"""
+
+    ACTION = 0
+    BONUS_ACTION = 1
+    REACTION = 2
+    MOVE = 3
+
+
+# Nombre del estado (actor.status / active_conditions) -> bit.
+# Las tablas guardan ints planos: operar con IntFlag es varias veces más lento
+CONDITION_BY_NAME = {condition.name.lower(): int(condition) for condition in Condition}
+
+SAVE_ROLLS = {
+    "STR": Roll.SAVE_STR,
+    "DEX": Roll.SAVE_DEX,
+    "CON": Roll.SAVE_CON,
+    "INT": Roll.SAVE_INT,
+    "WIS": Roll.SAVE_WIS,
+    "CHA": Roll.SAVE_CHA,
+}
+
+_C = Condition
+
+# Condiciones que incluyen a otras (paralizado => incapacitado, ...)
+_IMPLIES = (
+    (int(_C.ATURDIDO | _C.PARALIZADO | _C.INCONSCIENTE | _C.PETRIFICADO), int(_C.INCAPACITADO)),
+    (int(_C.INCONSCIENTE), int(_C.DERRIBADO)),
+)
+
+# Objetivo indefenso: no esquiva ni se resiste
+_HELPLESS = _C.PARALIZADO | _C.ATURDIDO | _C.INCONSCIENTE | _C.PETRIFICADO
+
+
+def _table(default: int = 0, **by_roll: int) -> tuple[int, ...]:
+    return tuple(int(by_roll.get(roll.name, default)) for roll in Roll)
+
+
+# =========================
+# TABLAS (una máscara por tipo de tirada)
+# =========================
+
+# Condiciones de quien tira que le dan ventaja / desventaja
+ADVANTAGE_SELF = _table(
+    ATTACK_MELEE=_C.INVISIBLE,
+    ATTACK_RANGED=_C.INVISIBLE,
+)
+DISADVANTAGE_SELF = _table(
+    ATTACK_MELEE=_C.CEGADO | _C.ASUSTADO | _C.ENVENENADO | _C.DERRIBADO | _C.RESTRINGIDO,
+    ATTACK_RANGED=_C.CEGADO | _C.ASUSTADO | _C.ENVENENADO | _C.DERRIBADO | _C.RESTRINGIDO,
+    ABILITY_CHECK=_C.ASUSTADO | _C.ENVENENADO,
+    SAVE_DEX=_C.RESTRINGIDO,
+)
+
+# Condiciones del objetivo que le dan ventaja / desventaja al atacante
+ADVANTAGE_AGAINST = _table(
+    ATTACK_MELEE=_C.CEGADO | _C.DERRIBADO | _C.RESTRINGIDO | _HELPLESS,
+    ATTACK_RANGED=_C.CEGADO | _C.RESTRINGIDO | _HELPLESS,
+)
+DISADVANTAGE_AGAINST = _table(
+    ATTACK_MELEE=_C.INVISIBLE,
+    ATTACK_RANGED=_C.INVISIBLE | _C.DERRIBADO,
+)
+
+# Fallo automático de quien tira
+AUTO_FAIL = _table(
+    SAVE_STR=_HELPLESS,
+    SAVE_DEX=_HELPLESS,
+)
+
+# Todo impacto contra el objetivo es crítico
+AUTO_CRITICAL_AGAINST = _table(
+    ATTACK_MELEE=_C.PARALIZADO | _C.INCONSCIENTE,
+)
+
+# Condiciones que impiden cada tipo de acción
+BLOCKED_BY = tuple(int(mask) for mask in (
+    _C.INCAPACITADO,                            # ACTION
+    _C.INCAPACITADO,                            # BONUS_ACTION
+    _C.INCAPACITADO,                            # REACTION
+    _C.AGARRADO | _C.RESTRINGIDO | _HELPLESS,   # MOVE
+))
+
+
+# =========================
+# COMPILACIÓN
+# =========================
+
+def expand(mask: int) -> int:
+    """Agrega las condiciones implícitas (un aturdido también está incapacitado)"""
+    for sources, implied in _IMPLIES:
+        if mask & sources:
+            mask |= implied
+    return mask
+
+
+def compile_conditions(names: Iterable[str]) -> int:
+    """Nombres de estados -> máscara. Los que no son condiciones (ej: "rage") se ignoran."""
+    mask = 0
+    for name in names:
+        mask |= CONDITION_BY_NAME.get(name, 0)
+    return expand(mask)
+
+
+def condition_mask(actor) -> int:
+    """Máscara de condiciones activas de cualquier actor (personaje, enemigo o minion)"""
+    group = getattr(actor, "group", None)
+    if group is not None:
+        return expand(group.conditions[actor.index])
+
+    mask = 0
+    for names in (getattr(actor, "status", None) or (), getattr(actor, "active_conditions", None) or ()):
+        for name in names:
+            mask |= CONDITION_BY_NAME.get(name, 0)
+    return expand(mask)
+
+
+def condition_bit(name: str) -> int:
+    condition = CONDITION_BY_NAME.get(name)
+    if condition is None:
+        raise RuntimeError(f"Condición desconocida: '{name}'")
+    return condition
+
+
+def condition_names(mask: int) -> list[str]:
+    return [name for name, condition in CONDITION_BY_NAME.items() if mask & condition]
+
+
+# =========================
+# CONSULTAS
+# =========================
+
+def roll_mode(roll: Roll, actor_mask: int, target_mask: int = 0) -> tuple[bool, bool]:
+    """(ventaja, desventaja) que aportan las condiciones. Si hay ambas, se anulan al tirar."""
+    advantage = bool(actor_mask & ADVANTAGE_SELF[roll] or target_mask & ADVANTAGE_AGAINST[roll])
+    disadvantage = bool(actor_mask & DISADVANTAGE_SELF[roll] or target_mask & DISADVANTAGE_AGAINST[roll])
+    return advantage, disadvantage
+
+
+def auto_fails(roll: Roll, actor_mask: int) -> bool:
+    return bool(actor_mask & AUTO_FAIL[roll])
+
+
+def auto_critical(roll: Roll, target_mask: int) -> bool:
+    return bool(target_mask & AUTO_CRITICAL_AGAINST[roll])
+
+
+def blocking_condition(act: Act, actor_mask: int) -> Optional[str]:
+    """Nombre de la condición que impide `act`, o None si puede hacerlo"""
+    blocked = BLOCKED_BY[act]
+    if not actor_mask & blocked:
+        return None
+    # La condición de origen (aturdido) antes que la implícita (incapacitado)
+    for name, condition in CONDITION_BY_NAME.items():
+        if actor_mask & condition and expand(condition) & blocked:
+            return name
+    return None
+
+
+def can_act(act: Act, actor_mask: int) -> bool:
+    return not actor_mask & BLOCKED_BY[act]
@@ -0,0 +1,38 @@
+from src.core.game.dice import DiceExpression
+
+_CRIT = 1 / 20
+
+
+def hit_chances(attack_bonus: int, target_ac: int, advantage: bool = False, disadvantage: bool = False) -> tuple[float, float]:
+    """
+    (P(impacto), P(crítico)) de un ataque con las reglas de AttackAction:
+    impacta con total >= AC o 20 natural. Ventaja y desventaja se anulan.
+    """
+    # Menor d20 natural que impacta (entre 1 y 20)
+    needed = min(20, max(1, target_ac - attack_bonus))
+    hit = (21 - needed) / 20
+    crit = _CRIT
+
+    if advantage and not disadvantage:
+        hit = 1 - (1 - hit) ** 2
+        crit = 1 - (1 - crit) ** 2
+    elif disadvantage and not advantage:
+        hit = hit ** 2
+        crit = crit ** 2
+    return hit, crit
+
+
+def expected_damage(
+    damage: DiceExpression,
+    attack_bonus: int,
+    target_ac: int,
+    advantage: bool = False,
+    disadvantage: bool = False,
+    always_critical: bool = False,
+) -> float:
+    """Daño esperado de un ataque (los críticos duplican los dados, no el bonus)"""
+    hit, crit = hit_chances(attack_bonus, target_ac, advantage, disadvantage)
+    critical_average = damage.critical().average
+    if always_critical:
+        return hit * critical_average
+    return (hit - crit) * damage.average + crit * critical_average
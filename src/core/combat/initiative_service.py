@@ -6,6 +6,7 @@ from src.core.game.Event import EventDispatcher  # si lo necesitas explícitamen
 from src.core.game.Event import EventHandler
 
 from .phase import Phase
+from .initiative_tracker import sort_initiative
 
 
 class InitiativeService:
@@ -76,12 +77,12 @@ class InitiativeService:
             if last_roll is None:
                 raise RuntimeError(f"No se obtuvo resultado de iniciativa para {actor_id}")
 
-            initiatives.append((actor_id, last_roll))
+            actor = state.get_actor(actor_id)
+            dexterity = actor.attributes.get("DEX", 10) if actor is not None else 10
+            initiatives.append((actor_id, last_roll, dexterity))
 
-        # Orden descendente
-        initiatives.sort(key=lambda x: x[1], reverse=True)
-
-        state.initiative_order = [actor_id for actor_id, _ in initiatives]
+        # Orden descendente, empates por DEX
+        state.initiative_order = sort_initiative(initiatives)
 
         state.dispatch(Event(
             type="initiative_completed",
@@ -93,11 +94,11 @@ class InitiativeService:
         ))
 
     def _initialize_first_turn(self, state: GameState) -> None:
-        if not state.initiative_order:
+        if not state.initiative:
             raise RuntimeError("No hay participantes en iniciativa")
 
         state.current_turn = 1
-        state.current_actor = state.initiative_order[0]
+        state.current_actor = state.initiative.first
 
         state.dispatch(Event(
             type="turn_started",
@@ -122,12 +123,8 @@ class InitiativeService:
             payload["value"]
         """
 
-        for event in reversed(state.event_log):
-            if (
-                event.type == "roll_result"
-                and event.context
-                and event.context.actor_id == actor_id
-            ):
-                return event.payload.get("value")
+        event = state.event_log.last("roll_result", actor_id=actor_id)
+        if event is None:
+            return None
 
-        return None
\ No newline at end of file
+        return event.payload.get("value")
@@ -0,0 +1,140 @@
+from typing import Callable, Hashable, Iterable, Iterator, Optional
+from uuid import UUID
+
+
+def sort_initiative(rolls: Iterable[tuple[UUID, int, int]]) -> list[UUID]:
+    """
+    Orden de iniciativa a partir de (actor_id, total, destreza).
+    Mayor total primero; los empates se rompen por mayor DEX y, si persisten,
+    se respeta el orden de tirada.
+    """
+    ordered = sorted(rolls, key=lambda roll: (roll[1], roll[2]), reverse=True)
+    return [actor_id for actor_id, _, _ in ordered]
+
+
+class InitiativeTracker:
+    """
+    Orden de turnos de un combate como anillo doblemente enlazado.
+
+    - `_next` / `_prev` enlazan a cada actor con sus vecinos (el último
+      apunta al primero), así avanzar y quitar un actor son O(1)
+    - `_alive` cuenta los actores vivos de cada equipo: saber si el combate
+      terminó no recorre la lista
+    - un actor quitado durante su propio turno deja registrado su sucesor,
+      para que el fin de turno sepa a quién le toca
+    """
+
+    def __init__(self):
+        self._next: dict[UUID, UUID] = {}
+        self._prev: dict[UUID, UUID] = {}
+        self._team: dict[UUID, Hashable] = {}
+        self._alive: dict[Hashable, int] = {}
+        # actor quitado -> (siguiente al momento de quitarlo, si era fin de ronda)
+        self._successor: dict[UUID, tuple[UUID, bool]] = {}
+        self._head: Optional[UUID] = None
+
+    @classmethod
+    def from_order(cls, order: Iterable[UUID], team_of: Callable[[UUID], Hashable]) -> "InitiativeTracker":
+        tracker = cls()
+        tracker.build(order, team_of)
+        return tracker
+
+    # =========================
+    # ESCRITURA
+    # =========================
+
+    def build(self, order: Iterable[UUID], team_of: Callable[[UUID], Hashable]) -> None:
+        self.clear()
+        order = list(order)
+        if not order:
+            return
+        if len(set(order)) != len(order):
+            raise RuntimeError("Actor repetido en el orden de iniciativa")
+
+        for i, actor_id in enumerate(order):
+            self._next[actor_id] = order[(i + 1) % len(order)]
+            self._prev[actor_id] = order[i - 1]
+            team = team_of(actor_id)
+            self._team[actor_id] = team
+            self._alive[team] = self._alive.get(team, 0) + 1
+        self._head = order[0]
+
+    def remove(self, actor_id: UUID) -> bool:
+        """Quita un actor del anillo. Devuelve False si no estaba."""
+        if actor_id not in self._next:
+            return False
+
+        next_id = self._next.pop(actor_id)
+        prev_id = self._prev.pop(actor_id)
+        self._alive[self._team.pop(actor_id)] -= 1
+
+        if next_id == actor_id:
+            # Era el único actor
+            self._head = None
+        else:
+            self._successor[actor_id] = (next_id, next_id == self._head)
+            self._next[prev_id] = next_id
+            self._prev[next_id] = prev_id
+            if self._head == actor_id:
+                self._head = next_id
+        return True
+
+    def clear(self) -> None:
+        self._next.clear()
+        self._prev.clear()
+        self._team.clear()
+        self._alive.clear()
+        self._successor.clear()
+        self._head = None
+
+    # =========================
+    # LECTURA
+    # =========================
+
+    @property
+    def first(self) -> Optional[UUID]:
+        return self._head
+
+    def next_of(self, actor_id: UUID) -> tuple[UUID, bool]:
+        """
+        Siguiente actor en el orden y si con eso empieza una nueva ronda.
+        Funciona también para un actor que fue quitado en su propio turno.
+        """
+        if actor_id in self._next:
+            next_id = self._next[actor_id]
+            return next_id, next_id == self._head
+
+        # El sucesor registrado pudo haber sido quitado también
+        next_id, wraps = actor_id, False
+        while next_id not in self._next:
+            entry = self._successor.get(next_id)
+            if entry is None:
+                raise RuntimeError("Actor fuera del orden de iniciativa")
+            next_id, step_wraps = entry
+            wraps = wraps or step_wraps
+        return next_id, wraps
+
+    def alive(self, team: Hashable) -> int:
+        return self._alive.get(team, 0)
+
+    def is_combat_over(self) -> bool:
+        """True si quedan actores vivos en menos de dos equipos"""
+        return sum(1 for count in self._alive.values() if count > 0) < 2
+
+    def __contains__(self, actor_id: object) -> bool:
+        return actor_id in self._next
+
+    def __len__(self) -> int:
+        return len(self._next)
+
+    def __bool__(self) -> bool:
+        return self._head is not None
+
+    def __iter__(self) -> Iterator[UUID]:
+        """Recorre el anillo desde el primero de la ronda"""
+        if self._head is None:
+            return
+        actor_id = self._head
+        for _ in range(len(self._next)):
+            yield actor_id
+            actor_id = self._next[actor_id]
@@ -17,7 +17,7 @@ class TurnService:
         if not state.current_actor:
             raise RuntimeError("No hay actor activo")
 
-        if not state.initiative_order:
+        if not state.initiative:
             raise RuntimeError("No existe orden de iniciativa")
 
         previous_actor = state.current_actor
@@ -42,14 +42,10 @@ class TurnService:
 
     def _advance_turn(self, state: GameState) -> None:
 
-        order = state.initiative_order
-        current_index = order.index(state.current_actor) # type: ignore
-
-        next_index = current_index + 1
+        next_actor, new_round = state.initiative.next_of(state.current_actor) # type: ignore
 
         # Nueva ronda
-        if next_index >= len(order):
-            next_index = 0
+        if new_round:
             state.current_turn += 1
 
             state.dispatch(Event(
@@ -62,7 +58,7 @@ class TurnService:
                 cancelable=False
             ))
 
-        state.current_actor = order[next_index]
+        state.current_actor = next_actor
 
         state.dispatch(Event(
             type="turn_started",
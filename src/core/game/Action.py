@@ -2,12 +2,39 @@ from abc import ABC, abstractmethod
 
 from src.core.character.character import Character
 from src.core.items.item import Weapon
-from src.core.character.enemy import Enemy
+from src.core.character.enemy import Enemy, EnemyAttack
+from src.core.character.minion_group import Minion, MinionGroup
 from src.core.game.Event import EventContext, Event, GameState
 from src.core.game.commands import *
 from src.core.combat.phase import Phase
+from src.core.combat.conditions import (
+    SAVE_ROLLS,
+    Act,
+    Roll,
+    auto_critical,
+    auto_fails,
+    blocking_condition,
+    condition_mask,
+    roll_mode,
+)
+from src.core.combat.initiative_tracker import sort_initiative
 from src.core.game.querys import *
-import random
+from src.core.game.dice import compile_dice
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy las tiradas de área se resuelven objetivo por objetivo
+    np = None
+
+# Atributo -> clave de competencia en salvaciones (saving_throw_proficiencies)
+SAVE_PROFICIENCY_KEYS = {
+    "STR": "strength",
+    "DEX": "dexterity",
+    "CON": "constitution",
+    "INT": "intelligence",
+    "WIS": "wisdom",
+    "CHA": "charisma",
+}
 
 class Action(ABC):
     @abstractmethod
@@ -24,28 +51,16 @@ class RollAction:
         if actor is None:
             raise RuntimeError("Actor no encontrado")
 
-        # Parsear dice string tipo "1d20+3"
-        count, rest = self.command.dice.lower().split("d")
-        count = int(count)
-        if "+" in rest:
-            size, bonus = rest.split("+")
-            size = int(size)
-            bonus = int(bonus)
-        else:
-            size = int(rest)
-            bonus = 0
-
-        # Tiradas con ventaja/desventaja
-        rolls = []
-        for _ in range(count):
-            if self.command.advantage:
-                rolls.append(max(random.randint(1, size), random.randint(1, size)))
-            elif self.command.disadvantage:
-                rolls.append(min(random.randint(1, size), random.randint(1, size)))
-            else:
-                rolls.append(random.randint(1, size))
+        # Expresión compilada (y cacheada) tipo "1d20+3", "2d6+1d4-1", "4d6kh3"
+        expression = compile_dice(self.command.dice)
+        result = expression.roll(
+            rng=state.rng,
+            advantage=self.command.advantage,
+            disadvantage=self.command.disadvantage,
+            critical=self.command.critical
+        )
+        rolls, bonus, total = result.rolls, result.bonus, result.total
 
-        total = sum(rolls) + bonus
         event = Event(
             type="roll_resolved",
             context=EventContext(actor_id=actor.id),
@@ -54,6 +69,7 @@ class RollAction:
                 "rolls": rolls,
                 "bonus": bonus,
                 "total": total,
+                "critical": self.command.critical,
                 "reason": self.command.reason
             },
             cancelable=False
@@ -123,17 +139,8 @@ class AttackAction(Action):
             )
             state.dispatch(failed_event)
             return failed_event
-        print("actor_id", self.command.actor_id)
-        print("target_id", self.command.target_id)
-        print(state.enemies)
-        print(state.characters)
         attacker = state.get_actor(self.command.actor_id)
         target = state.get_actor(self.command.target_id)
-        print("attacker:", state.get_actor(self.command.actor_id))
-        print("Target: ", state.get_actor(self.command.target_id))
-        print("Combatientes: ")
-        for combatent in state.iter_combatants():
-            print(combatent)
         if attacker is None or target is None:
             failed_event = Event(
                 type="attack_failed",
@@ -145,9 +152,10 @@ class AttackAction(Action):
             return failed_event
 
         # -----------------------
-        # Validar turno
+        # Validar turno (un minion juega en el turno de su grupo)
         # -----------------------
-        if state.current_actor != attacker.id:
+        turn_id = getattr(attacker, "initiative_id", attacker.id)
+        if state.current_actor != turn_id:
             failed_event = Event(
                 type="attack_failed",
                 context=EventContext(actor_id=attacker.id),
@@ -158,10 +166,10 @@ class AttackAction(Action):
             return failed_event
 
         # -----------------------
-        # Recursos
+        # Recursos (compartidos por el grupo en el caso de minions)
         # -----------------------
-        actor_resources = state.resources.get(attacker.id, {})
-        if actor_resources.get("action", 0) <= 0:
+        actor_resources = state.resources.get(turn_id, {})
+        if actor_resources.get("action", 0) <= 0 or _already_acted(attacker):
             failed_event = Event(
                 type="attack_failed",
                 context=EventContext(actor_id=attacker.id),
@@ -171,6 +179,22 @@ class AttackAction(Action):
             state.dispatch(failed_event)
             return failed_event
 
+        # -----------------------
+        # Condiciones (máscara de bits: aturdido, derribado, invisible...)
+        # -----------------------
+        attacker_conditions = condition_mask(attacker)
+        blocked = blocking_condition(Act.ACTION, attacker_conditions)
+        if blocked:
+            failed_event = Event(
+                type="attack_failed",
+                context=EventContext(actor_id=attacker.id),
+                payload={"reason": "Incapacitated", "condition": blocked},
+                cancelable=False
+            )
+            state.dispatch(failed_event)
+            return failed_event
+        target_conditions = condition_mask(target)
+
         # -----------------------
         # Seleccionar ataque
         # -----------------------
@@ -203,13 +227,15 @@ class AttackAction(Action):
         # -----------------------
         # Validar rango (opcional)
         # -----------------------
+        weapon_range = getattr(weapon, "range", 5)
+        melee = weapon_range <= 5
         if hasattr(attacker, "position") and hasattr(target, "position"):
             ax, ay = attacker.position
             tx, ty = target.position
             distance_tiles = abs(tx - ax) + abs(ty - ay)
             distance_feet = distance_tiles * 5
+            melee = distance_feet <= 5
 
-            weapon_range = getattr(weapon, "range", 5)
             if distance_feet > weapon_range:
                 failed_event = Event(
                     type="attack_failed",
@@ -223,12 +249,14 @@ class AttackAction(Action):
         # -----------------------
         # Tirada de ataque
         # -----------------------
+        roll_kind = Roll.ATTACK_MELEE if melee else Roll.ATTACK_RANGED
+        advantage, disadvantage = roll_mode(roll_kind, attacker_conditions, target_conditions)
         roll_command = RollCommand(
             actor_id=attacker.id,
             dice="1d20",
             reason="attack_throw",
-            advantage=self.command.advantage,
-            disadvantage=self.command.disadvantage
+            advantage=self.command.advantage or advantage,
+            disadvantage=self.command.disadvantage or disadvantage
         )
 
         roll_result = RollAction(roll_command).execute(state)
@@ -245,13 +273,15 @@ class AttackAction(Action):
 
         proficiency_bonus = prof_bonus if is_proficient else 0
         attack_bonus = (
-            getattr(weapon, "bonus", 0) + stat_mod + proficiency_bonus
-        )   
+            _weapon_attack_bonus(weapon) + stat_mod + proficiency_bonus
+        )
         attack_score = roll_result["total"] + attack_bonus
 
         natural_roll = roll_result["rolls"][0]
         critical = natural_roll == 20
         hit = critical or attack_score >= target_ac
+        # Golpe cuerpo a cuerpo a un paralizado / inconsciente: siempre crítico
+        critical = critical or (hit and auto_critical(roll_kind, target_conditions))
 
         attack_roll_event = Event(
             type="attack_roll",
@@ -264,12 +294,28 @@ class AttackAction(Action):
                 "hit": hit,
                 "weapon": getattr(weapon, "name", "Enemy Attack")
             },
-            cancelable=False
+            cancelable=True
         )
-        state.dispatch(attack_roll_event)
+        roll_dispatch = state.dispatch(attack_roll_event)
+
+        if roll_dispatch.cancelled:
+            # Un handler canceló el ataque (ej: una reacción del objetivo)
+            _spend_action(actor_resources, attacker)
+            miss_event = Event(
+                type="attack_miss",
+                context=EventContext(actor_id=attacker.id, target_id=target.id),
+                payload={
+                    "attack_score": attack_score,
+                    "target_ac": target_ac,
+                    "reason": roll_dispatch.reason
+                },
+                cancelable=False
+            )
+            state.dispatch(miss_event)
+            return miss_event
 
         if not hit:
-            actor_resources["action"] -= 1
+            _spend_action(actor_resources, attacker)
             miss_event = Event(
                 type="attack_miss",
                 context=EventContext(actor_id=attacker.id, target_id=target.id),
@@ -285,26 +331,16 @@ class AttackAction(Action):
         # -----------------------
         # Daño
         # -----------------------
-        dice_expr = weapon.get_dice() if isinstance(attacker, Enemy) else weapon.dice_size
-
         damage_command = RollCommand(
             actor_id=attacker.id,
-            dice=dice_expr, #type: ignore
-            reason="damage"
+            dice=str(weapon.damage_dice),
+            reason="damage",
+            critical=critical
         )
 
         damage_result = RollAction(damage_command).execute(state)
         damage_total = damage_result["total"] + stat_mod
 
-        if critical:
-            crit_command = RollCommand(
-                actor_id=attacker.id,
-                dice=dice_expr,#type: ignore
-                reason="critical_damage"
-            )
-            crit_result = RollAction(crit_command).execute(state)
-            damage_total += crit_result["total"]
-
         damage_event = Event(
             type="attack_hit",
             context=EventContext(actor_id=attacker.id, target_id=target.id),
@@ -319,9 +355,374 @@ class AttackAction(Action):
         )
         state.dispatch(damage_event)
 
-        actor_resources["action"] -= 1
+        _spend_action(actor_resources, attacker)
         return damage_event
     
+class AreaEffectAction(Action):
+    """
+    Un efecto contra muchos objetivos en una sola pasada: aliento de dragón,
+    bola de fuego (modo "save") o un cleave a todos los que están al alcance
+    (modo "attack").
+
+    - AC o modificadores de salvación de todos los objetivos con una query batch
+    - los d20 de todos los objetivos en una sola tirada vectorizada
+    - el daño se tira una vez para todo el efecto (crítico aparte en modo attack)
+    - el daño se aplica con un único evento area_damage
+    """
+
+    def __init__(self, command: AreaEffectCommand):
+        self.command = command
+
+    def _fail(self, state: GameState, actor_id, reason: str) -> Event:
+        failed_event = Event(
+            type="area_failed",
+            context=EventContext(actor_id=actor_id),
+            payload={"name": self.command.name, "reason": reason},
+            cancelable=False
+        )
+        state.dispatch(failed_event)
+        return failed_event
+
+    def execute(self, state: GameState) -> Event:
+        cmd = self.command
+
+        # -----------------------
+        # Validaciones (mismas que AttackAction)
+        # -----------------------
+        if state.current_phase != Phase.COMBAT:
+            return self._fail(state, cmd.actor_id, "Not in combat phase")
+
+        attacker = state.get_actor(cmd.actor_id)
+        if attacker is None:
+            return self._fail(state, cmd.actor_id, "Attacker not found")
+        turn_id = getattr(attacker, "initiative_id", attacker.id)
+        if state.current_actor != turn_id:
+            return self._fail(state, attacker.id, "Not your turn")
+
+        actor_resources = state.resources.get(turn_id, {})
+        if actor_resources.get("action", 0) <= 0 or _already_acted(attacker):
+            return self._fail(state, attacker.id, "No action available")
+
+        attacker_conditions = condition_mask(attacker)
+        if blocking_condition(Act.ACTION, attacker_conditions):
+            return self._fail(state, attacker.id, "Incapacitated")
+
+        if cmd.mode not in ("save", "attack"):
+            return self._fail(state, attacker.id, f"Invalid mode '{cmd.mode}'")
+        # Todo lo que puede fallar va antes de area_roll: una vez declarado el
+        # efecto, los handlers ya reaccionaron a él
+        if cmd.mode == "save":
+            if not cmd.damage_dice:
+                return self._fail(state, attacker.id, "Missing damage dice")
+            if cmd.save_attribute not in SAVE_PROFICIENCY_KEYS:
+                return self._fail(state, attacker.id, f"Invalid save attribute '{cmd.save_attribute}'")
+
+        by_id = {}
+        for target_id in cmd.target_ids:
+            target = state.get_actor(target_id)
+            if isinstance(target, MinionGroup):
+                # Apuntar al grupo = todos sus miembros vivos
+                for i in target.alive_indexes():
+                    member = target.member(i)
+                    by_id.setdefault(member.id, member)
+            elif target is not None and target.hp > 0:
+                by_id.setdefault(target.id, target)
+        targets = list(by_id.values())
+        if not targets:
+            return self._fail(state, attacker.id, "No valid targets")
+
+        # Modo attack: arma y alcance también se resuelven antes de declarar
+        attack = None
+        if cmd.mode == "attack":
+            attack = self._prepare_attacks(state, attacker, targets)
+            if isinstance(attack, Event):
+                return attack
+
+        # -----------------------
+        # Declaración del efecto (cancelable, ej: contrahechizo)
+        # -----------------------
+        roll_dispatch = state.dispatch(Event(
+            type="area_roll",
+            context=EventContext(actor_id=attacker.id),
+            payload={
+                "name": cmd.name,
+                "mode": cmd.mode,
+                "target_ids": [t.id for t in targets]
+            },
+            cancelable=True
+        ))
+        if roll_dispatch.cancelled:
+            _spend_action(actor_resources, attacker)
+            miss_event = Event(
+                type="area_miss",
+                context=EventContext(actor_id=attacker.id),
+                payload={"name": cmd.name, "reason": roll_dispatch.reason},
+                cancelable=False
+            )
+            state.dispatch(miss_event)
+            return miss_event
+
+        if cmd.mode == "save":
+            results = self._resolve_saves(state, attacker, targets)
+        else:
+            results = self._resolve_attacks(state, attacker, attacker_conditions, attack)
+
+        # -----------------------
+        # Daño en lote
+        # -----------------------
+        damage_event = Event(
+            type="area_damage",
+            context=EventContext(actor_id=attacker.id),
+            payload={
+                "name": cmd.name,
+                "mode": cmd.mode,
+                "damage_type": cmd.damage_type,
+                "results": results
+            },
+            cancelable=False
+        )
+        state.dispatch(damage_event)
+
+        _spend_action(actor_resources, attacker)
+        return damage_event
+
+    # =========================
+    # SALVACIONES
+    # =========================
+
+    def _resolve_saves(self, state: GameState, attacker, targets: list) -> list[dict]:
+        cmd = self.command
+        target_ids = tuple(t.id for t in targets)
+        modifiers = state.query(GetStatModifiersBatch(
+            actor_ids=target_ids,
+            attributes=(cmd.save_attribute,)
+        )).values
+
+        proficiency_key = SAVE_PROFICIENCY_KEYS.get(cmd.save_attribute)
+        save_bonus = []
+        for target in targets:
+            bonus = modifiers[target.id][cmd.save_attribute].value
+            if proficiency_key in getattr(target, "saving_throw_proficiencies", ()):
+                bonus += state.query(GetProficiencyBonus(actor_id=target.id)).value
+            save_bonus.append(bonus)
+
+        # Condiciones de cada objetivo: desventaja (restringido en DES) o fallo automático
+        roll_kind = SAVE_ROLLS.get(cmd.save_attribute, Roll.ABILITY_CHECK)
+        masks = [condition_mask(target) for target in targets]
+        failed = [auto_fails(roll_kind, mask) for mask in masks]
+
+        naturals = _roll_d20s_by_mode(state, [roll_mode(roll_kind, mask) for mask in masks])
+        damage = self._roll_damage(state, attacker, cmd.damage_dice, critical=False)
+        on_save = damage // 2 if cmd.half_on_save else 0
+
+        if np is not None:
+            totals = np.asarray(naturals) + np.asarray(save_bonus)
+            saved = (totals >= cmd.save_dc) & ~np.asarray(failed, dtype=bool)
+            damages = np.where(saved, on_save, damage)
+            totals, saved, damages = totals.tolist(), saved.tolist(), damages.tolist()
+        else:
+            totals = [n + b for n, b in zip(naturals, save_bonus)]
+            saved = [t >= cmd.save_dc and not f for t, f in zip(totals, failed)]
+            damages = [on_save if s else damage for s in saved]
+
+        return [
+            {
+                "target_id": target.id,
+                "natural_roll": natural,
+                "total": total,
+                "save_dc": cmd.save_dc,
+                "saved": s,
+                "auto_failed": f,
+                "hit": not s,
+                "critical": False,
+                "damage": dmg
+            }
+            for target, natural, total, s, f, dmg in zip(targets, naturals, totals, saved, failed, damages)
+        ]
+
+    # =========================
+    # ATAQUES
+    # =========================
+
+    def _prepare_attacks(self, state: GameState, attacker, targets: list):
+        """
+        Arma / ataque y reparto por alcance, antes de declarar el efecto.
+        Devuelve el area_failed si no hay con qué atacar o nadie está al alcance.
+        """
+        cmd = self.command
+
+        # Mismo arma/ataque que AttackAction
+        if isinstance(attacker, Enemy):
+            if cmd.attack_name:
+                try:
+                    weapon = attacker.get_attack(cmd.attack_name)
+                except ValueError:
+                    return self._fail(state, attacker.id, f"Unknown attack '{cmd.attack_name}'")
+            else:
+                weapon = attacker.choose_attack(targets[0])
+        else:
+            weapon = getattr(attacker, "weapon", None)
+            if weapon is None:
+                return self._fail(state, attacker.id, "No weapon equipped")
+
+        # Objetivos fuera de alcance no participan de la tirada
+        in_range, out_of_range, roll_kinds = [], [], []
+        weapon_range = getattr(weapon, "range", 5)
+        for target in targets:
+            melee = weapon_range <= 5
+            if hasattr(attacker, "position") and hasattr(target, "position"):
+                ax, ay = attacker.position
+                tx, ty = target.position
+                distance_feet = (abs(tx - ax) + abs(ty - ay)) * 5
+                if distance_feet > weapon_range:
+                    out_of_range.append(target)
+                    continue
+                melee = distance_feet <= 5
+            in_range.append(target)
+            roll_kinds.append(Roll.ATTACK_MELEE if melee else Roll.ATTACK_RANGED)
+        if not in_range:
+            return self._fail(state, attacker.id, "Target out of range")
+        return weapon, in_range, roll_kinds, out_of_range
+
+    def _resolve_attacks(self, state: GameState, attacker, attacker_conditions: int, attack: tuple) -> list[dict]:
+        cmd = self.command
+        weapon, in_range, roll_kinds, out_of_range = attack
+
+        # Mismo bonus que AttackAction
+        if isinstance(attacker, Enemy):
+            stat_mod = 0
+        else:
+            stat_mod = state.query(
+                GetStatModifier(actor_id=attacker.id, attribute=weapon.attribute)
+            ).value
+
+        is_proficient = (
+            isinstance(attacker, Character)
+            and isinstance(weapon, Weapon)
+            and weapon.proficiency_type in attacker.dnd_class.weapon_proficiencies
+        )
+        proficiency_bonus = state.query(GetProficiencyBonus(actor_id=attacker.id)).value if is_proficient else 0
+        attack_bonus = _weapon_attack_bonus(weapon) + stat_mod + proficiency_bonus
+
+        armor = state.query(GetArmorClassBatch(
+            actor_ids=tuple(t.id for t in in_range),
+            context="attack"
+        )).values
+        target_acs = [armor[t.id].value for t in in_range]
+
+        # Ventaja / desventaja y crítico automático según las condiciones de cada objetivo
+        modes, auto_crit = [], []
+        for target, roll_kind in zip(in_range, roll_kinds):
+            target_conditions = condition_mask(target)
+            advantage, disadvantage = roll_mode(roll_kind, attacker_conditions, target_conditions)
+            modes.append((cmd.advantage or advantage, cmd.disadvantage or disadvantage))
+            auto_crit.append(auto_critical(roll_kind, target_conditions))
+
+        naturals = _roll_d20s_by_mode(state, modes)
+
+        if np is not None:
+            rolled = np.asarray(naturals)
+            critical = rolled == 20
+            hit = critical | (rolled + attack_bonus >= np.asarray(target_acs))
+            critical |= hit & np.asarray(auto_crit, dtype=bool)
+            critical, hit = critical.tolist(), hit.tolist()
+        else:
+            critical = [n == 20 for n in naturals]
+            hit = [c or n + attack_bonus >= ac for c, n, ac in zip(critical, naturals, target_acs)]
+            critical = [c or (h and a) for c, h, a in zip(critical, hit, auto_crit)]
+
+        # Un solo daño para todos los impactos, y uno crítico si hubo alguno
+        dice = cmd.damage_dice or str(weapon.damage_dice)
+        damage = self._roll_damage(state, attacker, dice, critical=False) + stat_mod if any(hit) else 0
+        critical_damage = self._roll_damage(state, attacker, dice, critical=True) + stat_mod if any(critical) else 0
+
+        results = [
+            {
+                "target_id": target.id,
+                "natural_roll": natural,
+                "total": natural + attack_bonus,
+                "target_ac": ac,
+                "hit": h,
+                "critical": c,
+                "damage": critical_damage if c else (damage if h else 0)
+            }
+            for target, natural, ac, h, c in zip(in_range, naturals, target_acs, hit, critical)
+        ]
+        results.extend(
+            {
+                "target_id": target.id,
+                "hit": False,
+                "critical": False,
+                "damage": 0,
+                "reason": "Target out of range"
+            }
+            for target in out_of_range
+        )
+        return results
+
+    def _roll_damage(self, state: GameState, attacker, dice: str, critical: bool) -> int:
+        return RollAction(RollCommand(
+            actor_id=attacker.id,
+            dice=dice,
+            reason="area_damage",
+            critical=critical
+        )).execute(state)["total"]
+
+
+def _already_acted(actor) -> bool:
+    """Un minion tiene una sola acción aunque el grupo tenga una por miembro"""
+    return isinstance(actor, Minion) and actor.group.has_acted(actor.index)
+
+
+def _spend_action(resources: dict, actor) -> None:
+    resources["action"] -= 1
+    if isinstance(actor, Minion):
+        actor.group.mark_acted(actor.index)
+
+
+def _weapon_attack_bonus(weapon) -> int:
+    """Bonus de ataque del arma; el de un EnemyAttack ya es el total del stat block"""
+    if isinstance(weapon, EnemyAttack):
+        return weapon.attack_bonus
+    return getattr(weapon, "bonus", 0)
+
+
+_D20 = compile_dice("1d20")
+
+
+def _roll_d20s(state: GameState, n: int, advantage: bool = False, disadvantage: bool = False) -> list[int]:
+    """n tiradas de d20 del RNG de la campaña, vectorizadas si hay NumPy"""
+    if np is not None:
+        return _D20.roll_batch(
+            n,
+            generator=state.rng.generator,
+            advantage=advantage,
+            disadvantage=disadvantage
+        ).tolist()
+    return [
+        _D20.roll(state.rng, advantage=advantage, disadvantage=disadvantage).total
+        for _ in range(n)
+    ]
+
+
+def _roll_d20s_by_mode(state: GameState, modes: list[tuple[bool, bool]]) -> list[int]:
+    """
+    Un d20 por (ventaja, desventaja): una tirada vectorizada por cada modo.
+    Si todos comparten modo es exactamente una llamada a _roll_d20s.
+    """
+    naturals = [0] * len(modes)
+    by_mode: dict[tuple[bool, bool], list[int]] = {}
+    for i, (advantage, disadvantage) in enumerate(modes):
+        # Ventaja y desventaja se anulan: mismo grupo que una tirada normal
+        mode = (advantage and not disadvantage, disadvantage and not advantage)
+        by_mode.setdefault(mode, []).append(i)
+
+    for (advantage, disadvantage), indexes in by_mode.items():
+        for i, natural in zip(indexes, _roll_d20s(state, len(indexes), advantage, disadvantage)):
+            naturals[i] = natural
+    return naturals
+
+
 class StatusAction(Action):
     def __init__(self, command: StatusCommand):
         self.command = command
@@ -342,6 +743,33 @@ class StatusAction(Action):
         state.dispatch(event)
         return event
 
+class TickEffectAction(Action):
+    def __init__(self, command: TickEffectCommand):
+        self.command = command
+
+    def execute(self, state: GameState) -> Event:
+        if self.command.kind not in ("damage", "heal"):
+            raise RuntimeError(f"Tipo de efecto inválido '{self.command.kind}'")
+        # Validar la expresión antes de programar nada
+        compile_dice(self.command.dice)
+
+        event = Event(
+            type="tick_effect_requested",
+            context=EventContext(
+                actor_id=self.command.actor_id,
+                target_id=self.command.target_id
+            ),
+            payload={
+                "name": self.command.name,
+                "dice": self.command.dice,
+                "kind": self.command.kind,
+                "duration_turns": self.command.duration_turns
+            },
+            cancelable=True
+        )
+        state.dispatch(event)
+        return event
+
 class CreateEnemyAction(Action):
     def __init__(self, command: CreateEnemyCommand):
         self.command = command
@@ -386,19 +814,17 @@ class StartCombatAction(Action):
                 continue
 
             # Tirada de iniciativa (1d20 + DEX mod)
-            roll = random.randint(1, 20)
+            roll = state.rng.randint(1, 20)
 
             dex_mod = state.query(
                 GetStatModifier(actor_id=actor.id, attribute="DEX")
             ).value
 
             total = roll + dex_mod
-            initiatives.append((actor.id, total))
-
-        # Orden descendente
-        initiatives.sort(key=lambda x: x[1], reverse=True)
+            initiatives.append((actor.id, total, actor.attributes.get("DEX", 10)))
 
-        initiative_order = [actor_id for actor_id, _ in initiatives]
+        # Orden descendente, empates por DEX
+        initiative_order = sort_initiative(initiatives)
 
         event = Event(
             type="combat_started",
@@ -1,27 +1,126 @@
-from copy import deepcopy
+import sys
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from uuid import uuid4, UUID
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+from time import time
+from uuid import UUID
+from typing import Callable, Optional, Dict, Any
 from abc import ABC, abstractmethod
 
 from src.core.combat.phase import Phase
+from src.core.combat.initiative_tracker import InitiativeTracker
 from src.core.character.enemy import Enemy
+from src.core.character.minion_group import MinionGroup, split_member_id
 from src.core.base import Actor
 from src.core.game.query import Query, QueryHandler
+from src.core.game.event_log import EventLog
+from src.core.game.query_cache import QueryCache
+from src.core.game.modifiers import ModifierStackCache
+from src.core.game.rng import DiceRNG
+from src.core.game.effect_scheduler import EffectScheduler
+
+
+class EventTypeRegistry:
+    """
+    Registro interno de tipos de evento: cada string se interna una sola vez
+    y recibe un entero pequeño que usan dispatcher y log como clave.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: list[str] = []
+
+    def intern(self, name: str) -> int:
+        type_id = self._ids.get(name)
+        if type_id is None:
+            name = sys.intern(name)
+            type_id = len(self._names)
+            self._names.append(name)
+            self._ids[name] = type_id
+        return type_id
+
+    def name_of(self, type_id: int) -> str:
+        return self._names[type_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+EVENT_TYPES = EventTypeRegistry()
 
 
-@dataclass(frozen=True)
 class Event:
-    id: UUID = field(default_factory=uuid4)
-    type: str = ""
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    source: Optional[str] = None
-    context: Optional["EventContext"] = None
-    payload: Dict[str, Any] = field(default_factory=dict)
-    cancelable: bool = False
+    """
+    Evento de dominio compacto (__slots__).
+
+    - `id` es la secuencia monotónica de la campaña; la asigna el GameState
+      al registrar el evento (None para eventos que nunca se despacharon)
+    - `type` es un string internado y `type_id` su entero en EVENT_TYPES
+    - `payload` se crea al primer acceso y `timestamp` se materializa como
+      datetime solo si alguien lo pide
+    - si es `cancelable`, un handler puede llamar a `cancel()`: el dispatcher
+      deja de invocar handlers para ese evento y lo reporta en DispatchResult
+    """
+
+    __slots__ = (
+        "id", "type", "type_id", "source", "context", "cancelable",
+        "cancelled", "cancel_reason", "_payload", "_created_at",
+    )
 
-@dataclass
+    def __init__(
+        self,
+        type: str = "",
+        source: Optional[str] = None,
+        context: Optional["EventContext"] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        cancelable: bool = False,
+        id: Optional[int] = None,
+    ):
+        self.id = id
+        self.type_id = EVENT_TYPES.intern(type)
+        self.type = EVENT_TYPES.name_of(self.type_id)
+        self.source = source
+        self.context = context
+        self.cancelable = cancelable
+        self.cancelled = False
+        self.cancel_reason: Optional[str] = None
+        self._payload = payload
+        self._created_at = time()
+
+    def cancel(self, reason: Optional[str] = None) -> bool:
+        """Marca el evento como cancelado. Devuelve False si no es cancelable."""
+        if not self.cancelable:
+            return False
+        self.cancelled = True
+        self.cancel_reason = reason
+        return True
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        if self._payload is None:
+            self._payload = {}
+        return self._payload
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self._created_at, tz=timezone.utc)
+
+    def __getstate__(self):
+        # type_id depende del proceso: se serializa el nombre y se re-interna al cargar
+        return (self.id, self.type, self.source, self.context, self.cancelable, self._payload, self._created_at)
+
+    def __setstate__(self, state) -> None:
+        self.id, type_name, self.source, self.context, self.cancelable, self._payload, self._created_at = state
+        self.cancelled = False
+        self.cancel_reason = None
+        self.type_id = EVENT_TYPES.intern(type_name)
+        self.type = EVENT_TYPES.name_of(self.type_id)
+
+    def __repr__(self) -> str:
+        return f"Event(id={self.id!r}, type={self.type!r}, context={self.context!r}, payload={self._payload!r})"
+
+
+@dataclass(slots=True)
 class EventContext:
     actor_id: Optional[UUID] = None
     target_id: Optional[UUID] = None
@@ -30,34 +129,86 @@ class EventContext:
     phase: Optional[str] = None
     location_id: Optional[str] = None
 
+
+@dataclass(slots=True)
+class DispatchResult:
+    """Resultado de GameState.dispatch para el evento raíz"""
+    event: "Event"
+    cancelled: bool = False
+    reason: Optional[str] = None
+    processed: int = 0       # eventos procesados en la cadena (raíz incluido)
+    queued: bool = False     # True si se encoló dentro de otra cadena en curso
+
+FeatureChains = Dict[int, list[Callable[["Event", "GameState"], Optional["Event"]]]]
+
+
 class EventDispatcher:
     def __init__(self):
-        self._handlers: Dict[str, list[EventHandler]] = {}
+        # Claves: type_id de EVENT_TYPES
+        self._handlers: Dict[int, list[EventHandler]] = {}
+        # actor_id -> (lista de features, features_version, {type_id: [on_event, ...]})
+        self._feature_chains: Dict[UUID, tuple[list, int, FeatureChains]] = {}
 
     def register(self, event_type: str, handler: "EventHandler"):
         """Registrar handlers globales por tipo de evento"""
-        self._handlers.setdefault(event_type, []).append(handler)
+        self._handlers.setdefault(EVENT_TYPES.intern(event_type), []).append(handler)
+
+    def feature_chain(self, actor: "Actor", type_id: int) -> list:
+        """
+        Devuelve los on_event de las features del actor suscritas al tipo de evento.
+        Las cadenas se construyen una vez por actor y solo se reconstruyen
+        cuando cambia actor.features_version o el actor fue reemplazado por
+        otro objeto con el mismo id (ej: al cargar un snapshot).
+        """
+        features = actor.features
+        version = getattr(actor, "features_version", 0)
+        cached = self._feature_chains.get(actor.id)
+        if cached is None or cached[0] is not features or cached[1] != version:
+            cached = (features, version, self._build_feature_chains(actor))
+            self._feature_chains[actor.id] = cached
+        return cached[2].get(type_id, [])
+
+    def clear_feature_chains(self) -> None:
+        self._feature_chains.clear()
+
+    def has_listeners(self, event_type: str, actor) -> bool:
+        """True si algún handler global o feature del actor escucharía el evento"""
+        type_id = EVENT_TYPES.intern(event_type)
+        if self._handlers.get(type_id):
+            return True
+        return hasattr(actor, "features") and bool(self.feature_chain(actor, type_id))
+
+    @staticmethod
+    def _build_feature_chains(actor: "Actor") -> FeatureChains:
+        chains: FeatureChains = {}
+        for feature in actor.features:
+            for event_type in getattr(feature, "event_types", ()):
+                chains.setdefault(EVENT_TYPES.intern(event_type), []).append(feature.on_event)
+        return chains
 
     def dispatch(self, event: "Event", state: "GameState"):
         """Despacha un evento a handlers globales y a features del actor"""
-        # 1️⃣ Registrar el evento
-        state.event_log.append(event)
-        # 2️⃣ Ejecutar handlers globales
-        for handler in self._handlers.get(event.type, []):
+        # 1️⃣ Registrar el evento (una sola vez)
+        state.record_event(event)
+        # 2️⃣ Ejecutar handlers globales (un evento cancelado corta la cadena)
+        for handler in self._handlers.get(event.type_id, ()):
+            if event.cancelled:
+                return
             handler.handle(event, state)
 
-        # 3️⃣ Ejecutar features del actor objetivo
-        actor_id = getattr(event.context, "actor_id", None)
-        if actor_id is not None:
-            actor = state.characters.get(actor_id)
+        # 3️⃣ Ejecutar features del actor suscritas a este tipo de evento
+        ctx = event.context
+        if ctx is not None and ctx.actor_id is not None:
+            actor = state.characters.get(ctx.actor_id)
             if actor:
-                for feature in actor.features:
+                for on_event in self.feature_chain(actor, event.type_id):
+                    if event.cancelled:
+                        return
                     # Cada feature puede interceptar o ignorar
-                    new_event = getattr(feature, "on_event", lambda e, s: None)(event, state)
+                    new_event = on_event(event, state)
                     if new_event:
-                        # Re-emite el evento encadenado
-                        self.dispatch(new_event, state)
-
+                        # Encola el evento encadenado
+                        state.dispatch(new_event)
 
 
 class EventHandler(ABC):
@@ -66,12 +217,30 @@ class EventHandler(ABC):
         pass
 
 
+class EventSink(ABC):
+    """
+    Observador de todos los eventos registrados en un GameState (journal, métricas...).
+    No participa en las reglas: solo recibe los eventos ya despachados.
+    """
+
+    @abstractmethod
+    def on_event(self, event: "Event", depth: int) -> None:
+        """depth = 0 para eventos raíz, > 0 para eventos encadenados por handlers"""
+        pass
+
+    def on_commit(self, state: "GameState") -> None:
+        """Se llama cuando termina de procesarse un evento raíz"""
+        pass
+
+
 @dataclass
 class GameState:
     
     characters: Dict[UUID, "Actor"] = field(default_factory=dict)
     tokens: Dict[UUID, dict] = field(default_factory=dict)
     enemies: Dict[UUID, "Enemy"] = field(default_factory=dict)
+    # Grupos de enemigos idénticos (un lugar de iniciativa por grupo)
+    minion_groups: Dict[UUID, MinionGroup] = field(default_factory=dict)
     # NUEVO: recursos por actor
     resources: dict[UUID, dict[str, int]] = field(default_factory=dict)
     # Flujo global
@@ -80,12 +249,65 @@ class GameState:
     current_phase: Optional[Phase] = None  # combat | exploration | rest | dialogue
     current_day: int = 0
     # Orden de iniciativa (solo relevante en combate)
-    initiative_order: list[UUID] = field(default_factory=list)
+    initiative: InitiativeTracker = field(default_factory=InitiativeTracker)
     dispatcher: "EventDispatcher" = field(default_factory=lambda: EventDispatcher())
-    # Event sourcing light
-    event_log: list["Event"] = field(default_factory=list)
+    # Event sourcing light: log indexado y con retención acotada
+    event_log: EventLog = field(default_factory=EventLog)
     _handlers: dict = field(default_factory=dict)
     _query_handlers: dict = field(default_factory=dict)  # <QueryType, Handler>
+    # Observadores de eventos (journal en disco, etc.)
+    event_sinks: list["EventSink"] = field(default_factory=list)
+    # Cola de eventos encadenados del dispatch en curso: (evento, profundidad)
+    _pending: deque = field(default_factory=deque)
+    _dispatching: bool = False
+    _current_depth: int = 0
+    # Último id de evento asignado (secuencia monotónica de la campaña)
+    last_event_id: int = 0
+    # Versión del estado visible para los clientes: sube una vez por cada
+    # lote de cambios (deltas) que se publica
+    version: int = 0
+    # Resultados memoizados de queries cacheables (AC, modificadores, competencia)
+    query_cache: QueryCache = field(default_factory=QueryCache)
+    # Stacks de modificadores pasivos compilados por actor
+    modifier_stacks: ModifierStackCache = field(default_factory=ModifierStackCache)
+    # RNG de la campaña: toda tirada sale de acá (semilla registrada en rng_seeded)
+    rng: DiceRNG = field(default_factory=DiceRNG)
+    # Vencimientos de estados y ticks de daño/curación (por turno)
+    effects: EffectScheduler = field(default_factory=EffectScheduler)
+
+    # Presupuestos de una cadena de eventos (protegen contra handlers en bucle)
+    MAX_EVENT_DEPTH = 32
+    MAX_EVENTS_PER_DISPATCH = 4096
+
+    # Campos que forman parte de un snapshot del estado de juego
+    SNAPSHOT_FIELDS = (
+        "characters",
+        "enemies",
+        "minion_groups",
+        "tokens",
+        "resources",
+        "current_turn",
+        "current_actor",
+        "current_phase",
+        "current_day",
+        "initiative",
+        "last_event_id",
+        "version",
+        "rng",
+        "effects",
+    )
+
+    @property
+    def initiative_order(self) -> list[UUID]:
+        """Orden de iniciativa como lista (copia de solo lectura del tracker)"""
+        return list(self.initiative)
+
+    @initiative_order.setter
+    def initiative_order(self, order: list[UUID]) -> None:
+        self.initiative = InitiativeTracker.from_order(order, self.team_of)
+
+    def team_of(self, actor_id: UUID) -> str:
+        return "players" if actor_id in self.characters else "enemies"
 
     def register_handler(self, event_type: str, handler: EventHandler):
         self._handlers.setdefault(event_type, []).append(handler)
@@ -97,63 +319,177 @@ class GameState:
         handler = self._query_handlers.get(type(query))
         if handler is None:
             raise RuntimeError(f"No hay handler registrado para query {type(query).__name__}")
-        return handler.handle(query, self)
 
+        if not query.cacheable:
+            return handler.handle(query, self)
 
-    def dispatch(self, event: Event):
-        """Usar dispatcher para ejecutar handlers globales y features de actores"""
-        self.event_log.append(event)
-        self.dispatcher.dispatch(event, self)
+        # Queries por actor: se sirven desde la caché mientras no cambien sus entradas
+        actor = self.get_actor(query.actor_id)  # type: ignore[attr-defined]
+        cached = self.query_cache.get(query, actor)
+        if cached is not None:
+            return cached
+        result = handler.handle(query, self)
+        self.query_cache.put(query, actor, result)
+        return result
+
+
+    def dispatch(self, event: Event) -> DispatchResult:
+        """
+        Usar dispatcher para ejecutar handlers globales y features de actores.
+
+        Los eventos emitidos por handlers durante el proceso no se ejecutan
+        de forma recursiva: se encolan y se procesan en orden FIFO al terminar
+        el evento actual, con límite de profundidad y de eventos por cadena.
+        """
+        if self._dispatching:
+            depth = self._current_depth + 1
+            if depth > self.MAX_EVENT_DEPTH:
+                raise RuntimeError(
+                    f"Cadena de eventos demasiado profunda ({depth}) al emitir '{event.type}'"
+                )
+            self._pending.append((event, depth))
+            return DispatchResult(event=event, queued=True)
+
+        self._dispatching = True
+        processed = 0
+        pending = self._pending
+        pending.append((event, 0))
+        try:
+            while pending:
+                current, depth = pending.popleft()
+                processed += 1
+                if processed > self.MAX_EVENTS_PER_DISPATCH:
+                    raise RuntimeError(
+                        f"La cadena de '{event.type}' excedió {self.MAX_EVENTS_PER_DISPATCH} eventos"
+                    )
+                self._current_depth = depth
+                self.dispatcher.dispatch(current, self)
+        finally:
+            self._dispatching = False
+            self._current_depth = 0
+            pending.clear()
+
+        for sink in self.event_sinks:
+            sink.on_commit(self)
+
+        return DispatchResult(
+            event=event,
+            cancelled=event.cancelled,
+            reason=event.cancel_reason,
+            processed=processed
+        )
+
+    def seed_rng(self, seed: Optional[int] = None) -> int:
+        """
+        Fija la semilla del RNG de la campaña a través del evento `rng_seeded`,
+        de modo que quede en el journal y una repetición use la misma secuencia.
+        """
+        if seed is None:
+            seed = DiceRNG().seed
+        self.dispatch(Event(
+            type="rng_seeded",
+            payload={"seed": seed},
+            cancelable=False
+        ))
+        return seed
+
+    def record_event(self, event: Event) -> None:
+        """Registra un evento en el log, indexado por el turno actual"""
+        if event.id is None:
+            self.last_event_id += 1
+            event.id = self.last_event_id
+        self.event_log.append(event, turn=self.current_turn)
+        self.query_cache.on_event(event)
+        for sink in self.event_sinks:
+            sink.on_event(event, self._current_depth)
+
+    def to_snapshot(self) -> dict:
+        """Estado de juego sin infraestructura (dispatcher, handlers, log)"""
+        return {name: getattr(self, name) for name in self.SNAPSHOT_FIELDS}
+
+    def load_snapshot(self, snapshot: dict) -> None:
+        for name in self.SNAPSHOT_FIELDS:
+            if name in snapshot:
+                setattr(self, name, snapshot[name])
+        if "effects" not in snapshot:
+            # Snapshot previo al scheduler: los contadores estaban en actor.status
+            self.effects = EffectScheduler.from_statuses(self.iter_combatants())
+        # Los actores fueron reemplazados: nada de lo cacheado sigue valiendo
+        self.query_cache.clear()
+        self.modifier_stacks.clear()
+        self.dispatcher.clear_feature_chains()
 
     def run_readonly_event(self, root_event: Event) -> list[Event]:
         """
         Ejecuta un evento como simulación:
         - No altera el estado original del GameState
         - Permite que handlers y features modifiquen resultados temporalmente
+
+        Los handlers trabajan sobre una ShadowState copy-on-write: solo se copian
+        los actores que realmente se leen, así que el costo no depende del
+        tamaño de la campaña ni del largo del event_log.
+        """
+        return self.run_readonly_events([root_event])[0]
+
+    def run_readonly_events(self, root_events: list[Event]) -> list[list[Event]]:
+        """
+        Igual que run_readonly_event pero para varios eventos raíz sobre una
+        única ShadowState (consultas batch). Devuelve, por cada evento raíz,
+        la lista de eventos que produjo su simulación.
         """
-        shadow_state = deepcopy(self)
-        collected: list[Event] = []
+        if not root_events:
+            return []
 
-        # Wrapper temporal para registrar eventos en la lista local
-        original_log = shadow_state.event_log
-        shadow_state.event_log = collected  # en vez de mutar event_log real
+        from src.core.game.shadow_state import ShadowState
 
-        # Usar el dispatcher original
-        self.dispatcher.dispatch(root_event, shadow_state)
+        shadow_state = ShadowState(self)
+        collected = []
+
+        # Mismo dispatcher; los eventos quedan en el log de la sombra
+        for root_event in root_events:
+            start = len(shadow_state.event_log)
+            shadow_state.dispatch(root_event)
+            collected.append(shadow_state.event_log[start:])
 
         return collected
 
     def end_turn(self):
+        """
+        Fin de turno: aplica los ticks (daño/curación) del actor que termina
+        y vence solo los estados programados para este turno.
+        """
         expired_states = []
 
-        for char in self.characters.values():
-            if not hasattr(char, "status"):
+        # Ticks del lugar de iniciativa que termina su turno
+        for effect in self.effects.due_ticks(self.current_actor):
+            self.dispatch(Event(
+                type="effect_tick",
+                context=EventContext(actor_id=effect.actor_id),
+                payload={
+                    "effect_id": effect.id,
+                    "name": effect.name,
+                    "dice": effect.dice,
+                    "kind": effect.kind,
+                    "source_id": effect.source_id,
+                    "remaining": effect.remaining
+                },
+                cancelable=True
+            ))
+
+        for actor_id, status in self.effects.advance():
+            actor = self.get_actor(actor_id)
+            if actor is None:
                 continue
+            if not remove_status(actor, status):
+                continue
+            expired_states.append((actor_id, status))
 
-            to_remove = []
-
-            for status, data in char.status.items():
-                # Validación dura
-                if not isinstance(data, dict) or "turns" not in data:
-                    raise RuntimeError(
-                        f"Estado inválido '{status}' en actor {char.id}: {data}"
-                    )
-
-                data["turns"] -= 1
-
-                if data["turns"] <= 0:
-                    to_remove.append(status)
-
-            for status in to_remove:
-                del char.status[status]
-                expired_states.append((char.id, status))
-
-                self.dispatch(Event(
-                    type="status_expired",
-                    context=EventContext(actor_id=char.id),
-                    payload={"status": status},
-                    cancelable=False
-                ))
+            self.dispatch(Event(
+                type="status_expired",
+                context=EventContext(actor_id=actor_id),
+                payload={"status": status},
+                cancelable=False
+            ))
 
         self.dispatch(Event(
             type="end_turn",
@@ -175,6 +511,10 @@ class GameState:
         if not enemy.id in self.enemies:
             self.enemies[enemy.id] = enemy
 
+    def add_minion_group(self, group: MinionGroup):
+        if not group.id in self.minion_groups:
+            self.minion_groups[group.id] = group
+
     def move_token(self, token_id: UUID, x: int, y: int):
         token = self.tokens[token_id]
         if not token:
@@ -203,7 +543,21 @@ class GameState:
             return self.characters[actor_id]
         if actor_id in self.enemies:
             return self.enemies[actor_id]
+        if self.minion_groups:
+            return self._get_minion(actor_id)
         return None
+
+    def _get_minion(self, actor_id):
+        """Id de grupo -> el grupo; id de miembro -> vista Minion sobre los arrays"""
+        if not isinstance(actor_id, UUID):
+            return None
+        group_id, index = split_member_id(actor_id)
+        group = self.minion_groups.get(group_id)
+        if group is None:
+            return None
+        if index < 0:
+            return group
+        return group.member(index) if index < group.count else None
     
     def iter_combatants(self):
         for character in self.characters.values():
@@ -212,6 +566,25 @@ class GameState:
         for enemy in self.enemies.values():
             yield enemy
 
+        for group in self.minion_groups.values():
+            yield group
+
+
+def remove_status(actor, status: str) -> bool:
+    """Quita un estado de cualquier actor (los minions lo guardan como condición del grupo)"""
+    group = getattr(actor, "group", None)
+    if group is not None:
+        if not group.has_condition(actor.index, status):
+            return False
+        group.remove_condition(actor.index, status)
+        return True
+
+    statuses = getattr(actor, "status", None)
+    if not statuses or status not in statuses:
+        return False
+    del statuses[status]
+    return True
+
 def LongRestEvent(actor_id):
     return Event(
         type="long_rest",
@@ -219,9 +592,27 @@ def LongRestEvent(actor_id):
         cancelable=False
     )
 
+def InventoryChangedEvent(actor_id: UUID, item_id: str, change: str):
+    """Cambio de inventario hecho desde la UI: "equipped" | "unequipped" | "added" """
+    return Event(
+        type="inventory_changed",
+        context=EventContext(actor_id=actor_id),
+        payload={"item_id": item_id, "change": change},
+        cancelable=False
+    )
+
 def MoveTokenEvent(token_id: UUID, x: int, y: int):
     return Event(
         type="token_moved",
         payload={"token_id": token_id, "x": x, "y": y},
         cancelable=False
     )
+
+
+def MoveTokensEvent(moves: list[dict]):
+    """Lote de movimientos de un tick: [{"token_id", "x", "y"}, ...]"""
+    return Event(
+        type="tokens_moved",
+        payload={"moves": moves},
+        cancelable=False
+    )
@@ -1,11 +1,13 @@
-import random
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from src.core.combat.phase import Phase
 from src.core.character.enemy import Enemy, EnemyAttack
+from src.core.character.minion_group import MinionGroup
 from src.features.world.domain.token import Token
 from src.core.game.Event import Event, EventContext, EventHandler, GameState
+from src.core.game.rng import DiceRNG
+from src.core.game.dice import compile_dice
 from src.core.character.ProgresionSystem import ProgressionSystem
 
 
@@ -24,55 +26,74 @@ class ApplyDamageHandler(EventHandler):
         if event.type != "attack_hit":
             return
 
-        target_id = event.payload["target_id"]
-        damage = event.payload["damage"]
+        if apply_damage(state, event.payload["target_id"], event.payload["damage"]):
+            check_combat_over(state)
 
-        target = state.get_actor(target_id)
-        if target is None:
-            return
 
-        target.hp -= damage
+class AreaDamageHandler(EventHandler):
+    """Aplica el daño de un efecto de área: todos los objetivos en un solo evento"""
 
-        if target.hp > 0:
-            return
+    def handle(self, event: Event, state: GameState) -> None:
 
-        # Clamp
-        target.hp = 0
+        if event.type != "area_damage":
+            return
 
-        # Remover de iniciativa
-        if target.id in state.initiative_order:
-            state.initiative_order.remove(target.id)
-
-        # Emitir evento de muerte
-        state.dispatch(Event(
-            type="entity_killed",
-            context=EventContext(actor_id=target.id),
-            payload={},
-            cancelable=False
-        ))
-        
-        # Verificar fin de combate
-        if state.current_phase == Phase.COMBAT:
-            alive = [
-                state.get_actor(a_id)
-                for a_id in state.initiative_order
-            ]
-
-            # Separar equipos
-            players_alive = any(a_id in state.characters for a_id in state.initiative_order)
-            enemies_alive = any(a_id in state.enemies for a_id in state.initiative_order)
-
-            if not players_alive or not enemies_alive:
-                state.dispatch(Event(
-                    type="combat_ended",
-                    context=EventContext(),
-                    payload={},
-                    cancelable=False
-                ))
+        killed = False
+        for result in event.payload["results"]:
+            if result["damage"] > 0:
+                killed = apply_damage(state, result["target_id"], result["damage"]) or killed
+
+        # Una sola verificación de fin de combate para todo el lote
+        if killed:
+            check_combat_over(state)
+
+
+def apply_damage(state: GameState, target_id, damage: int) -> bool:
+    """Resta HP al objetivo. Devuelve True si murió (y lo saca de la iniciativa)."""
+    target = state.get_actor(target_id)
+    if target is None:
+        return False
+
+    target.hp -= damage
+
+    if target.hp > 0:
+        return False
+
+    # Clamp
+    target.hp = 0
+
+    # Remover de iniciativa (un minion solo libera el lugar de su grupo
+    # cuando cae el último miembro)
+    group = getattr(target, "group", None)
+    if group is None:
+        state.initiative.remove(target.id)
+    elif group.alive == 0:
+        state.initiative.remove(group.id)
+
+    # Emitir evento de muerte
+    state.dispatch(Event(
+        type="entity_killed",
+        context=EventContext(actor_id=target.id),
+        payload={},
+        cancelable=False
+    ))
+    return True
+
+
+def check_combat_over(state: GameState) -> None:
+    # Verificar fin de combate (contadores por equipo del tracker)
+    if state.current_phase == Phase.COMBAT:
+        if state.initiative.is_combat_over():
+            state.dispatch(Event(
+                type="combat_ended",
+                context=EventContext(),
+                payload={},
+                cancelable=False
+            ))
 
 class RageDamageHandler(EventHandler):
     def handle(self, event, state):
-        if event.type != "attack_hit":
+        if event.type not in ("attack_hit", "area_damage"):
             return
         ctx = event.context
         if ctx is None or ctx.actor_id is None:
@@ -86,9 +107,25 @@ class RageDamageHandler(EventHandler):
             return
         bonus = state.resources[actor.id]["rage_bonus"]
 
-        event.payload["damage"] += bonus
+        if event.type == "attack_hit":
+            event.payload["damage"] += bonus
+            return
+
+        # Área: solo los golpes de arma (cleave) suman furia, no los conjuros
+        if event.payload.get("mode") != "attack":
+            return
+        for result in event.payload["results"]:
+            if result["hit"]:
+                result["damage"] += bonus
 
         
+class RngSeededHandler(EventHandler):
+    def handle(self, event: Event, state: GameState) -> None:
+        if event.type != "rng_seeded":
+            return
+        state.rng = DiceRNG(seed=event.payload["seed"])
+
+
 class BardicInspirationHandler(EventHandler):
     def handle(self, event: Event, state: GameState) -> None:
         if event.type != "roll_result":
@@ -109,7 +146,7 @@ class BardicInspirationHandler(EventHandler):
         if not actor.has_bardic_inspiration:
             return
 
-        bonus = actor.consume_bardic_inspiration()
+        bonus = actor.consume_bardic_inspiration(state.rng)
 
         modified_event = Event(
             type="roll_modified",
@@ -122,7 +159,7 @@ class BardicInspirationHandler(EventHandler):
             }
         )
 
-        state.event_log.append(modified_event)
+        state.record_event(modified_event)
 
 
 class ApplyStatusHandler(EventHandler):
@@ -134,16 +171,23 @@ class ApplyStatusHandler(EventHandler):
         if ctx is None or ctx.target_id is None:
             return
 
-        target = state.characters.get(ctx.target_id)
+        target = state.get_actor(ctx.target_id)
         if target is None:
             return
 
-        if not hasattr(target, "status"):
-            target.status = {}
+        status = event.payload["status"]
+        duration = event.payload["duration_turns"]
 
-        target.status[event.payload["status"]] = {
-            "turns":event.payload["duration_turns"]
-        }
+        # El vencimiento lo maneja el scheduler: end_turn no recorre actores.
+        # El estado guarda el tick absoluto en que vence (no un contador que
+        # habría que descontar en cada turno)
+        expires_at = state.effects.schedule_expiry(target.id, status, duration)
+
+        group = getattr(target, "group", None)
+        if group is not None:
+            group.add_condition(target.index, status)
+        else:
+            target.status[status] = {"expires_at": expires_at}
 
         state.dispatch(Event(
             type="status_applied",
@@ -154,42 +198,76 @@ class ApplyStatusHandler(EventHandler):
 
 
 
-class StunnedAttackHandler(EventHandler):
-    def handle(self, event: Event, state: "GameState"):
-        if event.type != "attack_roll":
-            return  # Solo nos interesa ataques
-        
+class ApplyTickEffectHandler(EventHandler):
+    def handle(self, event: Event, state: GameState):
+        if event.type != "tick_effect_requested":
+            return
 
-        if not event.context:
+        ctx = event.context
+        if ctx is None or ctx.target_id is None:
             return
-        attacker_id = event.context.actor_id
-        target_id = event.context.target_id
-        if not attacker_id or not target_id:
+
+        target = state.get_actor(ctx.target_id)
+        if target is None:
             return
-        
-        attacker = state.characters.get(attacker_id)
-        if attacker:
-            if hasattr(attacker, "status") and "aturdido" in attacker.status:
-                roll_result = event.payload  # asumimos que contiene info del roll
-                miss_event = Event(
-                    type="attack_miss",
-                    context=EventContext(actor_id=attacker_id, target_id=target_id),
-                    payload={
-                        "roll": roll_result.get("rolls"),
-                        "attack_score": roll_result.get("attack_score"),
-                        "stat_modifier": roll_result.get("stat_modifier"),
-                        "target_ac": roll_result.get("target_ac"),
-                        "reason": "aturdido",
-                    },
-                    cancelable=False
-                )
-
-                # Disparar el evento de ataque fallido
-                state.dispatch(miss_event)
-
-                # Cancelar el ataque original
-                raise RuntimeError("Ataque cancelado por aturdimiento")
-            
+
+        # Se aplica al final del turno del objetivo (del grupo, si es un minion)
+        slot = getattr(target, "initiative_id", target.id)
+        effect = state.effects.add_tick(
+            slot,
+            target.id,
+            name=event.payload["name"],
+            dice=event.payload["dice"],
+            kind=event.payload["kind"],
+            duration=event.payload["duration_turns"],
+            source_id=ctx.actor_id,
+        )
+
+        state.dispatch(Event(
+            type="tick_effect_applied",
+            context=ctx,
+            payload={**event.payload, "effect_id": effect.id},
+            cancelable=False
+        ))
+
+
+class EffectTickHandler(EventHandler):
+    def handle(self, event: Event, state: GameState):
+        if event.type != "effect_tick":
+            return
+
+        ctx = event.context
+        if ctx is None or ctx.actor_id is None:
+            return
+
+        target = state.get_actor(ctx.actor_id)
+        if target is None or target.hp <= 0:
+            return
+
+        amount = compile_dice(event.payload["dice"]).roll(state.rng).total
+
+        if event.payload["kind"] == "heal":
+            target.hp = min(target.max_hp, target.hp + amount)
+            died = False
+        else:
+            died = apply_damage(state, target.id, amount)
+
+        state.dispatch(Event(
+            type="effect_tick_applied",
+            context=ctx,
+            payload={
+                "name": event.payload["name"],
+                "kind": event.payload["kind"],
+                "amount": amount,
+                "hp": target.hp,
+                "target_died": died
+            },
+            cancelable=False
+        ))
+
+        if died:
+            check_combat_over(state)
+
 
 class EntityMovedHandler(EventHandler):
     def handle(self, event: Event, state: GameState) -> None:
@@ -212,6 +290,15 @@ class TokenMovedHandler(EventHandler):
             return
         state.move_token(event.payload["token_id"], event.payload["x"], event.payload["y"])
 
+class TokensMovedHandler(EventHandler):
+    def handle(self, event: Event, state: GameState) -> None:
+        if event.type != "tokens_moved":
+            return
+        for move in event.payload["moves"]:
+            # El token pudo desaparecer entre el pedido y el tick
+            if move["token_id"] in state.tokens:
+                state.move_token(move["token_id"], move["x"], move["y"])
+
 class SpatialActionValidator(EventHandler):
     def handle(self, event: Event, state: GameState) -> None:
         if event.type != "action_requested":
@@ -290,7 +377,7 @@ class InitiativeRollHandler(EventHandler):
 
         actor_id = event.context.actor_id
 
-        value = random.randint(1, 20)
+        value = state.rng.randint(1, 20)
 
         state.dispatch(Event(
             type="roll_result",
@@ -302,6 +389,51 @@ class InitiativeRollHandler(EventHandler):
             cancelable=False
         ))
 
+class CreateMinionGroupHandler(EventHandler):
+    """Un grupo de N enemigos idénticos: una plantilla, un token y un lugar de iniciativa"""
+    def handle(self, event: Event, state: GameState) -> None:
+        if event.type != "create_minion_group":
+            return
+
+        template = Enemy(
+            id=None,
+            owner_id=event.payload.get("owner_id"),
+            name=event.payload["name"],
+            hp=event.payload["hp"],
+            max_hp=event.payload["max_hp"],
+            ac=event.payload["ac"],
+            asset_url=event.payload["asset_url"],
+            size=tuple(event.payload["size"]),
+            attributes=event.payload.get("attributes"),
+            attacks=[EnemyAttack(**attack_dict) for attack_dict in event.payload.get("attacks", [])]
+        )
+        group = MinionGroup(
+            template=template,
+            count=event.payload["count"],
+            positions=event.payload.get("positions"),
+            id=UUID(event.payload["id"])
+        )
+        state.add_minion_group(group)
+
+        # Un único token para todo el grupo; las posiciones viven en el grupo
+        group_token = Token(
+            id=group.id,
+            actor_id=group.id,
+            x=group.x[0],
+            y=group.y[0],
+            size=template.size,
+            texture_url=template.asset_url,
+            label=f"{template.name} x{group.count}"
+        )
+        state.add_token(group_token.to_dict())
+
+        state.dispatch(Event(
+            type="minion_group_created",
+            context=EventContext(actor_id=group.id),
+            payload={"id": event.payload["id"], "count": group.count},
+            cancelable=False
+        ))
+
 class CombatStartedHandler(EventHandler):
 
     def handle(self, event, state):
@@ -312,18 +444,20 @@ class CombatStartedHandler(EventHandler):
         state.current_phase = Phase.COMBAT
         state.initiative_order = event.payload["initiative_order"]
         state.current_turn = 1
-        state.current_actor = state.initiative_order[0]
+        state.current_actor = state.initiative.first
 
         # Inicializar recursos
-        for actor_id in state.initiative_order:
+        for actor_id in state.initiative:
             actor = state.get_actor(actor_id)
 
             state.resources[actor_id] = {
-                "action": 1,
+                "action": getattr(actor, "action_count", 1),
                 "bonus_action": 1,
                 "movement": getattr(actor, "speed", 30),
                 "reaction": 1
             }
+            if isinstance(actor, MinionGroup):
+                actor.reset_turn_resources()
             
 class TurnStartHandler(EventHandler):
 
@@ -350,25 +484,25 @@ class TurnEndedHandler(EventHandler):
         if event.type != "turn_ended":
             return
 
-        current_index = state.initiative_order.index(state.current_actor) # type: ignore
-
-        next_index = current_index + 1
+        next_actor, new_round = state.initiative.next_of(state.current_actor) # type: ignore
 
-        if next_index >= len(state.initiative_order):
-            next_index = 0
+        if new_round:
             state.current_turn += 1
 
-        state.current_actor = state.initiative_order[next_index]
+        state.current_actor = next_actor
 
         # Reset recursos del nuevo actor
         actor = state.get_actor(state.current_actor)
 
         state.resources[state.current_actor] = {
-            "action": 1,
+            "action": getattr(actor, "action_count", 1),
             "bonus_action": 1,
             "movement": getattr(actor, "speed", 30),
             "reaction": 1
         }
+        # Las acciones del grupo son una por miembro: nadie actuó todavía
+        if isinstance(actor, MinionGroup):
+            actor.reset_turn_resources()
 
 class CombatEndHandler(EventHandler):
 
@@ -379,7 +513,9 @@ class CombatEndHandler(EventHandler):
 
         for combatant in state.iter_combatants():
             combatant.clear_combat_effects()
+        # Veneno, regeneración, etc. no siguen fuera de combate
+        state.effects.clear_ticks()
         state.current_phase = Phase.EXPLORATION
-        state.initiative_order.clear()
+        state.initiative.clear()
         state.current_actor = None
     
\ No newline at end of file
@@ -0,0 +1,40 @@
+from src.core.game.Event import GameState
+from src.core.game.EventHandlers import *
+from src.core.game.querys import *
+
+
+def register_core_rules(state: GameState) -> GameState:
+    """
+    Registra en el GameState los handlers de eventos y de queries de las
+    reglas base. Lo usan tanto las partidas en vivo (game_state_builder)
+    como el simulador de encuentros, así ambos corren exactamente las mismas reglas.
+    """
+    dispatcher = state.dispatcher
+
+    # Handlers de eventos
+    dispatcher.register("attack_hit", ApplyDamageHandler())
+    dispatcher.register("status_requested", ApplyStatusHandler())
+    dispatcher.register("tick_effect_requested", ApplyTickEffectHandler())
+    dispatcher.register("effect_tick", EffectTickHandler())
+    dispatcher.register("attack_hit", RageDamageHandler())
+    # En área la furia se suma antes de aplicar el daño del lote
+    dispatcher.register("area_damage", RageDamageHandler())
+    dispatcher.register("area_damage", AreaDamageHandler())
+    dispatcher.register("token_moved", TokenMovedHandler())
+    dispatcher.register("tokens_moved", TokensMovedHandler())
+    dispatcher.register("create_enemy", CreateEnemyHandler())
+    dispatcher.register("create_minion_group", CreateMinionGroupHandler())
+    dispatcher.register("combat_ended", CombatEndHandler())
+    dispatcher.register("turn_ended", TurnEndedHandler())
+    dispatcher.register("combat_started", CombatStartedHandler())
+    dispatcher.register("rng_seeded", RngSeededHandler())
+
+    # Handlers de queries
+    state.register_query_handler(GetArmorClass, GetArmorClassHandler())
+    state.register_query_handler(GetStatModifier, GetStatModifierHandler())
+    state.register_query_handler(GetEntities, GetEntitiesHandler())
+    state.register_query_handler(GetProficiencyBonus, GetProficiencyBonusHandler())
+    state.register_query_handler(GetArmorClassBatch, GetArmorClassBatchHandler())
+    state.register_query_handler(GetStatModifiersBatch, GetStatModifiersBatchHandler())
+
+    return state
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 from uuid import UUID
 
 @dataclass(frozen=True)
@@ -8,6 +9,7 @@ class RollCommand:
     reason: str           
     advantage: bool = False
     disadvantage: bool = False
+    critical: bool = False   # duplica los dados (golpe crítico)
 
 @dataclass(frozen=True)
 class AttackCommand:
@@ -18,6 +20,21 @@ class AttackCommand:
     disadvantage: bool
     attack_name: str = "attack"
 
+@dataclass(frozen=True)
+class AreaEffectCommand:
+    actor_id: UUID
+    target_ids: tuple[UUID, ...]
+    name: str                        # ej: "Fireball", "Breath Weapon", "Cleave"
+    mode: str = "save"               # "save" (salvación) | "attack" (tirada de ataque por objetivo)
+    damage_dice: str | None = None   # None en modo attack: usa el arma/ataque del actor
+    attack_name: str | None = None   # ataque de un enemigo en modo attack (None: el de más daño esperado)
+    damage_type: str = "fire"
+    save_attribute: str = "DEX"
+    save_dc: int = 10
+    half_on_save: bool = True
+    advantage: bool = False
+    disadvantage: bool = False
+
 @dataclass(frozen=True)
 class UseBardicInspirationCommand:
     source_id: UUID   # el bardo
@@ -44,6 +61,15 @@ class StatusCommand:
     status: str
     duration_turns: int = 1
 
+@dataclass(frozen=True)
+class TickEffectCommand:
+    actor_id: UUID
+    target_id: UUID
+    name: str                               # ej: "veneno", "regeneración"
+    dice: str                               # ej: "1d6"
+    kind: str = "damage"                    # "damage" | "heal"
+    duration_turns: Optional[int] = None    # None = hasta que termine el combate
+
 @dataclass(frozen=True)
 class CreateEnemyCommand:
     name:str
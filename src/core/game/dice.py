@@ -0,0 +1,224 @@
+"""
+Motor de expresiones de dados.
+
+Una expresión como "2d6+1d4-1", "4d6kh3" o "d20" se compila una sola vez
+(caché por string) a una DiceExpression inmutable que sabe tirarse:
+- de a una tirada, con ventaja/desventaja y crítico (dados duplicados)
+- en lote con NumPy, para simulaciones de miles de tiradas
+"""
+
+import random
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from math import comb
+from typing import Any, Optional
+
+_TERM_RE = re.compile(r"([+-]?)(?:(\d*)d(\d+)(?:(kh|kl)(\d+))?|(\d+))")
+
+
+@dataclass(frozen=True, slots=True)
+class DiceTerm:
+    """Término NdS de una expresión, opcionalmente conservando los K más altos/bajos"""
+    sign: int          # +1 o -1
+    count: int
+    size: int
+    keep: Optional[int] = None
+    keep_highest: bool = True
+
+    def __str__(self) -> str:
+        keep = f"{'kh' if self.keep_highest else 'kl'}{self.keep}" if self.keep is not None else ""
+        return f"{self.count}d{self.size}{keep}"
+
+
+@dataclass(slots=True)
+class DiceRoll:
+    """Resultado de una tirada: dados conservados (en orden de término) y total"""
+    rolls: list[int]
+    bonus: int
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class DiceExpression:
+    terms: tuple[DiceTerm, ...]
+    bonus: int = 0
+
+    def __str__(self) -> str:
+        out = ""
+        for term in self.terms:
+            out += ("-" if term.sign < 0 else ("+" if out else "")) + str(term)
+        if self.bonus:
+            out += f"{self.bonus:+d}" if out else str(self.bonus)
+        return out or "0"
+
+    # =========================
+    # PROPIEDADES
+    # =========================
+
+    @property
+    def min(self) -> int:
+        return self.bonus + sum(_kept(t) * (1 if t.sign > 0 else -t.size) for t in self.terms)
+
+    @property
+    def max(self) -> int:
+        return self.bonus + sum(_kept(t) * (t.size if t.sign > 0 else -1) for t in self.terms)
+
+    @property
+    def average(self) -> float:
+        """Valor esperado exacto (sin ventaja ni crítico)"""
+        return self.bonus + sum(t.sign * _term_average(t) for t in self.terms)
+
+    def critical(self) -> "DiceExpression":
+        """Misma expresión con los dados duplicados (golpe crítico de 5e)"""
+        return _critical(self)
+
+    # =========================
+    # TIRADAS
+    # =========================
+
+    def roll(
+        self,
+        rng: Any = random,
+        advantage: bool = False,
+        disadvantage: bool = False,
+        critical: bool = False,
+    ) -> DiceRoll:
+        """
+        Tira la expresión. Con ventaja/desventaja cada dado se tira dos veces
+        y se conserva el mayor/menor; ambas a la vez se anulan.
+        `rng` es cualquier objeto con random() (el módulo random por defecto).
+        """
+        expr = self.critical() if critical else self
+        mode = (advantage and not disadvantage) - (disadvantage and not advantage)
+        # random() + escala es bastante más barato que randint por dado
+        uniform = rng.random
+
+        rolls: list[int] = []
+        total = expr.bonus
+        for term in expr.terms:
+            size = term.size
+            if mode == 0:
+                dice = [int(uniform() * size) + 1 for _ in range(term.count)]
+            elif mode > 0:
+                dice = [int(max(uniform(), uniform()) * size) + 1 for _ in range(term.count)]
+            else:
+                dice = [int(min(uniform(), uniform()) * size) + 1 for _ in range(term.count)]
+
+            if term.keep is not None:
+                dice = sorted(dice, reverse=term.keep_highest)[:term.keep]
+
+            rolls.extend(dice)
+            total += term.sign * sum(dice)
+
+        return DiceRoll(rolls=rolls, bonus=expr.bonus, total=total)
+
+    def roll_batch(
+        self,
+        n: int,
+        generator: Any = None,
+        advantage: bool = False,
+        disadvantage: bool = False,
+        critical: bool = False,
+    ):
+        """
+        Tira la expresión n veces de forma vectorizada y devuelve un array
+        NumPy con los n totales. `generator` es un numpy.random.Generator.
+        Sin NumPy instalado cae a tiradas individuales (devuelve una lista).
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.roll(advantage=advantage, disadvantage=disadvantage, critical=critical).total for _ in range(n)]
+
+        expr = self.critical() if critical else self
+        mode = (advantage and not disadvantage) - (disadvantage and not advantage)
+        gen = generator if generator is not None else np.random.default_rng()
+
+        totals = np.full(n, expr.bonus, dtype=np.int64)
+        for term in expr.terms:
+            if mode == 0:
+                dice = gen.integers(1, term.size + 1, size=(n, term.count))
+            else:
+                pair = gen.integers(1, term.size + 1, size=(n, term.count, 2))
+                dice = pair.max(axis=2) if mode > 0 else pair.min(axis=2)
+
+            if term.keep is not None:
+                dice = np.sort(dice, axis=1)
+                dice = dice[:, -term.keep:] if term.keep_highest else dice[:, :term.keep]
+
+            totals += term.sign * dice.sum(axis=1)
+
+        return totals
+
+
+def _kept(term: DiceTerm) -> int:
+    return term.count if term.keep is None else min(term.keep, term.count)
+
+
+def _term_average(term: DiceTerm) -> float:
+    if term.keep is None or term.keep >= term.count:
+        return term.count * (term.size + 1) / 2
+
+    # Suma de esperanzas de los estadísticos de orden conservados:
+    # E[X_(j)] = Σ_x P(X_(j) >= x), con X_(j) el j-ésimo dado más bajo
+    n, size = term.count, term.size
+    kept = range(n - term.keep + 1, n + 1) if term.keep_highest else range(1, term.keep + 1)
+    expected = 0.0
+    for j in kept:
+        for x in range(1, size + 1):
+            p = (size - x + 1) / size
+            expected += sum(comb(n, i) * p ** i * (1 - p) ** (n - i) for i in range(n - j + 1, n + 1))
+    return expected
+
+
+@lru_cache(maxsize=1024)
+def _critical(expr: DiceExpression) -> DiceExpression:
+    return DiceExpression(
+        terms=tuple(
+            replace(t, count=t.count * 2, keep=None if t.keep is None else t.keep * 2)
+            for t in expr.terms
+        ),
+        bonus=expr.bonus,
+    )
+
+
+@lru_cache(maxsize=1024)
+def compile_dice(expression: str) -> DiceExpression:
+    """
+    Compila una expresión de dados. Soporta:
+    - términos NdS (N opcional: "d20" = "1d20") y constantes
+    - suma y resta: "2d6+1d4-1"
+    - conservar más altos/bajos: "4d6kh3", "2d20kl1"
+    """
+    source = expression.replace(" ", "").lower()
+    if not source:
+        raise ValueError("Expresión de dados vacía")
+
+    terms: list[DiceTerm] = []
+    bonus = 0
+    position = 0
+    while position < len(source):
+        match = _TERM_RE.match(source, position)
+        if match is None or match.end() == position or (position > 0 and not match.group(1)):
+            raise ValueError(f"Expresión de dados inválida: '{expression}'")
+        sign_str, count, size, keep_mode, keep, constant = match.groups()
+        sign = -1 if sign_str == "-" else 1
+
+        if constant is not None:
+            bonus += sign * int(constant)
+        else:
+            count = int(count) if count else 1
+            size = int(size)
+            if count <= 0 or size <= 0:
+                raise ValueError(f"Expresión de dados inválida: '{expression}'")
+            terms.append(DiceTerm(
+                sign=sign,
+                count=count,
+                size=size,
+                keep=int(keep) if keep_mode else None,
+                keep_highest=keep_mode != "kl",
+            ))
+        position = match.end()
+
+    return DiceExpression(terms=tuple(terms), bonus=bonus)
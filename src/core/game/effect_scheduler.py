@@ -0,0 +1,160 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Hashable, Iterable, Optional
+from uuid import UUID
+
+
+@dataclass(order=True, slots=True)
+class ScheduledExpiry:
+    at: int                                   # tick (turnos terminados) en que vence
+    seq: int                                  # desempate y versión de la programación
+    actor_id: UUID = field(compare=False)
+    status: str = field(compare=False)
+
+
+@dataclass(slots=True)
+class TickEffect:
+    """Efecto periódico: daño (veneno, fuego) o curación (regeneración)"""
+    id: int
+    actor_id: UUID
+    name: str
+    dice: str
+    kind: str = "damage"                      # "damage" | "heal"
+    remaining: Optional[int] = None           # ticks que quedan (None = hasta quitarlo)
+    source_id: Optional[UUID] = None
+
+
+class EffectScheduler:
+    """
+    Vencimientos de estados y ticks periódicos de una campaña.
+
+    - Los vencimientos van en un heap por tick (cantidad de turnos terminados):
+      al terminar un turno solo se sacan los que vencen ahora, sin recorrer
+      actores ni estados. Re-aplicar un estado deja la entrada vieja obsoleta
+      (se descarta al salir del heap).
+    - Los ticks de daño/curación se agrupan por lugar de iniciativa (rueda por
+      turno): terminar un turno solo mira los efectos de ese actor/grupo.
+    - Cubre personajes, enemigos y minions por igual: solo guarda ids.
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self._heap: list[ScheduledExpiry] = []
+        self._live: dict[tuple[UUID, str], ScheduledExpiry] = {}
+        self._seq = 0
+        # lugar de iniciativa -> {id de efecto: efecto}
+        self._ticks: dict[Hashable, dict[int, TickEffect]] = {}
+        self._next_tick_id = 0
+
+    # =========================
+    # VENCIMIENTOS
+    # =========================
+
+    def schedule_expiry(self, actor_id: UUID, status: str, turns: int) -> int:
+        """
+        Programa (o reprograma) el fin de un estado. Devuelve el tick de
+        vencimiento: es lo que guarda actor.status (los turnos restantes
+        salen de `remaining`, nada se descuenta a mano).
+        """
+        self._seq += 1
+        entry = ScheduledExpiry(at=self.tick + max(1, turns), seq=self._seq, actor_id=actor_id, status=status)
+        self._live[(actor_id, status)] = entry
+        heapq.heappush(self._heap, entry)
+        return entry.at
+
+    def cancel_expiry(self, actor_id: UUID, status: str) -> None:
+        self._live.pop((actor_id, status), None)
+
+    def remaining(self, actor_id: UUID, status: str) -> Optional[int]:
+        entry = self._live.get((actor_id, status))
+        return None if entry is None else entry.at - self.tick
+
+    def advance(self) -> list[tuple[UUID, str]]:
+        """Termina un turno: avanza el tick y devuelve los estados que vencen"""
+        self.tick += 1
+        expired = []
+        heap = self._heap
+        while heap and heap[0].at <= self.tick:
+            entry = heapq.heappop(heap)
+            key = (entry.actor_id, entry.status)
+            # Solo vale la programación vigente (no cancelada ni reemplazada)
+            if self._live.get(key) is entry:
+                del self._live[key]
+                expired.append(key)
+        return expired
+
+    # =========================
+    # TICKS (daño / curación por turno)
+    # =========================
+
+    def add_tick(
+        self,
+        slot: Hashable,
+        actor_id: UUID,
+        name: str,
+        dice: str,
+        kind: str = "damage",
+        duration: Optional[int] = None,
+        source_id: Optional[UUID] = None,
+    ) -> TickEffect:
+        """`slot` es el lugar de iniciativa en cuyo fin de turno se aplica el efecto"""
+        if kind not in ("damage", "heal"):
+            raise RuntimeError(f"Tipo de efecto inválido '{kind}'")
+        self._next_tick_id += 1
+        effect = TickEffect(
+            id=self._next_tick_id,
+            actor_id=actor_id,
+            name=name,
+            dice=dice,
+            kind=kind,
+            remaining=duration,
+            source_id=source_id,
+        )
+        self._ticks.setdefault(slot, {})[effect.id] = effect
+        return effect
+
+    def remove_tick(self, effect_id: int) -> None:
+        for slot, effects in list(self._ticks.items()):
+            if effects.pop(effect_id, None) is not None:
+                if not effects:
+                    del self._ticks[slot]
+                return
+
+    def due_ticks(self, slot: Hashable) -> list[TickEffect]:
+        """Efectos que se aplican al terminar el turno de `slot` (consume una carga)"""
+        effects = self._ticks.get(slot)
+        if not effects:
+            return []
+
+        due = list(effects.values())
+        for effect in due:
+            if effect.remaining is not None:
+                effect.remaining -= 1
+                if effect.remaining <= 0:
+                    del effects[effect.id]
+        if not effects:
+            del self._ticks[slot]
+        return due
+
+    def ticks_of(self, slot: Hashable) -> list[TickEffect]:
+        return list(self._ticks.get(slot, {}).values())
+
+    def clear_ticks(self) -> None:
+        self._ticks.clear()
+
+    # =========================
+    # MIGRACIÓN
+    # =========================
+
+    @classmethod
+    def from_statuses(cls, actors: Iterable) -> "EffectScheduler":
+        """
+        Reconstruye los vencimientos desde actor.status (snapshots anteriores
+        al scheduler, donde "turns" era el contador restante).
+        """
+        scheduler = cls()
+        for actor in actors:
+            for status, data in getattr(actor, "status", {}).items():
+                if isinstance(data, dict) and "turns" in data:
+                    scheduler.schedule_expiry(actor.id, status, data["turns"])
+        return scheduler
@@ -0,0 +1,100 @@
+from collections import deque
+from typing import TYPE_CHECKING, Hashable, Iterator, Optional
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from src.core.game.Event import Event
+
+# Cantidad de eventos que se mantienen en memoria por campaña
+DEFAULT_RETENTION = 5000
+
+
+class EventLog:
+    """
+    Registro de eventos en memoria con ventana de retención acotada.
+
+    Además del orden cronológico mantiene índices secundarios por tipo,
+    por actor, por (tipo, actor) y por turno, de modo que consultas como
+    "último roll_result del actor X" o "eventos de este turno" no recorren
+    el log completo. Al superar la retención se descarta el evento más
+    antiguo de todos los índices en O(1).
+    """
+
+    def __init__(self, retention: Optional[int] = DEFAULT_RETENTION):
+        if retention is not None and retention <= 0:
+            raise ValueError("La retención debe ser positiva")
+        self.retention = retention
+        self._events: deque[tuple["Event", tuple[Hashable, ...]]] = deque()
+        self._indexes: dict[Hashable, deque["Event"]] = {}
+
+    # =========================
+    # ESCRITURA
+    # =========================
+
+    def append(self, event: "Event", turn: Optional[int] = None) -> None:
+        ctx = event.context
+        actor_id = ctx.actor_id if ctx is not None else None
+        if ctx is not None and ctx.turn is not None:
+            turn = ctx.turn
+
+        keys: list[Hashable] = [("type", event.type)]
+        if actor_id is not None:
+            keys.append(("actor", actor_id))
+            keys.append(("type_actor", event.type, actor_id))
+        if turn is not None:
+            keys.append(("turn", turn))
+
+        for key in keys:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = deque()
+            index.append(event)
+
+        self._events.append((event, tuple(keys)))
+
+        if self.retention is not None and len(self._events) > self.retention:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        _, keys = self._events.popleft()
+        for key in keys:
+            index = self._indexes[key]
+            # El evento más antiguo del log es también el más antiguo de cada índice
+            index.popleft()
+            if not index:
+                del self._indexes[key]
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._indexes.clear()
+
+    # =========================
+    # LECTURA
+    # =========================
+
+    def by_type(self, event_type: str) -> list["Event"]:
+        return list(self._indexes.get(("type", event_type), ()))
+
+    def by_actor(self, actor_id: UUID) -> list["Event"]:
+        return list(self._indexes.get(("actor", actor_id), ()))
+
+    def by_turn(self, turn: int) -> list["Event"]:
+        return list(self._indexes.get(("turn", turn), ()))
+
+    def last(self, event_type: str, actor_id: Optional[UUID] = None) -> Optional["Event"]:
+        """Último evento de un tipo (opcionalmente de un actor) en O(1)."""
+        key = ("type", event_type) if actor_id is None else ("type_actor", event_type, actor_id)
+        index = self._indexes.get(key)
+        return index[-1] if index else None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator["Event"]:
+        return (event for event, _ in self._events)
+
+    def __reversed__(self) -> Iterator["Event"]:
+        return (event for event, _ in reversed(self._events))
+
+    def __getitem__(self, position: int) -> "Event":
+        return self._events[position][0]
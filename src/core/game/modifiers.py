@@ -0,0 +1,124 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Hashable, Iterable, Optional
+from uuid import UUID
+
+
+class ModifierKind(Enum):
+    BASE = "base"            # reemplaza el valor base del stat (ej: Unarmored Defense)
+    BONUS = "bonus"          # suma al valor final (ej: escudo mágico, bendición)
+    ADVANTAGE = "advantage"  # otorga ventaja en tiradas del stat (ej: Rage en STR)
+
+
+@dataclass(frozen=True, slots=True)
+class Modifier:
+    """
+    Modificador tipado sobre un stat: "ac" o un atributo ("STR", "DEX", ...).
+    El valor ya viene resuelto para el actor al compilar el stack.
+    """
+    stat: str
+    kind: ModifierKind
+    source: str
+    value: int = 0
+
+
+# Modificadores que aporta cada estado activo en actor.status
+# status -> fn(actor, datos del estado) -> modificadores
+StatusModifiers = Callable[[Any, dict], Iterable[Modifier]]
+STATUS_MODIFIERS: dict[str, StatusModifiers] = {}
+
+
+def register_status_modifiers(status: str):
+    """Decorador para declarar los modificadores de un estado"""
+    def decorator(fn: StatusModifiers) -> StatusModifiers:
+        STATUS_MODIFIERS[status] = fn
+        return fn
+    return decorator
+
+
+@register_status_modifiers("rage")
+def _rage_modifiers(actor, data: dict) -> Iterable[Modifier]:
+    # Furia: ventaja en pruebas y salvaciones de Fuerza
+    yield Modifier(stat="STR", kind=ModifierKind.ADVANTAGE, source="Rage")
+
+
+@dataclass(slots=True)
+class StatStack:
+    """Modificadores compilados de un stat"""
+    base: Optional[dict] = None                                # {"source", "value"} del mejor override
+    bonuses: list[dict] = field(default_factory=list)          # [{"source", "value"}, ...]
+    advantage: list[str] = field(default_factory=list)         # fuentes de ventaja
+
+    def add(self, modifier: Modifier) -> None:
+        if modifier.kind is ModifierKind.BASE:
+            # Si hay varias fórmulas de base se usa la más alta
+            if self.base is None or modifier.value > self.base["value"]:
+                self.base = {"source": modifier.source, "value": modifier.value}
+        elif modifier.kind is ModifierKind.BONUS:
+            self.bonuses.append({"source": modifier.source, "value": modifier.value})
+        else:
+            self.advantage.append(modifier.source)
+
+
+_EMPTY_STACK = StatStack()
+
+
+class ModifierStack:
+    """Stack precompilado de un actor: stat -> StatStack"""
+
+    def __init__(self, modifiers: Iterable[Modifier] = ()):
+        self._stats: dict[str, StatStack] = {}
+        for modifier in modifiers:
+            stack = self._stats.get(modifier.stat)
+            if stack is None:
+                stack = self._stats[modifier.stat] = StatStack()
+            stack.add(modifier)
+
+    def get(self, stat: str) -> StatStack:
+        return self._stats.get(stat, _EMPTY_STACK)
+
+    def advantage_sources(self, stat: str) -> list[str]:
+        return self.get(stat).advantage
+
+
+def collect_modifiers(actor) -> Iterable[Modifier]:
+    """Modificadores declarados por las features pasivas y los estados activos del actor"""
+    for feature in getattr(actor, "features", ()):
+        yield from feature.modifiers(actor)
+    for status, data in getattr(actor, "status", {}).items():
+        status_modifiers = STATUS_MODIFIERS.get(status)
+        if status_modifiers is not None:
+            yield from status_modifiers(actor, data)
+
+
+def modifier_fingerprint(actor) -> Hashable:
+    """Cambia cuando cambian features, equipo/atributos/nivel o el set de estados"""
+    return (
+        getattr(actor, "features_version", 0),
+        getattr(actor, "stats_version", 0),
+        tuple(getattr(actor, "status", ())),
+    )
+
+
+class ModifierStackCache:
+    """
+    Stacks compilados por actor. Un stack solo se recompila cuando cambia
+    la huella del actor, así que las lecturas son un lookup + comparación.
+    """
+
+    def __init__(self):
+        self._stacks: dict[UUID, tuple[Hashable, ModifierStack]] = {}
+        self.compilations = 0
+
+    def get(self, actor) -> ModifierStack:
+        fingerprint = modifier_fingerprint(actor)
+        cached = self._stacks.get(actor.id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        stack = ModifierStack(collect_modifiers(actor))
+        self._stacks[actor.id] = (fingerprint, stack)
+        self.compilations += 1
+        return stack
+
+    def clear(self) -> None:
+        self._stacks.clear()
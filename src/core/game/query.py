@@ -6,7 +6,9 @@ if TYPE_CHECKING:
     from src.core.game.Event import GameState
 class Query:
     """Marker base. No lógica aquí."""
-    pass
+    # True si el resultado depende solo del actor (query.actor_id) y puede
+    # servirse desde GameState.query_cache
+    cacheable = False
 
 Q = TypeVar("Q", bound="Query")
 R = TypeVar("R", bound="QueryResult")
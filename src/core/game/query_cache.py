@@ -0,0 +1,92 @@
+from typing import TYPE_CHECKING, Any, Hashable, Optional
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from src.core.game.Event import Event
+    from src.core.game.query import Query
+
+# Eventos que cambian las entradas de las queries cacheables de un actor.
+# Se invalida tanto el actor como el target del contexto.
+INVALIDATING_EVENTS = frozenset({
+    "status_applied",
+    "status_expired",
+    "rage_started",
+    "level_up",
+})
+
+
+def actor_fingerprint(actor: Any) -> tuple[int, int]:
+    """
+    Versión de las entradas de un actor que no pasan por el bus de eventos
+    (features otorgadas, equipo, atributos, nivel). Enemigos simples → (0, 0).
+    """
+    return (
+        getattr(actor, "features_version", 0),
+        getattr(actor, "stats_version", 0),
+    )
+
+
+class QueryCache:
+    """
+    Caché de resultados de queries por GameState.
+
+    La clave es la propia query (dataclass frozen → hasheable), así que
+    (tipo, argumentos) queda implícito. Cada entrada guarda la huella del
+    actor al momento de calcularse:
+    - los eventos de INVALIDATING_EVENTS descartan las entradas del actor
+    - un cambio de features/equipo/atributos cambia la huella y la entrada
+      se recalcula en el próximo acceso
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._entries: dict["Query", tuple[Any, tuple[int, int]]] = {}
+        self._by_actor: dict[UUID, set["Query"]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, query: "Query", actor: Any) -> Optional[Any]:
+        entry = self._entries.get(query)
+        if entry is not None and entry[1] == actor_fingerprint(actor):
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return None
+
+    def put(self, query: "Query", actor: Any, result: Any) -> None:
+        if not self.enabled:
+            return
+        self._entries[query] = (result, actor_fingerprint(actor))
+        self._by_actor.setdefault(query.actor_id, set()).add(query)  # type: ignore[attr-defined]
+
+    def invalidate_actor(self, actor_id: Hashable) -> None:
+        queries = self._by_actor.pop(actor_id, None)
+        if not queries:
+            return
+        for query in queries:
+            self._entries.pop(query, None)
+        self.invalidations += 1
+
+    def on_event(self, event: "Event") -> None:
+        if event.type not in INVALIDATING_EVENTS:
+            return
+        ctx = event.context
+        if ctx is None:
+            return
+        if ctx.actor_id is not None:
+            self.invalidate_actor(ctx.actor_id)
+        if ctx.target_id is not None:
+            self.invalidate_actor(ctx.target_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_actor.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+        }
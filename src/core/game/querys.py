@@ -10,90 +10,208 @@ from src.core.game.query import Query, QueryHandler
 
 
 
+# Orden en que se reportan los modificadores de atributo
+STAT_ATTRIBUTES = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+
+
+def _ac_requested_event(actor_id: UUID, context: str | None) -> Event:
+    # Evento de consulta (opcional, solo si otros sistemas reaccionan)
+    return Event(
+        type="ac_requested",
+        context=EventContext(
+            actor_id=actor_id,
+            phase=context
+        ),
+        payload={},
+        cancelable=False
+    )
+
+
+def _stat_modifier_requested_event(actor_id: UUID, attribute: str) -> Event:
+    # Evento opcional para que otras features modifiquen temporalmente el modifier
+    return Event(
+        type="stat_modifier_requested",
+        context=EventContext(actor_id=actor_id),
+        payload={"attribute": attribute},
+        cancelable=False
+    )
+
+
+def _simulate(state: GameState, requests: list[tuple[object, Event]]) -> list[list[Event]]:
+    """
+    Corre la simulación de solo lectura solo para los actores con algún
+    handler o feature que escuche el evento; el resto se resuelve con su
+    ModifierStack sin despachar nada.
+    """
+    collected: list[list[Event]] = [[] for _ in requests]
+    listening = [
+        i for i, (actor, event) in enumerate(requests)
+        if state.dispatcher.has_listeners(event.type, actor)
+    ]
+    simulated = state.run_readonly_events([requests[i][1] for i in listening])
+    for i, events in zip(listening, simulated):
+        collected[i] = events
+    return collected
+
+
+def _resolve_armor_class(actor, state: GameState, collected_events: list[Event]) -> ArmorClassResult:
+    stack = state.modifier_stacks.get(actor).get("ac")
+
+    # AC base REAL: el mejor override del stack (ej: Unarmored Defense)
+    base_ac = stack.base["value"] if stack.base is not None else None
+    modifiers = list(stack.bonuses)
+
+    # Features/handlers basados en eventos siguen pudiendo aportar
+    for ev in collected_events:
+        if ev.type == "ac_base_calculated":
+            value = ev.payload["value"]
+            base_ac = value if base_ac is None else max(base_ac, value)
+        elif ev.type == "ac_modified":
+            modifiers.append(ev.payload)        # sumas extras
+
+    # Si ninguna feature reemplaza base → base default
+    if base_ac is None:
+        base_ac = actor.calc_ac()
+
+    final_ac = base_ac + sum(m["value"] for m in modifiers)
+
+    return ArmorClassResult(
+        value=final_ac,
+        breakdown=[
+            {"source": "base", "value": base_ac},
+            *modifiers
+        ]
+    )
+
+
+def _resolve_stat_modifier(actor, attribute: str, state: GameState, collected_events: list[Event]) -> StatModifierResult:
+    stack = state.modifier_stacks.get(actor).get(attribute)
+
+    # Modifier base (según regla de D&D), salvo que un modificador lo reemplace
+    if stack.base is not None:
+        base_value = stack.base["value"]
+    else:
+        base_value = floor((actor.attributes[attribute] - 10) / 2)
+    modifiers = list(stack.bonuses)
+
+    # Procesar cualquier modificación adicional desde eventos
+    for ev in collected_events:
+        if ev.type == "stat_modifier_modified":
+            modifiers.append(ev.payload)  # ejemplo: {"source": "buff", "value": 1}
+
+    final_value = base_value + sum(m["value"] for m in modifiers)
+
+    return StatModifierResult(
+        value=final_value,
+        breakdown=[{"source": "base", "value": base_value}, *modifiers]
+    )
+
+
+def _get_actor_or_fail(state: GameState, actor_id: UUID):
+    actor = state.get_actor(actor_id)
+    if actor is None:
+        raise RuntimeError("Actor no encontrado")
+    return actor
+
+
 @dataclass(frozen=True)
 class GetArmorClass(Query):
+    cacheable = True
     actor_id: UUID
     context: str | None = None  # opcional: "attack", "ui", etc.
 
 class GetArmorClassHandler(QueryHandler[GetArmorClass, ArmorClassResult]):
     def handle(self, query: GetArmorClass, state: GameState) -> ArmorClassResult:
-        actor = state.get_actor(query.actor_id)
-        if actor is None:
-            raise RuntimeError("Actor no encontrado")
-
-        # Evento de consulta (opcional, solo si otros sistemas reaccionan)
-        event = Event(
-            type="ac_requested",
-            context=EventContext(
-                actor_id=query.actor_id,
-                phase=query.context
-            ),
-            payload={},
-            cancelable=False
-        )
-
-        collected_events = state.run_readonly_event(event)
-
-        # AC base REAL
-        base_ac = None
-        modifiers = []
-
-        for ev in collected_events:
-            if ev.type == "ac_base_calculated":
-                base_ac = ev.payload["value"]       # reemplaza el base
-            elif ev.type == "ac_modified":
-                modifiers.append(ev.payload)        # sumas extras
-
-        # Si ninguna feature reemplaza base → base default
-        if base_ac is None:
-            base_ac = actor.calc_ac()
-
-        final_ac = base_ac + sum(m["value"] for m in modifiers)
-
-
-        return ArmorClassResult(
-            value=final_ac,
-            breakdown=[
-                {"source": "base", "value": base_ac},
-                *modifiers
-            ]
+        actor = _get_actor_or_fail(state, query.actor_id)
+        [collected_events] = _simulate(
+            state, [(actor, _ac_requested_event(query.actor_id, query.context))]
         )
+        return _resolve_armor_class(actor, state, collected_events)
 
 @dataclass(frozen=True)
 class GetStatModifier(Query):
+    cacheable = True
     actor_id: UUID
     attribute: str
 
 class GetStatModifierHandler(QueryHandler[GetStatModifier, StatModifierResult]):
     def handle(self, query: GetStatModifier, state: GameState) -> StatModifierResult:
-        actor = state.get_actor(query.actor_id)
-        if actor is None:
-            raise RuntimeError("Actor no encontrado")
-
-        # Evento opcional para que otras features modifiquen temporalmente el modifier
-        event = Event(
-            type="stat_modifier_requested",
-            context=EventContext(actor_id=query.actor_id),
-            payload={"attribute": query.attribute},
-            cancelable=False
+        actor = _get_actor_or_fail(state, query.actor_id)
+        [collected_events] = _simulate(
+            state, [(actor, _stat_modifier_requested_event(query.actor_id, query.attribute))]
         )
-        collected_events = state.run_readonly_event(event)
+        return _resolve_stat_modifier(actor, query.attribute, state, collected_events)
 
-        # Modifier base (según regla de D&D)
-        base_value = floor((actor.attributes[query.attribute] - 10) / 2)
-        modifiers = []
 
-        # Procesar cualquier modificación adicional desde eventos
-        for ev in collected_events:
-            if ev.type == "stat_modifier_modified":
-                modifiers.append(ev.payload)  # ejemplo: {"source": "buff", "value": 1}
+@dataclass(frozen=True)
+class GetArmorClassBatch(Query):
+    actor_ids: tuple[UUID, ...]
+    context: str | None = None
+
+class GetArmorClassBatchHandler(QueryHandler[GetArmorClassBatch, ArmorClassBatchResult]):
+    """
+    AC de muchos actores en una sola pasada de solo lectura.
+    Lo que ya está en la caché no se recalcula; el resto se resuelve con su
+    ModifierStack y, si alguien escucha ac_requested, comparte una ShadowState.
+    """
+    def handle(self, query: GetArmorClassBatch, state: GameState) -> ArmorClassBatchResult:
+        values = {}
+        missing = []
+
+        for actor_id in query.actor_ids:
+            actor = _get_actor_or_fail(state, actor_id)
+            single = GetArmorClass(actor_id=actor_id, context=query.context)
+            cached = state.query_cache.get(single, actor)
+            if cached is not None:
+                values[actor_id] = cached
+            else:
+                missing.append((single, actor))
+
+        collected = _simulate(state, [
+            (actor, _ac_requested_event(single.actor_id, single.context))
+            for single, actor in missing
+        ])
+
+        for (single, actor), events in zip(missing, collected):
+            result = _resolve_armor_class(actor, state, events)
+            state.query_cache.put(single, actor, result)
+            values[single.actor_id] = result
+
+        return ArmorClassBatchResult(values=values)
 
-        final_value = base_value + sum(m["value"] for m in modifiers)
 
-        return StatModifierResult(
-            value=final_value,
-            breakdown=[{"source": "base", "value": base_value}, *modifiers]
-        )
+@dataclass(frozen=True)
+class GetStatModifiersBatch(Query):
+    actor_ids: tuple[UUID, ...]
+    attributes: tuple[str, ...] = STAT_ATTRIBUTES
+
+class GetStatModifiersBatchHandler(QueryHandler[GetStatModifiersBatch, StatModifiersBatchResult]):
+    """Modificadores de varios atributos para muchos actores en una sola pasada"""
+    def handle(self, query: GetStatModifiersBatch, state: GameState) -> StatModifiersBatchResult:
+        values: dict = {actor_id: {} for actor_id in query.actor_ids}
+        missing = []
+
+        for actor_id in query.actor_ids:
+            actor = _get_actor_or_fail(state, actor_id)
+            for attribute in query.attributes:
+                single = GetStatModifier(actor_id=actor_id, attribute=attribute)
+                cached = state.query_cache.get(single, actor)
+                if cached is not None:
+                    values[actor_id][attribute] = cached
+                else:
+                    missing.append((single, actor))
+
+        collected = _simulate(state, [
+            (actor, _stat_modifier_requested_event(single.actor_id, single.attribute))
+            for single, actor in missing
+        ])
+
+        for (single, actor), events in zip(missing, collected):
+            result = _resolve_stat_modifier(actor, single.attribute, state, events)
+            state.query_cache.put(single, actor, result)
+            values[single.actor_id][single.attribute] = result
+
+        return StatModifiersBatchResult(values=values)
     
 @dataclass(frozen=True)
 class GetActorsAtLocation(Query):
@@ -127,6 +245,7 @@ class GetAvailableMoves(Query):
 
 @dataclass(frozen=True)
 class GetProficiencyBonus(Query):
+    cacheable = True
     actor_id: UUID
 
 class GetProficiencyBonusHandler(QueryHandler[GetProficiencyBonus, ProficiencyBonusResult]):
@@ -165,5 +284,6 @@ class GetEntitiesHandler(QueryHandler):
         entities = {
             "characters": list(state.characters.values()),
             "enemies": list(state.enemies.values()),
+            "minion_groups": list(state.minion_groups.values()),
         }
         return entities
\ No newline at end of file
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import Any, List
+from uuid import UUID
 
 from src.core.base import Actor
 
@@ -20,6 +21,14 @@ class StatModifierResult(QueryResult):
     value: int
     breakdown: list[dict]
 
+@dataclass
+class ArmorClassBatchResult(QueryResult):
+    values: dict[UUID, ArmorClassResult]
+
+@dataclass
+class StatModifiersBatchResult(QueryResult):
+    values: dict[UUID, dict[str, StatModifierResult]]  # actor → atributo → resultado
+
 @dataclass
 class GetActorsAtLocationResult(QueryResult):
     actors: list["Actor"] 
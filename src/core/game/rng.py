@@ -0,0 +1,65 @@
+import random
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa random.Random con la misma semilla
+    np = None
+
+
+class DiceRNG:
+    """
+    Generador de números aleatorios de una campaña (uno por GameState).
+
+    - La semilla es explícita y queda registrada con el evento `rng_seeded`,
+      así que una sesión se puede re-ejecutar igual desde el journal
+    - Con NumPy las tiradas salen de buffers pre-generados (uno por tamaño de
+      dado y uno de floats): cada dado es un pop de lista, no una llamada a randint
+    - `generator` expone el numpy.random.Generator para tiradas en lote
+    - Se serializa con pickle junto al snapshot del GameState (estado incluido)
+    """
+
+    BUFFER_SIZE = 1024
+
+    def __init__(self, seed: Optional[int] = None, buffer_size: int = BUFFER_SIZE):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.buffer_size = buffer_size
+        self._floats: list[float] = []
+        self._dice: dict[int, list[int]] = {}
+        if np is not None:
+            self._generator = np.random.default_rng(seed)
+            self._fallback = None
+        else:
+            self._generator = None
+            self._fallback = random.Random(seed)
+
+    @property
+    def generator(self) -> Any:
+        """numpy.random.Generator de la campaña (para DiceExpression.roll_batch)"""
+        if self._generator is None:
+            raise RuntimeError("NumPy no está instalado: no hay tiradas en lote")
+        return self._generator
+
+    def random(self) -> float:
+        """Float uniforme en [0, 1)"""
+        if self._fallback is not None:
+            return self._fallback.random()
+        floats = self._floats
+        if not floats:
+            floats.extend(self._generator.random(self.buffer_size).tolist())
+        return floats.pop()
+
+    def die(self, size: int) -> int:
+        """Un dado de `size` caras (1..size)"""
+        if self._fallback is not None:
+            return self._fallback.randint(1, size)
+        buffer = self._dice.get(size)
+        if not buffer:
+            buffer = self._dice[size] = self._generator.integers(1, size + 1, self.buffer_size).tolist()
+        return buffer.pop()
+
+    def randint(self, a: int, b: int) -> int:
+        """Entero en [a, b], misma firma que random.randint"""
+        return a + self.die(b - a + 1) - 1
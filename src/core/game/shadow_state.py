@@ -0,0 +1,173 @@
+from collections import deque
+from collections.abc import MutableMapping
+from copy import deepcopy
+from dataclasses import fields
+from typing import Any, Callable, Iterator
+
+from src.core.game.Event import GameState
+from src.core.game.query_cache import QueryCache
+
+# Atributos de un actor que son catálogo inmutable (raza, clase, items, features).
+# Se comparten con el original en vez de copiarse.
+_SHARED_ACTOR_ATTRS = ("race", "dnd_class", "weapon", "armor", "shield", "features", "template")
+
+
+def fork_actor(actor: Any) -> Any:
+    """
+    Copia profunda de un actor compartiendo los objetos de catálogo.
+    El costo depende solo del actor, no del tamaño de la campaña.
+    """
+    memo: dict[int, Any] = {}
+    for attr in _SHARED_ACTOR_ATTRS:
+        value = getattr(actor, attr, None)
+        if value is not None:
+            memo[id(value)] = value
+    for instance in getattr(actor, "inventory", ()):
+        memo[id(instance.item)] = instance.item
+    return deepcopy(actor, memo)
+
+
+class CopyOnWriteDict(MutableMapping):
+    """
+    Vista de un dict base que copia cada valor la primera vez que se lee.
+    Las escrituras y borrados quedan en la capa local; el base nunca se toca.
+    """
+
+    def __init__(self, base: dict, fork: Callable[[Any], Any]):
+        self._base = base
+        self._fork = fork
+        self._local: dict = {}
+        self._deleted: set = set()
+
+    def __getitem__(self, key):
+        if key in self._local:
+            return self._local[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        value = self._fork(self._base[key])
+        self._local[key] = value
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self._deleted.discard(key)
+        self._local[key] = value
+
+    def __delitem__(self, key) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._local.pop(key, None)
+        self._deleted.add(key)
+
+    def __contains__(self, key) -> bool:
+        if key in self._local:
+            return True
+        return key not in self._deleted and key in self._base
+
+    def __iter__(self) -> Iterator:
+        for key in self._base:
+            if key not in self._deleted:
+                yield key
+        for key in self._local:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# Cómo ve la sombra cada campo de GameState. Un campo nuevo sin entrada en
+# alguna de estas tablas hace fallar la construcción de la sombra en vez de
+# quedar en silencio con el default de la clase.
+_FORKED = {  # copy-on-write por entrada
+    "characters": fork_actor,
+    "enemies": fork_actor,
+    "minion_groups": fork_actor,
+    "tokens": dict,
+    "resources": dict,
+}
+_LAZY = ("initiative", "rng", "effects")  # deepcopy al primer acceso (ver properties)
+_LOCAL = {  # valor propio de la sombra
+    "event_log": list,
+    "event_sinks": list,
+    # Los resultados de la sombra no deben llegar a la caché real
+    "query_cache": lambda: QueryCache(enabled=False),
+    "_pending": deque,
+    "_dispatching": bool,
+    "_current_depth": int,
+}
+_SHARED = (  # el mismo objeto que el base: escalares e infraestructura
+    "current_turn",
+    "current_actor",
+    "current_phase",
+    "current_day",
+    "last_event_id",
+    "version",
+    "dispatcher",
+    "_handlers",
+    "_query_handlers",
+    # Los stacks se validan por huella del actor: se pueden compartir
+    "modifier_stacks",
+)
+
+
+class ShadowState(GameState):
+    """
+    Overlay copy-on-write sobre un GameState para simulaciones de solo lectura.
+
+    - Los actores, tokens y recursos se copian solo cuando un handler los lee
+    - Los escalares (turno, fase, actor actual) se escriben en la propia sombra
+    - Los eventos emitidos se acumulan en una lista local en vez del event_log
+
+    Al terminar la simulación la sombra simplemente se descarta.
+    """
+
+    def __init__(self, base: GameState):
+        self._base = base
+        for f in fields(GameState):
+            name = f.name
+            if name in _FORKED:
+                setattr(self, name, CopyOnWriteDict(getattr(base, name), _FORKED[name]))
+            elif name in _LAZY:
+                setattr(self, f"_{name}", None)
+            elif name in _LOCAL:
+                setattr(self, name, _LOCAL[name]())
+            elif name in _SHARED:
+                setattr(self, name, getattr(base, name))
+            else:
+                raise RuntimeError(f"ShadowState no sabe cómo cubrir GameState.{name}")
+
+    def record_event(self, event) -> None:
+        self.event_log.append(event)
+
+    @property
+    def initiative(self):
+        # El tracker solo se copia si algún handler lo usa
+        if self._initiative is None:
+            self._initiative = deepcopy(self._base.initiative)
+        return self._initiative
+
+    @initiative.setter
+    def initiative(self, value) -> None:
+        self._initiative = value
+
+    @property
+    def rng(self):
+        # Copia del RNG: una simulación no consume la secuencia real de la campaña
+        if self._rng is None:
+            self._rng = deepcopy(self._base.rng)
+        return self._rng
+
+    @rng.setter
+    def rng(self, value) -> None:
+        self._rng = value
+
+    @property
+    def effects(self):
+        # Vencimientos y ticks: se copian solo si la simulación los toca
+        if self._effects is None:
+            self._effects = deepcopy(self._base.effects)
+        return self._effects
+
+    @effects.setter
+    def effects(self, value) -> None:
+        self._effects = value
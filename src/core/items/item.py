@@ -1,5 +1,7 @@
 import uuid
 
+from src.core.game.dice import DiceExpression, compile_dice
+
 class Item:
     def __init__(
         self,
@@ -77,6 +79,16 @@ class Weapon(Item):
     def get_dice(self):
         return self.dice_size
 
+    @property
+    def damage_dice(self) -> DiceExpression:
+        """Dado de daño compilado. Acepta "1d8" o solo el tamaño ("d8", "8")."""
+        expression = str(self.dice_size)
+        if "d" not in expression.lower():
+            expression = f"{self.dice_count}d{expression}"
+        elif expression.lower().startswith("d"):
+            expression = f"{self.dice_count}{expression}"
+        return compile_dice(expression)
+
 class Armor(Item):
     def __init__(
         self,
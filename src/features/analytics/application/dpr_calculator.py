@@ -0,0 +1,149 @@
+"""
+Daño por ronda (DPR) calculado de forma exacta con NumPy.
+
+En vez de tirar dados, se construye la distribución de probabilidad del
+daño (convolución de los dados) y se combina con la probabilidad de
+impacto/crítico contra cada AC. Todo el cálculo de una combinación
+clase/arma se hace como arrays [nivel, AC, daño] en una sola pasada.
+
+Las reglas son las de AttackAction:
+- ataque: 1d20 + bonus del arma + mod. de atributo + competencia (si la clase
+  es competente con el tipo de arma); impacta si total >= AC o con 20 natural
+- daño: dados del arma (duplicados en crítico) + mod. de atributo
+- furia (RageDamageHandler): + bonus de ProgressionSystem al daño
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from src.core.character.ProgresionSystem import ProgressionSystem
+from src.core.game.dice import DiceExpression, DiceTerm
+
+PERCENTILES = (10, 50, 90)
+MAX_KEEP_OUTCOMES = 1_000_000
+
+_NATURALS = np.arange(1, 21)
+
+
+@dataclass(frozen=True)
+class DamagePMF:
+    """Distribución de daño: probs[i] = P(daño == offset + i)"""
+    offset: int
+    probs: np.ndarray
+
+    def shift(self, amount: int) -> "DamagePMF":
+        return DamagePMF(self.offset + amount, self.probs)
+
+    def __add__(self, other: "DamagePMF") -> "DamagePMF":
+        return DamagePMF(self.offset + other.offset, np.convolve(self.probs, other.probs))
+
+
+def term_pmf(term: DiceTerm) -> DamagePMF:
+    die = np.full(term.size, 1.0 / term.size)
+
+    if term.keep is None or term.keep >= term.count:
+        probs = np.ones(1)
+        for _ in range(term.count):
+            probs = np.convolve(probs, die)
+        pmf = DamagePMF(term.count, probs)
+    else:
+        # Conservar K de N: se enumeran todas las combinaciones de dados
+        outcomes = term.size ** term.count
+        if outcomes > MAX_KEEP_OUTCOMES:
+            raise RuntimeError(f"Demasiadas combinaciones para '{term}'")
+        rolls = np.indices((term.size,) * term.count).reshape(term.count, -1) + 1
+        rolls = np.sort(rolls, axis=0)
+        kept = rolls[-term.keep:] if term.keep_highest else rolls[:term.keep]
+        sums = kept.sum(axis=0)
+        pmf = DamagePMF(term.keep, np.bincount(sums - term.keep) / outcomes)
+
+    if term.sign < 0:
+        # Restar un término invierte su distribución
+        return DamagePMF(-(pmf.offset + len(pmf.probs) - 1), pmf.probs[::-1])
+    return pmf
+
+
+def expression_pmf(expression: DiceExpression) -> DamagePMF:
+    pmf = DamagePMF(expression.bonus, np.ones(1))
+    for term in expression.terms:
+        pmf = pmf + term_pmf(term)
+    return pmf
+
+
+def hit_chances(attack_bonus: np.ndarray, target_acs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Probabilidad de impacto normal y de crítico por (bonus, AC).
+    attack_bonus: [L], target_acs: [A] -> arrays [L, A]
+    """
+    totals = _NATURALS[None, None, :] + attack_bonus[:, None, None]
+    hits = totals >= target_acs[None, :, None]
+    normal = (hits & (_NATURALS != 20)).sum(axis=2) / 20.0
+    critical = np.full(normal.shape, 1 / 20.0)
+    return normal, critical
+
+
+def damage_per_round(
+    damage: DiceExpression,
+    attack_bonus: Sequence[int],
+    damage_bonus: Sequence[int],
+    target_acs: Sequence[int],
+    percentiles: Iterable[int] = PERCENTILES,
+) -> dict:
+    """
+    DPR esperado y percentiles de un ataque por ronda.
+    attack_bonus / damage_bonus: uno por nivel. Devuelve arrays [nivel, AC].
+    """
+    attack_bonus = np.asarray(attack_bonus)
+    damage_bonus = np.asarray(damage_bonus)
+    acs = np.asarray(target_acs)
+
+    normal_pmf = expression_pmf(damage)
+    crit_pmf = expression_pmf(damage.critical())
+    p_normal, p_crit = hit_chances(attack_bonus, acs)
+    p_miss = 1.0 - p_normal - p_crit
+
+    # Soporte común de daño para todos los niveles: [offset, offset + width)
+    low = min(0, normal_pmf.offset + damage_bonus.min())
+    high = crit_pmf.offset + len(crit_pmf.probs) + damage_bonus.max()
+    width = high - low
+    values = np.arange(low, high)
+
+    def placed(pmf: DamagePMF) -> np.ndarray:
+        # Una fila por nivel con la pmf desplazada por el bonus de daño
+        rows = np.zeros((len(damage_bonus), width))
+        starts = pmf.offset + damage_bonus - low
+        cols = starts[:, None] + np.arange(len(pmf.probs))[None, :]
+        rows[np.arange(len(damage_bonus))[:, None], cols] = pmf.probs
+        return rows
+
+    dist = (
+        p_normal[:, :, None] * placed(normal_pmf)[:, None, :]
+        + p_crit[:, :, None] * placed(crit_pmf)[:, None, :]
+    )
+    dist[:, :, -low] += p_miss
+
+    # El daño negativo (mod. de atributo muy bajo) no cura: cuenta como 0
+    clamped = np.maximum(values, 0)
+    expected = dist @ clamped
+    cdf = np.cumsum(dist, axis=2)
+
+    result = {"expected": expected}
+    for q in percentiles:
+        index = (cdf < q / 100.0 - 1e-12).sum(axis=2)
+        result[f"p{q}"] = clamped[np.minimum(index, width - 1)]
+    return result
+
+
+def ability_score(level: int, base: int = 16) -> int:
+    """Atributo principal supuesto: 16 inicial y +2 en los niveles 4 y 8 (máx. 20)"""
+    return min(20, base + 2 * sum(1 for asi in (4, 8) if level >= asi))
+
+
+def proficiency_bonus(level: int) -> int:
+    return 2 + ((level - 1) // 4)
+
+
+def rage_bonus(level: int) -> int:
+    return ProgressionSystem.rage_progression(level)[1]
@@ -0,0 +1,137 @@
+import hashlib
+import json
+from typing import Iterable, Optional
+
+from src.core.character.ClassFeature import Rage
+from src.core.character.dndclass import CLASS_MAP, DnDClass
+from src.core.character.ProgresionSystem import ProgressionSystem
+from src.core.items.item import Weapon
+from src.core.items.items import ITEMS
+from src.features.analytics.application.dpr_calculator import (
+    PERCENTILES,
+    ability_score,
+    damage_per_round,
+    proficiency_bonus,
+    rage_bonus,
+)
+from src.features.analytics.ports.analytics_cache import AnalyticsCache
+
+# Subir al cambiar las fórmulas: invalida las tablas guardadas en disco
+DPR_RULES_VERSION = 1
+DEFAULT_TARGET_ACS = tuple(range(10, 21))
+LEVELS = tuple(range(1, 21))
+
+
+class DprService:
+    """
+    Tablas de daño por ronda de cada clase/nivel/arma contra un rango de AC.
+
+    La tabla completa se calcula una vez y queda en la caché bajo una clave
+    derivada de todo lo que la afecta (versión de reglas, clases, armas,
+    progresión de furia y ACs pedidas): si cambia algo de eso, se recalcula.
+    """
+
+    def __init__(self, cache: AnalyticsCache):
+        self.cache = cache
+
+    def damage_table(
+        self,
+        target_acs: Iterable[int] = DEFAULT_TARGET_ACS,
+        class_key: Optional[str] = None,
+    ) -> dict:
+        target_acs = tuple(int(ac) for ac in target_acs)
+        if not target_acs:
+            raise RuntimeError("Se requiere al menos una AC objetivo")
+        if class_key is not None and class_key not in CLASS_MAP:
+            raise RuntimeError("Clase no válida")
+
+        key = self._cache_key(target_acs)
+        table = self.cache.get(key)
+        if table is None:
+            table = self._compute(target_acs)
+            self.cache.put(key, table)
+
+        if class_key is None:
+            return table
+        return {**table, "classes": {class_key: table["classes"][class_key]}}
+
+    # =========================
+    # CÁLCULO
+    # =========================
+
+    def _compute(self, target_acs: tuple[int, ...]) -> dict:
+        weapons = combat_weapons()
+        classes = {}
+
+        for key, cls in CLASS_MAP.items():
+            dnd_class = cls()
+            raging = _has_rage(dnd_class)
+            classes[key] = {}
+
+            for weapon in weapons:
+                # Misma regla de competencia que AttackAction
+                proficient = weapon.proficiency_type in dnd_class.weapon_proficiencies
+                stat_mod = [(ability_score(lvl) - 10) // 2 for lvl in LEVELS]
+                attack_bonus = [
+                    weapon.bonus + mod + (proficiency_bonus(lvl) if proficient else 0)
+                    for lvl, mod in zip(LEVELS, stat_mod)
+                ]
+
+                entry = {
+                    "name": weapon.name,
+                    "dice": str(weapon.damage_dice),
+                    "attribute": weapon.attribute,
+                    "proficient": proficient,
+                    "normal": _to_lists(damage_per_round(
+                        weapon.damage_dice, attack_bonus, stat_mod, target_acs
+                    )),
+                }
+                if raging:
+                    rage_damage = [mod + rage_bonus(lvl) for lvl, mod in zip(LEVELS, stat_mod)]
+                    entry["rage"] = _to_lists(damage_per_round(
+                        weapon.damage_dice, attack_bonus, rage_damage, target_acs
+                    ))
+                classes[key][weapon.item_id] = entry
+
+        return {
+            "version": DPR_RULES_VERSION,
+            "target_acs": list(target_acs),
+            "levels": list(LEVELS),
+            "percentiles": list(PERCENTILES),
+            "classes": classes,
+        }
+
+    def _cache_key(self, target_acs: tuple[int, ...]) -> str:
+        signature = {
+            "version": DPR_RULES_VERSION,
+            "acs": target_acs,
+            "percentiles": PERCENTILES,
+            "rage": [ProgressionSystem.rage_progression(lvl) for lvl in LEVELS],
+            "classes": {
+                key: [sorted(cls.weapon_proficiencies), _has_rage(cls())]
+                for key, cls in CLASS_MAP.items()
+            },
+            "weapons": [
+                [w.item_id, str(w.damage_dice), w.attribute, w.bonus, w.proficiency_type]
+                for w in combat_weapons()
+            ],
+        }
+        raw = json.dumps(signature, sort_keys=True).encode("utf-8")
+        return "dpr_" + hashlib.sha256(raw).hexdigest()[:16]
+
+
+def combat_weapons() -> list[Weapon]:
+    return [item for item in ITEMS.values() if isinstance(item, Weapon)]
+
+
+def _has_rage(dnd_class: DnDClass) -> bool:
+    return any(
+        issubclass(feature, Rage)
+        for features in dnd_class.features_by_level().values()
+        for feature in features
+    )
+
+
+def _to_lists(result: dict) -> dict:
+    # [nivel][AC], redondeado para el JSON
+    return {name: values.round(3).tolist() for name, values in result.items()}
@@ -0,0 +1,46 @@
+import json
+import os
+
+from ..ports.analytics_cache import AnalyticsCache
+
+ANALYTICS_FOLDER = "storage/analytics"
+
+
+class FileAnalyticsCache(AnalyticsCache):
+    """
+    Caché en disco: storage/analytics/<clave>.json
+
+    Se mantiene además una copia en memoria, así que después de la primera
+    lectura servir una tabla no toca el disco. La escritura es atómica
+    (archivo temporal + os.replace) para no dejar JSON a medio escribir.
+    """
+
+    def __init__(self, base_dir: str = ANALYTICS_FOLDER):
+        self.directory = base_dir
+        self._memory: dict[str, dict] = {}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> dict | None:
+        cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        self._memory[key] = value
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._memory[key] = value
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class AnalyticsCache(ABC):
+    """
+    Caché de resultados de analytics ya calculados.
+    La clave identifica las entradas del cálculo (reglas, clases, armas, ACs).
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> dict | None:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, value: dict) -> None:
+        pass
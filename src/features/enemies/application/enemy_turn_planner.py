@@ -0,0 +1,310 @@
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from src.core.character.minion_group import MinionGroup
+from src.core.combat.conditions import Act, Roll, auto_critical, can_act, condition_mask, roll_mode
+from src.core.combat.expected_damage import expected_damage
+from src.core.combat.phase import Phase
+from src.core.game.Action import AttackAction
+from src.core.game.commands import AttackCommand
+from src.core.game.dice import compile_dice
+from src.core.game.Event import Event, GameState
+from src.core.game.querys import GetArmorClassBatch
+
+# Presupuesto de planificación por turno
+DEFAULT_BUDGET_MS = 50
+# Margen para el ida y vuelta al proceso worker antes de darlo por perdido
+POOL_SLACK_MS = 250
+
+
+# =========================
+# FOTO DEL TURNO (datos planos, viajan al worker)
+# =========================
+
+@dataclass(frozen=True)
+class PlanAttack:
+    name: str
+    dice: str
+    attack_bonus: int
+    range_ft: int = 5
+
+
+@dataclass(frozen=True)
+class PlanAttacker:
+    id: UUID
+    x: int
+    y: int
+    conditions: int
+    attacks: tuple[PlanAttack, ...]
+
+
+@dataclass(frozen=True)
+class PlanTarget:
+    id: UUID
+    hp: int
+    ac: int
+    x: int
+    y: int
+    conditions: int
+
+
+@dataclass(frozen=True)
+class TurnRequest:
+    turn_id: UUID                 # lugar de iniciativa (enemigo o grupo de minions)
+    turn_number: int              # para descartar el plan si el turno ya pasó
+    attackers: tuple[PlanAttacker, ...]
+    targets: tuple[PlanTarget, ...]
+    budget_ms: int = DEFAULT_BUDGET_MS
+
+
+@dataclass
+class PlannedAttack:
+    actor_id: UUID
+    target_id: UUID
+    attack_name: str
+    expected_damage: float
+
+
+@dataclass
+class TurnPlan:
+    turn_id: UUID
+    turn_number: int
+    attacks: list[PlannedAttack] = field(default_factory=list)
+    complete: bool = True         # False si se cortó por tiempo
+    elapsed_ms: float = 0.0
+
+
+def snapshot_turn(state: GameState, turn_id: UUID, budget_ms: int = DEFAULT_BUDGET_MS) -> TurnRequest:
+    """
+    Foto de solo lectura del turno de un enemigo o grupo de minions.
+    Corre en el loop (toca el GameState); las ACs salen de la query batch cacheada.
+    """
+    actor = state.get_actor(turn_id)
+    if actor is None:
+        raise RuntimeError("El actor del turno no existe")
+
+    if isinstance(actor, MinionGroup):
+        # Los que ya actuaron este turno no entran al plan
+        members = [actor.member(i) for i in actor.alive_indexes() if not actor.has_acted(i)]
+    else:
+        members = [actor] if actor.hp > 0 else []
+
+    targets = [c for c in state.characters.values() if c.hp > 0]
+    armor = state.query(GetArmorClassBatch(
+        actor_ids=tuple(c.id for c in targets),
+        context="attack"
+    )).values if targets else {}
+
+    attacks_by_template: dict[int, tuple[PlanAttack, ...]] = {}
+
+    def plan_attacks(member) -> tuple[PlanAttack, ...]:
+        # Los minions comparten plantilla: se convierten sus ataques una sola vez
+        attacks = member.attacks
+        key = id(attacks)
+        if key not in attacks_by_template:
+            attacks_by_template[key] = tuple(
+                PlanAttack(
+                    name=attack.name,
+                    dice=attack.get_dice(),
+                    attack_bonus=attack.attack_bonus,
+                    range_ft=getattr(attack, "range", 5),
+                )
+                for attack in attacks
+            )
+        return attacks_by_template[key]
+
+    return TurnRequest(
+        turn_id=turn_id,
+        turn_number=state.current_turn,
+        attackers=tuple(
+            PlanAttacker(
+                id=member.id,
+                x=member.position[0],
+                y=member.position[1],
+                conditions=condition_mask(member),
+                attacks=plan_attacks(member),
+            )
+            for member in members
+        ),
+        targets=tuple(
+            PlanTarget(
+                id=c.id,
+                hp=c.hp,
+                ac=armor[c.id].value,
+                x=c.position[0],
+                y=c.position[1],
+                conditions=condition_mask(c),
+            )
+            for c in targets
+        ),
+        budget_ms=budget_ms,
+    )
+
+
+# =========================
+# PLANIFICACIÓN (pura, corre en el worker)
+# =========================
+
+def plan_turn(request: TurnRequest) -> TurnPlan:
+    """
+    Asigna a cada atacante el par (objetivo, ataque) de mayor daño esperado.
+
+    - el daño esperado cuenta ventaja/desventaja y críticos por condiciones
+    - el HP que se espera quitar se descuenta del objetivo: cuando uno ya
+      "está muerto" en el plan, los siguientes atacantes pasan a otro
+    - a igual daño se concentra el fuego en el que tiene menos HP restante
+    - si se agota el presupuesto, los atacantes sin planificar no atacan
+      y el plan queda marcado como incompleto
+    """
+    start = time.perf_counter()
+    deadline = start + request.budget_ms / 1000
+    plan = TurnPlan(turn_id=request.turn_id, turn_number=request.turn_number)
+
+    remaining = {t.id: float(t.hp) for t in request.targets}
+    # (ataque, objetivo, cuerpo a cuerpo, condiciones del atacante) -> daño esperado
+    expected_cache: dict[tuple, float] = {}
+
+    for attacker in request.attackers:
+        if time.perf_counter() > deadline:
+            plan.complete = False
+            break
+        if not can_act(Act.ACTION, attacker.conditions):
+            continue
+
+        best = None
+        for target in request.targets:
+            distance_ft = (abs(target.x - attacker.x) + abs(target.y - attacker.y)) * 5
+            melee = distance_ft <= 5
+            for attack in attacker.attacks:
+                if distance_ft > attack.range_ft:
+                    continue
+                key = (attack, target.id, melee, attacker.conditions)
+                value = expected_cache.get(key)
+                if value is None:
+                    value = _expected(attack, target, melee, attacker.conditions)
+                    expected_cache[key] = value
+
+                # Pegarle a quien ya "murió" en el plan no suma
+                useful = value if remaining[target.id] > 0 else 0.0
+                score = (useful, -remaining[target.id], value)
+                if best is None or score > best[0]:
+                    best = (score, target, attack, value)
+
+        if best is None:
+            continue
+        _, target, attack, value = best
+        remaining[target.id] -= value
+        plan.attacks.append(PlannedAttack(
+            actor_id=attacker.id,
+            target_id=target.id,
+            attack_name=attack.name,
+            expected_damage=round(value, 2),
+        ))
+
+    plan.elapsed_ms = (time.perf_counter() - start) * 1000
+    return plan
+
+
+def _expected(attack: PlanAttack, target: PlanTarget, melee: bool, attacker_conditions: int) -> float:
+    roll_kind = Roll.ATTACK_MELEE if melee else Roll.ATTACK_RANGED
+    advantage, disadvantage = roll_mode(roll_kind, attacker_conditions, target.conditions)
+    return expected_damage(
+        compile_dice(attack.dice),
+        attack.attack_bonus,
+        target.ac,
+        advantage,
+        disadvantage,
+        always_critical=auto_critical(roll_kind, target.conditions),
+    )
+
+
+# =========================
+# POOL
+# =========================
+
+class EnemyTurnPlanner:
+    """
+    Planifica turnos de enemigos en un pool de procesos.
+
+    `plan` bloquea al hilo que lo llama hasta tener el plan (o vencer el
+    presupuesto más un margen): desde el servidor se invoca con
+    eventlet.tpool para que el loop de sockets siga atendiendo otras campañas.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        budget_ms: int = DEFAULT_BUDGET_MS,
+        executor: Optional[Executor] = None,
+    ):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.budget_ms = budget_ms
+        self._executor = executor
+
+    def snapshot(self, state: GameState, turn_id: UUID) -> TurnRequest:
+        return snapshot_turn(state, turn_id, self.budget_ms)
+
+    def start(self) -> None:
+        """
+        Levanta los workers sin esperarlos, para que el primer turno no pague
+        el arranque del pool (se llama al activar el autoplay).
+        """
+        executor = self._default_executor()
+        for _ in range(self.workers):
+            executor.submit(os.getpid)
+
+    def plan(self, request: TurnRequest) -> TurnPlan:
+        future = self._default_executor().submit(plan_turn, request)
+        try:
+            return future.result(timeout=(request.budget_ms + POOL_SLACK_MS) / 1000)
+        except FutureTimeout:
+            # Pool frío o saturado: se planifica acá mismo (plan_turn respeta el presupuesto)
+            future.cancel()
+            return plan_turn(request)
+
+    def _default_executor(self) -> Executor:
+        # Se crea al primer uso y se reutiliza: levantar procesos es lo caro
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# =========================
+# EJECUCIÓN (de vuelta en el loop)
+# =========================
+
+def execute_plan(state: GameState, plan: TurnPlan) -> list[Event]:
+    """
+    Ejecuta el plan con las acciones reales (AttackAction valida todo de nuevo).
+    Si mientras se planificaba el turno cambió, no se ejecuta nada.
+    """
+    if (
+        state.current_phase != Phase.COMBAT
+        or state.current_actor != plan.turn_id
+        or state.current_turn != plan.turn_number
+    ):
+        return []
+
+    results = []
+    for planned in plan.attacks:
+        results.append(AttackAction(AttackCommand(
+            actor_id=planned.actor_id,
+            target_id=planned.target_id,
+            mode="melee",
+            advantage=False,
+            disadvantage=False,
+            attack_name=planned.attack_name,
+        )).execute(state))
+        if state.current_phase != Phase.COMBAT:
+            break
+    return results
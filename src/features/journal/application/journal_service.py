@@ -0,0 +1,260 @@
+import pickle
+from typing import Any, Iterator, Optional
+from uuid import UUID
+
+from src.core.character.minion_group import split_member_id
+from src.core.game.Event import EventSink, GameState
+from src.features.journal.ports.event_journal import EventJournal
+
+# Cada cuánto (segundos) el loop del servidor lleva a disco lo pendiente de cada campaña
+FLUSH_INTERVAL = 0.25
+
+# Tipos de registro del journal
+EVENT_RECORD = "event"
+STATE_RECORD = "state"
+
+# Colecciones de entidades: en cada checkpoint solo viajan las entradas tocadas
+ENTITY_FIELDS = ("characters", "enemies", "minion_groups", "tokens")
+# El resto del snapshot (escalares, recursos, iniciativa, RNG, efectos) viaja entero si cambió
+VALUE_FIELDS = tuple(name for name in GameState.SNAPSHOT_FIELDS if name not in ENTITY_FIELDS)
+# Eventos que tocan a todos los combatientes sin nombrar a ninguno
+TOUCHES_EVERYONE = frozenset({"combat_ended"})
+
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class JournalService(EventSink):
+    """
+    Durabilidad de la sesión sin pasar por MySQL en cada evento.
+
+    El journal guarda cambios de estado, no solo eventos: muchas reglas mutan
+    el estado fuera de los handlers (recursos que gasta una acción, end_turn,
+    tiradas del RNG), así que re-despachar eventos no reconstruye la sesión.
+
+    - Cada evento se serializa al momento y se agrega al journal (solo para
+      reconstruir el event_log) y anota qué entidades nombra
+    - `flush(state)` lo llama el loop del servidor cada FLUSH_INTERVAL, entre
+      mensajes (el estado está quieto: ninguna acción a medias). Escribe un
+      checkpoint con los campos del snapshot que cambiaron y las entidades
+      tocadas desde el anterior, y hace flush del journal
+    - Cada `snapshot_every` eventos el checkpoint es un snapshot completo y
+      el journal se reinicia
+    - Recuperar = último snapshot + checkpoints del tail, sin re-ejecutar reglas
+
+    Toda mutación de una entidad tiene que pasar por un evento que la nombre
+    (contexto o payload); si no, no se entera del cambio.
+    """
+
+    def __init__(self, journal: EventJournal, snapshot_every: int = 500):
+        self.journal = journal
+        self.snapshot_every = snapshot_every
+        self.state: Optional[GameState] = None
+        self._since_snapshot = 0
+        # Número de checkpoint: el snapshot guarda el suyo y al recuperar se
+        # descartan los checkpoints que ya incluye
+        self._checkpoint = 0
+        # Desde el último checkpoint: hubo eventos / ids nombrados por ellos
+        self._dirty = False
+        self._touched: set = set()
+        self._everyone = False
+        # Línea base del próximo checkpoint
+        self._values: dict[str, bytes] = {}
+        self._keys: dict[str, set] = {}
+
+    def attach(self, state: GameState) -> None:
+        if self not in state.event_sinks:
+            state.event_sinks.append(self)
+        self.state = state
+        self._reset_baseline(state)
+
+    def detach(self, state: GameState) -> None:
+        if self in state.event_sinks:
+            state.event_sinks.remove(self)
+        self.state = None
+
+    # -------------------------
+    # EventSink
+    # -------------------------
+    def on_event(self, event, depth: int) -> None:
+        self._since_snapshot += 1
+        self._dirty = True
+        if event.type in TOUCHES_EVERYONE:
+            self._everyone = True
+        ctx = event.context
+        if ctx is not None:
+            self._touch(ctx.actor_id)
+            self._touch(ctx.target_id)
+        if event._payload:
+            for value in _ids_in(event._payload):
+                self._touch(value)
+
+        turn = self.state.current_turn if self.state is not None else None
+        self.journal.append(
+            pickle.dumps((EVENT_RECORD, event.id, (turn, event)), protocol=_PROTOCOL)
+        )
+
+    def _touch(self, value) -> None:
+        if value is None:
+            return
+        if isinstance(value, str):
+            try:
+                value = UUID(value)
+            except ValueError:
+                self._touched.add(value)
+                return
+        if isinstance(value, UUID):
+            # Un minion se guarda como parte de su grupo
+            self._touched.add(split_member_id(value)[0])
+            self._touched.add(str(value))
+        self._touched.add(value)
+
+    # -------------------------
+    # CHECKPOINTS
+    # -------------------------
+    def flush(self, state: GameState) -> None:
+        """Lleva a disco lo ocurrido desde el último checkpoint (si hubo algo)"""
+        if not self._dirty:
+            return
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot(state)
+        else:
+            self.checkpoint(state)
+
+    def checkpoint(self, state: GameState) -> None:
+        values = {}
+        for name in VALUE_FIELDS:
+            blob = pickle.dumps(getattr(state, name), protocol=_PROTOCOL)
+            if self._values.get(name) != blob:
+                values[name] = blob
+                self._values[name] = blob
+
+        entities, removed = {}, {}
+        for name in ENTITY_FIELDS:
+            collection = getattr(state, name)
+            known = self._keys[name]
+            # Recorrer el dict conserva el orden de inserción de las entidades nuevas
+            changed = {
+                key: value for key, value in collection.items()
+                if key not in known or self._everyone or key in self._touched
+            }
+            gone = [key for key in known if key not in collection]
+            if changed:
+                entities[name] = changed
+            if gone:
+                removed[name] = gone
+            self._keys[name] = set(collection)
+
+        self._checkpoint += 1
+        self.journal.append(pickle.dumps(
+            (STATE_RECORD, self._checkpoint, (values, entities, removed)),
+            protocol=_PROTOCOL
+        ))
+        self.journal.flush()
+        self._clear_touched()
+
+    def snapshot(self, state: GameState) -> None:
+        # Se serializa acá (el estado no puede cambiar a mitad); escribir y
+        # hacer fsync le toca al journal, fuera del loop si tiene writer
+        self._checkpoint += 1
+        data = pickle.dumps(
+            {"checkpoint": self._checkpoint, "seq": state.last_event_id, "state": state.to_snapshot()},
+            protocol=_PROTOCOL
+        )
+        self.journal.write_snapshot(data)
+        self._since_snapshot = 0
+        self._reset_baseline(state)
+
+    def _reset_baseline(self, state: GameState) -> None:
+        self._values = {
+            name: pickle.dumps(getattr(state, name), protocol=_PROTOCOL)
+            for name in VALUE_FIELDS
+        }
+        self._keys = {name: set(getattr(state, name)) for name in ENTITY_FIELDS}
+        self._clear_touched()
+
+    def _clear_touched(self) -> None:
+        self._dirty = False
+        self._touched.clear()
+        self._everyone = False
+
+    # -------------------------
+    # RECUPERACIÓN
+    # -------------------------
+    def recover(self, state: GameState) -> bool:
+        """
+        Restaura el último snapshot y aplica encima los checkpoints del tail.
+        El event_log se rearma con los eventos cubiertos por el último
+        checkpoint (los posteriores no llegaron a tener su estado en disco).
+        Devuelve False si no había nada que recuperar.
+        """
+        snapshot = self.journal.load_snapshot()
+        records = list(self.journal.records())
+        if snapshot is None and not records:
+            return False
+
+        checkpoint, seq = 0, 0
+        if snapshot is not None:
+            data = pickle.loads(snapshot)
+            merged = data["state"]
+            checkpoint, seq = data.get("checkpoint", 0), data["seq"]
+        else:
+            # Sin snapshot la base es el estado recién armado desde la DB
+            merged = state.to_snapshot()
+
+        events = []
+        for raw in records:
+            kind, number, body = pickle.loads(raw)
+            if kind == EVENT_RECORD:
+                if number > seq:
+                    events.append((number, body))
+            elif kind == STATE_RECORD and number > checkpoint:
+                values, entities, removed = body
+                for name, blob in values.items():
+                    merged[name] = pickle.loads(blob)
+                for name, changed in entities.items():
+                    merged[name].update(changed)
+                for name, keys in removed.items():
+                    for key in keys:
+                        merged[name].pop(key, None)
+                checkpoint = number
+
+        state.load_snapshot(merged)
+        for number, (turn, event) in events:
+            if number <= state.last_event_id:
+                state.event_log.append(event, turn=turn)
+        self._checkpoint = checkpoint
+
+        # Compactar: el tail ya quedó aplicado sobre el estado
+        self.snapshot(state)
+        return True
+
+    def discard(self) -> None:
+        self.journal.discard()
+
+    def close(self) -> None:
+        self.journal.close()
+
+
+def _ids_in(value: Any, depth: int = 0) -> Iterator[Any]:
+    """UUIDs del payload y strings guardados bajo claves id / *_id (hasta 3 niveles)"""
+    if depth > 3:
+        return
+    if isinstance(value, UUID):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, str):
+                if key == "id" or (isinstance(key, str) and key.endswith("_id")):
+                    yield item
+            else:
+                yield from _ids_in(item, depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            yield from _ids_in(item, depth + 1)
+
+
+def journal_of(state: GameState) -> JournalService | None:
+    for sink in state.event_sinks:
+        if isinstance(sink, JournalService):
+            return sink
+    return None
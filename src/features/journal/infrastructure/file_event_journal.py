@@ -0,0 +1,194 @@
+import logging
+import os
+import queue
+import struct
+import threading
+from typing import Callable, Iterator, Optional
+
+from ..ports.event_journal import EventJournal
+
+JOURNAL_FOLDER = "storage/journals"
+
+logger = logging.getLogger(__name__)
+
+# Cada registro se guarda como <longitud uint32 little-endian><bytes>
+_FRAME_HEADER = struct.Struct("<I")
+
+
+class JournalWriter:
+    """
+    Hilo de disco compartido por los journals de todas las campañas.
+
+    write + fsync (lotes y snapshots) corren acá y no en el loop de sockets:
+    un snapshot grande no frena al resto de las campañas del nodo. Las
+    tareas se ejecutan en orden de llegada, así el snapshot nunca se
+    adelanta a los registros encolados antes que él.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, task: Callable, *args) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+                    self._thread.start()
+        self._queue.put((task, args))
+
+    def wait(self) -> None:
+        """Bloquea hasta que se escribió todo lo encolado"""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            task, args = self._queue.get()
+            try:
+                task(*args)
+            except Exception:
+                # Un error de disco de una campaña no tira el hilo de todas
+                journal = getattr(task, "__self__", None)
+                logger.exception(
+                    "Journal: falló %s en %s: los registros de ese lote se perdieron",
+                    getattr(task, "__name__", task), getattr(journal, "directory", "?")
+                )
+            finally:
+                self._queue.task_done()
+
+
+class FileEventJournal(EventJournal):
+    """
+    Journal en disco: storage/journals/<campaña>/journal.log + snapshot.bin
+
+    Las escrituras se agrupan: los registros se acumulan en memoria y se
+    escriben con un único write + fsync cuando se llena el lote o cuando
+    el JournalService hace flush (checkpoint). Un registro truncado al final
+    del archivo (crash a mitad de escritura) se ignora al leer.
+
+    Con `writer` las escrituras van al hilo de disco; sin él se hacen en el
+    momento (tests, scripts).
+    """
+
+    def __init__(
+        self,
+        campaign_key: str,
+        base_dir: str = JOURNAL_FOLDER,
+        batch_size: int = 64,
+        writer: Optional[JournalWriter] = None,
+    ):
+        self.directory = os.path.join(base_dir, str(campaign_key))
+        self.journal_path = os.path.join(self.directory, "journal.log")
+        self.snapshot_path = os.path.join(self.directory, "snapshot.bin")
+        self.batch_size = batch_size
+        self.writer = writer
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(self.journal_path, "ab")
+        self._pending: list[bytes] = []
+        self._closed = False
+
+    def _run(self, task: Callable, *args) -> None:
+        if self.writer is None:
+            task(*args)
+        else:
+            self.writer.submit(task, *args)
+
+    def _wait(self) -> None:
+        if self.writer is not None:
+            self.writer.wait()
+
+    # -------------------------
+    # JOURNAL
+    # -------------------------
+    def append(self, record: bytes) -> None:
+        self._pending.append(_FRAME_HEADER.pack(len(record)) + record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        data = b"".join(self._pending)
+        self._pending.clear()
+        self._run(self._write, data)
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def records(self) -> Iterator[bytes]:
+        self.flush()
+        self._wait()
+        with open(self.journal_path, "rb") as f:
+            data = f.read()
+
+        offset = 0
+        while offset + _FRAME_HEADER.size <= len(data):
+            (length,) = _FRAME_HEADER.unpack_from(data, offset)
+            start = offset + _FRAME_HEADER.size
+            end = start + length
+            if end > len(data):
+                break  # registro incompleto: crash durante la escritura
+            yield data[start:end]
+            offset = end
+
+    # -------------------------
+    # SNAPSHOTS
+    # -------------------------
+    def write_snapshot(self, data: bytes) -> None:
+        # Los registros anteriores van primero: el snapshot los cubre y después se truncan
+        self.flush()
+        self._run(self._replace_snapshot, data)
+
+    def _replace_snapshot(self, data: bytes) -> None:
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # El snapshot ya cubre todo lo escrito: se empieza un journal vacío
+        self._file.close()
+        self._file = open(self.journal_path, "wb")
+        os.fsync(self._file.fileno())
+
+    def load_snapshot(self) -> bytes | None:
+        self._wait()
+        if not os.path.exists(self.snapshot_path):
+            return None
+        with open(self.snapshot_path, "rb") as f:
+            return f.read()
+
+    # -------------------------
+    # CICLO DE VIDA
+    # -------------------------
+    def discard(self) -> None:
+        self._pending.clear()
+        self._closed = True
+        # Se espera: una sesión nueva de la campaña puede abrir la misma carpeta
+        self._run(self._remove_files)
+        self._wait()
+
+    def _remove_files(self) -> None:
+        self._file.close()
+        for path in (self.journal_path, self.snapshot_path):
+            if os.path.exists(path):
+                os.remove(path)
+        if not os.listdir(self.directory):
+            os.rmdir(self.directory)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        self._run(self._close_file)
+        self._wait()
+
+    def _close_file(self) -> None:
+        # _file se lee en el hilo: un snapshot encolado antes puede haberlo reabierto
+        self._file.close()
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+
+class EventJournal(ABC):
+    """
+    Journal append-only de una campaña.
+    Guarda registros ya serializados (bytes) y el último snapshot del estado.
+    """
+
+    @abstractmethod
+    def append(self, record: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Lleva a disco lo que quedó en memoria"""
+        pass
+
+    @abstractmethod
+    def records(self) -> Iterator[bytes]:
+        pass
+
+    @abstractmethod
+    def write_snapshot(self, data: bytes) -> None:
+        """Persiste el snapshot y reinicia el journal (el tail queda vacío)"""
+        pass
+
+    @abstractmethod
+    def load_snapshot(self) -> bytes | None:
+        pass
+
+    @abstractmethod
+    def discard(self) -> None:
+        """Elimina journal y snapshot (la sesión ya quedó persistida en DB)"""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
@@ -0,0 +1,218 @@
+import os
+import pickle
+import random
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, Optional, Union
+
+from src.core.character.character import Character
+from src.core.character.enemy import Enemy
+from src.core.combat.phase import Phase
+from src.core.game.Action import AttackAction, EndTurnAction, StartCombatAction
+from src.core.game.bootstrap import register_core_rules
+from src.core.game.commands import AttackCommand, EndTurnCommand, StartCombatCommand
+from src.core.game.Event import GameState
+from src.core.game.event_log import EventLog
+from src.core.game.rng import DiceRNG
+from src.features.characters.application.character_mapper import json_to_character
+from src.features.enemies.application.enemy_mapper import json_to_enemy
+from src.features.simulation.domain.encounter_report import EncounterReport
+
+# Por debajo de esto no conviene pagar el arranque de procesos
+MIN_RUNS_PER_WORKER = 200
+# Un combate simulado no necesita historial: solo se guardan los últimos eventos
+SIM_LOG_RETENTION = 64
+
+
+class EncounterSimulator:
+    """
+    Simulador Monte Carlo de encuentros.
+
+    Cada combate se juega completo con las reglas reales (StartCombatAction,
+    AttackAction, EndTurnAction y los handlers de register_core_rules) sobre
+    un GameState propio, sin journal ni sockets:
+    - los personajes atacan al enemigo vivo con menos HP
+    - los enemigos atacan a un personaje vivo al azar (RNG del combate)
+    - cada corrida tiene su semilla, así que un reporte es reproducible
+
+    Las corridas se reparten en un pool de procesos; los actores viajan una
+    sola vez serializados y cada worker los deserializa por combate.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_rounds: int = 50,
+        executor: Optional[Executor] = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_rounds = max_rounds
+        self._executor = executor
+
+    def simulate(
+        self,
+        party: Iterable[Union[Character, dict]],
+        enemies: Iterable[Union[Enemy, dict]],
+        runs: int = 1000,
+        seed: Optional[int] = None,
+    ) -> EncounterReport:
+        """
+        Simula `runs` combates. Acepta actores del dominio o filas de los
+        repositorios (CharacterRepository / EnemyRepository).
+        """
+        if runs <= 0:
+            raise RuntimeError("La cantidad de corridas debe ser positiva")
+
+        characters = [_as_character(c) for c in party]
+        foes = _unique_enemies(_as_enemy(e) for e in enemies)
+        if not characters or not foes:
+            raise RuntimeError("El encuentro necesita al menos un personaje y un enemigo")
+
+        party_blob = pickle.dumps(characters, protocol=pickle.HIGHEST_PROTOCOL)
+        enemies_blob = pickle.dumps(foes, protocol=pickle.HIGHEST_PROTOCOL)
+
+        seeder = random.Random(seed)
+        seeds = [seeder.getrandbits(63) for _ in range(runs)]
+
+        chunks = _split(seeds, min(self.workers, max(1, runs // MIN_RUNS_PER_WORKER)))
+        if len(chunks) == 1:
+            return _run_chunk(party_blob, enemies_blob, seeds, self.max_rounds)
+
+        report = EncounterReport()
+        executor = self._executor or self._default_executor()
+        futures = [
+            executor.submit(_run_chunk, party_blob, enemies_blob, chunk, self.max_rounds)
+            for chunk in chunks
+        ]
+        for future in futures:
+            report.merge(future.result())
+        return report
+
+    def _default_executor(self) -> Executor:
+        # Se crea al primer uso y se reutiliza: levantar procesos es lo caro
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# =========================
+# WORKER
+# =========================
+
+def _run_chunk(party_blob: bytes, enemies_blob: bytes, seeds: list[int], max_rounds: int) -> EncounterReport:
+    report = EncounterReport()
+    for seed in seeds:
+        # Copia fresca de los actores por combate
+        characters: list[Character] = pickle.loads(party_blob)
+        enemies: list[Enemy] = pickle.loads(enemies_blob)
+        _run_combat(characters, enemies, seed, max_rounds, report)
+    return report
+
+
+def _run_combat(
+    characters: list[Character],
+    enemies: list[Enemy],
+    seed: int,
+    max_rounds: int,
+    report: EncounterReport,
+) -> None:
+    state = GameState(
+        current_turn=1,
+        current_phase=Phase.EXPLORATION,
+        event_log=EventLog(retention=SIM_LOG_RETENTION),
+        rng=DiceRNG(seed),
+    )
+    register_core_rules(state)
+    for character in characters:
+        state.add_character(character)
+    for enemy in enemies:
+        state.add_enemy(enemy)
+
+    start_hp = [c.hp for c in characters]
+    participants = [c.id for c in characters] + [e.id for e in enemies]
+    StartCombatAction(StartCombatCommand(participant_ids=participants)).execute(state)
+
+    rounds = 1
+    while state.current_phase == Phase.COMBAT and rounds <= max_rounds:
+        actor = state.get_actor(state.current_actor)
+        target = _choose_target(actor, characters, enemies, state)
+
+        if target is not None:
+            AttackAction(AttackCommand(
+                actor_id=actor.id,
+                target_id=target.id,
+                mode="melee",
+                advantage=False,
+                disadvantage=False,
+                attack_name="",
+            )).execute(state)
+            if state.current_phase != Phase.COMBAT:
+                break
+
+        EndTurnAction(EndTurnCommand(actor.id)).execute(state)
+        if state.current_actor == state.initiative.first:
+            rounds += 1
+
+    report.runs += 1
+    report.party_max_hp = report.party_max_hp or sum(c.max_hp for c in characters)
+    if all(e.hp <= 0 for e in enemies):
+        report.wins += 1
+        report.rounds_to_win[rounds] = report.rounds_to_win.get(rounds, 0) + 1
+    elif state.current_phase == Phase.COMBAT:
+        report.timeouts += 1
+
+    for character, hp in zip(characters, start_hp):
+        key = str(character.id)
+        lost = hp - character.hp
+        report.hp_lost_total += lost
+        report.hp_lost_by_character[key] = report.hp_lost_by_character.get(key, 0) + lost
+        if character.hp <= 0:
+            report.downs_by_character[key] = report.downs_by_character.get(key, 0) + 1
+
+
+def _choose_target(actor, characters: list[Character], enemies: list[Enemy], state: GameState):
+    if isinstance(actor, Enemy):
+        alive = [c for c in characters if c.hp > 0]
+        return alive[state.rng.randint(0, len(alive) - 1)] if alive else None
+    alive = [e for e in enemies if e.hp > 0]
+    return min(alive, key=lambda e: e.hp) if alive else None
+
+
+# =========================
+# HELPERS
+# =========================
+
+def _as_character(data: Union[Character, dict]) -> Character:
+    return data if isinstance(data, Character) else json_to_character(data)
+
+
+def _as_enemy(data: Union[Enemy, dict]) -> Enemy:
+    return data if isinstance(data, Enemy) else json_to_enemy(data)
+
+
+def _unique_enemies(enemies: Iterable[Enemy]) -> list[Enemy]:
+    """El mismo enemigo invocado varias veces necesita un id por copia"""
+    seen: set = set()
+    result = []
+    for enemy in enemies:
+        if enemy.id in seen:
+            enemy = pickle.loads(pickle.dumps(enemy))
+            enemy.id = uuid.uuid4()
+        seen.add(enemy.id)
+        result.append(enemy)
+    return result
+
+
+def _split(items: list, parts: int) -> list[list]:
+    size, extra = divmod(len(items), parts)
+    chunks, start = [], 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
@@ -0,0 +1,83 @@
+from typing import Optional
+
+from src.core.character.character import Character
+from src.core.character.enemy import Enemy
+from src.features.characters.application.character_mapper import json_to_character
+from src.features.enemies.application.enemy_mapper import json_to_enemy
+from src.features.simulation.application.encounter_simulator import EncounterSimulator
+from src.features.simulation.domain.encounter_report import EncounterReport
+
+MAX_RUNS = 20000
+# Cada copia de un enemigo se clona y viaja a los workers: se limita el total
+MAX_ENEMIES = 50
+
+
+class SimulationService:
+    def __init__(self, character_repo, enemy_repo, simulator: Optional[EncounterSimulator] = None):
+        self.character_repo = character_repo
+        self.enemy_repo = enemy_repo
+        self.simulator = simulator or EncounterSimulator()
+
+    # =========================
+    # CARGA
+    # =========================
+    def load_character(self, character_id: str, owner_id: Optional[str] = None) -> Character:
+        data = self.character_repo.get_by_id(character_id)
+        if not data:
+            raise RuntimeError(f"Personaje {character_id} no encontrado")
+        if owner_id is not None and str(data["owner_id"]) != owner_id:
+            raise RuntimeError(f"Acceso denegado al personaje {character_id}")
+
+        # Igual que al armar el GameState: inventario y competencias desde DB
+        character = json_to_character(data)
+        profs = self.character_repo.get_proficiencies(character_id)
+        character.saving_throw_proficiencies = set(profs.get("saving_throw_proficiencies", []))
+        character.weapon_proficiencies = set(profs.get("weapon_proficiencies", []))
+        character.armor_proficiencies = set(profs.get("armor_proficiencies", []))
+        character.skill_proficiencies = set(profs.get("skill_proficiencies", []))
+        character.load_inventory(self.character_repo.get_inventory(character_id))
+        return character
+
+    def load_enemy(self, enemy_id: str, owner_id: Optional[str] = None) -> Enemy:
+        data = self.enemy_repo.get_by_id(enemy_id)
+        if not data:
+            raise RuntimeError(f"Enemigo {enemy_id} no encontrado")
+        if owner_id is not None and str(data["owner_id"]) != owner_id:
+            raise RuntimeError(f"Acceso denegado al enemigo {enemy_id}")
+        return json_to_enemy(data)
+
+    # =========================
+    # SIMULACIÓN
+    # =========================
+    def simulate_encounter(
+        self,
+        character_ids: list[str],
+        enemies: list[dict],
+        runs: int = 1000,
+        seed: Optional[int] = None,
+        owner_id: Optional[str] = None,
+    ) -> dict:
+        """
+        enemies: [{"id": enemy_id, "count": n}, ...]
+        Devuelve el reporte serializado, con los nombres de los personajes.
+        """
+        if runs > MAX_RUNS:
+            raise RuntimeError(f"Máximo {MAX_RUNS} corridas por simulación")
+
+        # Se valida antes de tocar la DB o multiplicar listas
+        counts = [int(entry.get("count", 1)) for entry in enemies]
+        if any(count < 1 for count in counts):
+            raise RuntimeError("Cada enemigo necesita una cantidad positiva")
+        if sum(counts) > MAX_ENEMIES:
+            raise RuntimeError(f"Máximo {MAX_ENEMIES} enemigos por simulación")
+
+        party = [self.load_character(cid, owner_id) for cid in character_ids]
+        foes: list[Enemy] = []
+        for entry, count in zip(enemies, counts):
+            enemy = self.load_enemy(entry["id"], owner_id)
+            foes.extend([enemy] * count)
+
+        report: EncounterReport = self.simulator.simulate(party, foes, runs=runs, seed=seed)
+        result = report.to_dict()
+        result["party"] = {str(c.id): c.name for c in party}
+        return result
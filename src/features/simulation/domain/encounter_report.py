@@ -0,0 +1,95 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class EncounterReport:
+    """
+    Resultado agregado de N combates simulados de un mismo encuentro.
+
+    Los contadores son sumas (no promedios) para poder mezclar reportes
+    parciales de distintos workers con `merge`.
+    """
+    runs: int = 0
+    wins: int = 0
+    timeouts: int = 0
+    # rondas que tardó el grupo en ganar -> cantidad de combates
+    rounds_to_win: dict[int, int] = field(default_factory=dict)
+    hp_lost_total: int = 0
+    # personaje -> HP perdido sumado en todas las corridas
+    hp_lost_by_character: dict[str, int] = field(default_factory=dict)
+    # personaje -> veces que terminó en 0 HP
+    downs_by_character: dict[str, int] = field(default_factory=dict)
+    party_max_hp: int = 0
+
+    # =========================
+    # MÉTRICAS
+    # =========================
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.runs if self.runs else 0.0
+
+    @property
+    def average_rounds_to_win(self) -> Optional[float]:
+        if not self.wins:
+            return None
+        return sum(rounds * count for rounds, count in self.rounds_to_win.items()) / self.wins
+
+    @property
+    def expected_hp_loss(self) -> float:
+        """HP que pierde el grupo en promedio por combate"""
+        return self.hp_lost_total / self.runs if self.runs else 0.0
+
+    @property
+    def expected_hp_loss_ratio(self) -> float:
+        """Pérdida esperada como fracción del HP máximo del grupo"""
+        return self.expected_hp_loss / self.party_max_hp if self.party_max_hp else 0.0
+
+    def difficulty(self) -> str:
+        """Estimación de dificultad a partir de victorias y HP perdido"""
+        if self.win_rate < 0.5:
+            return "deadly"
+        if self.win_rate < 0.8 or self.expected_hp_loss_ratio >= 0.6:
+            return "hard"
+        if self.expected_hp_loss_ratio >= 0.3:
+            return "medium"
+        return "easy"
+
+    # =========================
+    # AGREGACIÓN
+    # =========================
+
+    def merge(self, other: "EncounterReport") -> "EncounterReport":
+        self.runs += other.runs
+        self.wins += other.wins
+        self.timeouts += other.timeouts
+        self.hp_lost_total += other.hp_lost_total
+        self.party_max_hp = self.party_max_hp or other.party_max_hp
+        for rounds, count in other.rounds_to_win.items():
+            self.rounds_to_win[rounds] = self.rounds_to_win.get(rounds, 0) + count
+        for name, hp in other.hp_lost_by_character.items():
+            self.hp_lost_by_character[name] = self.hp_lost_by_character.get(name, 0) + hp
+        for name, downs in other.downs_by_character.items():
+            self.downs_by_character[name] = self.downs_by_character.get(name, 0) + downs
+        return self
+
+    def to_dict(self) -> dict:
+        runs = self.runs or 1
+        return {
+            "runs": self.runs,
+            "wins": self.wins,
+            "timeouts": self.timeouts,
+            "win_rate": self.win_rate,
+            "difficulty": self.difficulty(),
+            "average_rounds_to_win": self.average_rounds_to_win,
+            "rounds_to_win": {str(r): c for r, c in sorted(self.rounds_to_win.items())},
+            "expected_hp_loss": self.expected_hp_loss,
+            "expected_hp_loss_ratio": self.expected_hp_loss_ratio,
+            "expected_hp_loss_by_character": {
+                name: hp / runs for name, hp in self.hp_lost_by_character.items()
+            },
+            "down_rate_by_character": {
+                name: downs / runs for name, downs in self.downs_by_character.items()
+            },
+        }
@@ -0,0 +1,232 @@
+from typing import Optional
+from uuid import UUID
+
+from src.core.character.minion_group import Minion, MinionGroup
+from src.core.game.Event import EventSink, GameState
+from src.core.game.querys import GetArmorClass
+from src.shared.utils.tokens_utils import serialize_token
+
+# Eventos que reconstruyen el orden de iniciativa entero
+INITIATIVE_REBUILT = frozenset({"combat_started", "initiative_completed", "combat_ended"})
+# Eventos que agregan una entidad (y su token) al mapa
+ENTITY_ADDED = frozenset({"enemy_created", "minion_group_created"})
+
+
+class StateDeltaService(EventSink):
+    """
+    Cambios del GameState como deltas compactos, para no reenviar
+    tokens_sync / entities_result completos después de cada acción.
+
+    - on_event solo anota qué se tocó (actor, token, iniciativa): O(1)
+    - al cerrar cada evento raíz (on_commit) se leen los valores actuales
+      de lo tocado y se comparan contra lo último publicado; lo que cambió
+      de verdad se agrega al lote pendiente y sube state.version
+    - `take()` entrega el lote acumulado desde la última vez; un mismo
+      campo tocado varias veces viaja una sola vez con su último valor
+
+    Formato de cada cambio (ids como string):
+        {"t": "hp", "id", "hp"}
+        {"t": "status", "id", "status", "on"}
+        {"t": "token", "id", "x", "y"}
+        {"t": "token+", "token"}              token serializado entero
+        {"t": "entity+", "entity"}            stat block para el panel del DM
+        {"t": "turn", "actor", "phase"}
+        {"t": "initiative", "order"}          el orden entero (se rearmó)
+        {"t": "initiative-", "id"}            un actor salió del orden
+    """
+
+    def __init__(self):
+        self.state: Optional[GameState] = None
+        # Último valor publicado por actor: hp y estados
+        self._hp: dict[UUID, int] = {}
+        self._statuses: dict[UUID, frozenset] = {}
+        self._turn: tuple = (None, None)
+        # Tocado desde el último commit
+        self._actors: set[UUID] = set()
+        self._tokens: set = set()
+        self._added: list[tuple[str, UUID]] = []
+        self._removed_from_initiative: list[UUID] = []
+        self._initiative_rebuilt = False
+        # Lote pendiente de publicar: clave -> cambio (orden de primera aparición)
+        self._pending: dict[tuple, dict] = {}
+        self._changed = False
+        self._from_version = 0
+
+    def attach(self, state: GameState) -> None:
+        if self not in state.event_sinks:
+            state.event_sinks.append(self)
+        self.state = state
+        self._from_version = state.version
+        # Línea base: lo que el cliente recibe en el snapshot completo
+        for actor in state.iter_combatants():
+            if isinstance(actor, MinionGroup):
+                continue
+            self._hp[actor.id] = actor.hp
+            self._statuses[actor.id] = _statuses_of(actor)
+        self._turn = _turn_of(state)
+
+    def detach(self, state: GameState) -> None:
+        if self in state.event_sinks:
+            state.event_sinks.remove(self)
+        self.state = None
+
+    # -------------------------
+    # EventSink
+    # -------------------------
+    def on_event(self, event, depth: int) -> None:
+        ctx = event.context
+        if ctx is not None:
+            if ctx.actor_id is not None:
+                self._actors.add(ctx.actor_id)
+            if ctx.target_id is not None:
+                self._actors.add(ctx.target_id)
+
+        event_type = event.type
+        if event_type == "token_moved":
+            self._tokens.add(event.payload["token_id"])
+        elif event_type == "tokens_moved":
+            self._tokens.update(move["token_id"] for move in event.payload["moves"])
+        elif event_type == "area_damage":
+            for result in event.payload.get("results", ()):
+                self._actors.add(result["target_id"])
+        elif event_type == "entity_killed" and ctx is not None:
+            self._removed_from_initiative.append(ctx.actor_id)
+        elif event_type in ENTITY_ADDED:
+            if event_type == "enemy_created":
+                self._added.append(("enemy", UUID(str(event.payload["id"]))))
+            else:
+                self._added.append(("minion_group", ctx.actor_id))
+        if event_type in INITIATIVE_REBUILT:
+            self._initiative_rebuilt = True
+        if event_type == "combat_ended":
+            # Al cerrar el combate se limpian los estados de todos sin un evento por actor
+            self._actors.update(self._hp)
+
+    def on_commit(self, state: GameState) -> None:
+        if state is not self.state:
+            return
+
+        for kind, entity_id in self._added:
+            self._entity_added(state, kind, entity_id)
+        for actor_id in self._actors:
+            self._actor_changed(state, actor_id)
+        for token_id in self._tokens:
+            token = state.tokens.get(token_id)
+            if token is not None:
+                self._put(("token", str(token_id)), {
+                    "t": "token", "id": str(token_id), "x": token["x"], "y": token["y"]
+                })
+
+        if self._initiative_rebuilt:
+            self._put(("initiative",), {
+                "t": "initiative", "order": [str(actor_id) for actor_id in state.initiative]
+            })
+        else:
+            for actor_id in self._removed_from_initiative:
+                self._put(("initiative-", str(actor_id)), {"t": "initiative-", "id": str(actor_id)})
+
+        turn = _turn_of(state)
+        if turn != self._turn:
+            self._turn = turn
+            actor_id, phase = turn
+            self._put(("turn",), {
+                "t": "turn", "actor": str(actor_id) if actor_id else None, "phase": phase
+            })
+
+        self._actors.clear()
+        self._tokens.clear()
+        self._added.clear()
+        self._removed_from_initiative.clear()
+        self._initiative_rebuilt = False
+
+        if self._changed:
+            state.version += 1
+            self._changed = False
+
+    # -------------------------
+    # PUBLICACIÓN
+    # -------------------------
+    def take(self) -> Optional[dict]:
+        """
+        Lote de cambios desde la última publicación, o None si no hubo.
+        `from` es la versión que el cliente debe tener para aplicarlo;
+        si no coincide, tiene que pedir el snapshot completo.
+        """
+        if not self._pending or self.state is None:
+            return None
+        batch = {
+            "from": self._from_version,
+            "version": self.state.version,
+            "changes": list(self._pending.values()),
+        }
+        self._pending.clear()
+        self._from_version = self.state.version
+        return batch
+
+    def _put(self, key: tuple, change: dict) -> None:
+        # Mismo campo tocado otra vez antes de publicar: gana el último valor
+        self._pending[key] = change
+        self._changed = True
+
+    def _actor_changed(self, state: GameState, actor_id) -> None:
+        actor = state.get_actor(actor_id)
+        if actor is None or isinstance(actor, MinionGroup):
+            return
+        actor_id = actor.id
+
+        hp = actor.hp
+        if self._hp.get(actor_id) != hp:
+            self._hp[actor_id] = hp
+            self._put(("hp", str(actor_id)), {"t": "hp", "id": str(actor_id), "hp": hp})
+
+        statuses = _statuses_of(actor)
+        before = self._statuses.get(actor_id, frozenset())
+        if statuses != before:
+            self._statuses[actor_id] = statuses
+            for status in statuses - before:
+                self._put(("status", str(actor_id), status),
+                          {"t": "status", "id": str(actor_id), "status": status, "on": True})
+            for status in before - statuses:
+                self._put(("status", str(actor_id), status),
+                          {"t": "status", "id": str(actor_id), "status": status, "on": False})
+
+    def _entity_added(self, state: GameState, kind: str, entity_id: UUID) -> None:
+        token = state.tokens.get(str(entity_id))
+        if token is not None:
+            self._put(("token+", str(entity_id)), {"t": "token+", "token": serialize_token(token)})
+
+        if kind == "minion_group":
+            # El grupo viaja como su stat block con arrays (minion_group_created)
+            return
+        enemy = state.get_actor(entity_id)
+        if enemy is None:
+            return
+        self._hp[enemy.id] = enemy.hp
+        self._statuses[enemy.id] = _statuses_of(enemy)
+        self._put(("entity+", str(enemy.id)), {"t": "entity+", "entity": {
+            "id": str(enemy.id),
+            "kind": kind,
+            "name": enemy.name,
+            "hp": enemy.hp,
+            "max_hp": enemy.max_hp,
+            "ac": state.query(GetArmorClass(actor_id=enemy.id, context="ui")).value,
+            "texture": enemy.asset_url,
+        }})
+
+
+def _statuses_of(actor) -> frozenset:
+    if isinstance(actor, Minion):
+        return frozenset(actor.conditions)
+    return frozenset(actor.status)
+
+
+def _turn_of(state: GameState) -> tuple:
+    phase = state.current_phase
+    return state.current_actor, str(phase) if phase is not None else None
+
+
+def deltas_of(state: GameState) -> StateDeltaService | None:
+    for sink in state.event_sinks:
+        if isinstance(sink, StateDeltaService):
+            return sink
+    return None
@@ -0,0 +1,48 @@
+from src.core.game.Event import GameState, MoveTokensEvent
+
+# Ticks por segundo en que se aplican los movimientos de una campaña
+DEFAULT_TICK_HZ = 20
+
+
+class MovementAggregator:
+    """
+    Junta los pedidos de movimiento de una campaña y los aplica por ticks.
+
+    - `submit` solo guarda la última posición pedida por token (O(1), sin
+      despachar nada): arrastrar un token o un DM moviendo muchos a la vez
+      no genera un evento por mensaje
+    - `flush` aplica todo lo pendiente como un único evento tokens_moved;
+      el trabajo por campaña queda acotado a un lote por tick sin importar
+      cuántos mensajes manden los clientes
+    - `running` lo maneja quien corre el loop: el loop arranca con el primer
+      pedido y se detiene en el primer tick sin movimientos
+    """
+
+    def __init__(self, tick_hz: int = DEFAULT_TICK_HZ):
+        self.tick_seconds = 1 / tick_hz
+        self.running = False
+        self._pending: dict = {}
+        self.received = 0
+        self.applied = 0
+
+    def submit(self, token_id, x: int, y: int) -> None:
+        self.received += 1
+        # Reinsertar deja al token al final: el lote respeta el orden del último pedido
+        self._pending.pop(token_id, None)
+        self._pending[token_id] = (x, y)
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def flush(self, state: GameState) -> int:
+        """Aplica el lote pendiente; devuelve cuántos tokens movió"""
+        if not self._pending:
+            return 0
+        moves = [
+            {"token_id": token_id, "x": x, "y": y}
+            for token_id, (x, y) in self._pending.items()
+        ]
+        self._pending.clear()
+        state.dispatch(MoveTokensEvent(moves))
+        self.applied += len(moves)
+        return len(moves)
@@ -0,0 +1,142 @@
+import time
+from typing import Callable, Optional
+
+# Ticks por segundo en que se reenvían las previsualizaciones a la sala
+DEFAULT_TICK_HZ = 30
+# Presupuesto por cliente: mensajes por segundo sostenidos y ráfaga máxima
+DEFAULT_RATE = 60
+DEFAULT_BURST = 20
+# Coordenadas aceptadas (en tiles); una preview fuera de esto es basura
+MAX_COORD = 10_000
+
+
+def _point(data: dict, x_key: str = "x", y_key: str = "y") -> tuple[int, int]:
+    x, y = int(data[x_key]), int(data[y_key])
+    if not (-MAX_COORD <= x <= MAX_COORD and -MAX_COORD <= y <= MAX_COORD):
+        raise ValueError("Coordenadas fuera de rango")
+    return x, y
+
+
+def _drag(data: dict) -> tuple[str, Optional[dict]]:
+    token_id = str(data["token_id"])
+    if data.get("done"):
+        return token_id, None
+    x, y = _point(data)
+    return token_id, {"token_id": token_id, "x": x, "y": y}
+
+
+def _ruler(data: dict) -> tuple[str, Optional[dict]]:
+    if data.get("done"):
+        return "ruler", None
+    from_x, from_y = _point(data, "from_x", "from_y")
+    to_x, to_y = _point(data, "to_x", "to_y")
+    return "ruler", {"from_x": from_x, "from_y": from_y, "to_x": to_x, "to_y": to_y}
+
+
+def _ping(data: dict) -> tuple[str, dict]:
+    x, y = _point(data)
+    return "ping", {"x": x, "y": y}
+
+
+# tipo -> normalizador: (clave dentro del tipo, datos limpios o None para borrar)
+PREVIEW_KINDS: dict[str, Callable[[dict], tuple[str, Optional[dict]]]] = {
+    "drag": _drag,
+    "ruler": _ruler,
+    "ping": _ping,
+}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class PreviewRelay:
+    """
+    Canal efímero de una campaña: arrastres en curso, reglas y pings.
+
+    No toca el GameState, no pasa por dispatch ni queda en el event_log:
+    solo reenvía a la sala lo último que mandó cada cliente.
+
+    - por (cliente, tipo, clave) gana el último valor; en cada tick se
+      manda un solo lote con lo que cambió desde el anterior
+    - cada cliente tiene un token bucket: lo que excede el presupuesto se
+      descarta (el próximo mensaje trae una posición más nueva igual)
+    - datos None = esa preview terminó (el cliente la borra)
+
+    El destino final de un arrastre sigue siendo un move_token normal.
+    """
+
+    def __init__(
+        self,
+        tick_hz: int = DEFAULT_TICK_HZ,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.tick_seconds = 1 / tick_hz
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.running = False
+        self._buckets: dict[str, TokenBucket] = {}
+        self._pending: dict[tuple, dict] = {}
+        # Previews vivas por cliente, para poder borrarlas si se desconecta
+        self._active: dict[str, set[tuple[str, str]]] = {}
+        self.dropped = 0
+
+    def submit(self, sender: str, kind: str, data: dict) -> bool:
+        """
+        Anota una preview. Devuelve False si el cliente excedió su presupuesto.
+        Lanza RuntimeError si el tipo o los datos no son válidos.
+        """
+        normalize = PREVIEW_KINDS.get(kind)
+        if normalize is None:
+            raise RuntimeError(f"Tipo de preview desconocido: {kind}")
+
+        now = self.clock()
+        bucket = self._buckets.get(sender)
+        if bucket is None:
+            bucket = self._buckets[sender] = TokenBucket(self.rate, self.burst, now)
+        if not bucket.take(now):
+            self.dropped += 1
+            return False
+
+        try:
+            key, clean = normalize(data)
+        except (KeyError, TypeError, ValueError) as e:
+            raise RuntimeError(f"Preview inválida: {e}")
+
+        active = self._active.setdefault(sender, set())
+        if clean is None:
+            active.discard((kind, key))
+        elif kind != "ping":
+            # Un ping no queda "vivo": el cliente lo muestra y lo deja morir solo
+            active.add((kind, key))
+        self._pending[(sender, kind, key)] = {"from": sender, "kind": kind, "key": key, "data": clean}
+        return True
+
+    def drop_sender(self, sender: str) -> None:
+        """Cliente desconectado: sus previews vivas se borran en el próximo tick"""
+        self._buckets.pop(sender, None)
+        for kind, key in self._active.pop(sender, ()):
+            self._pending[(sender, kind, key)] = {"from": sender, "kind": kind, "key": key, "data": None}
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def take(self) -> list[dict]:
+        items = list(self._pending.values())
+        self._pending.clear()
+        return items
@@ -31,6 +31,9 @@ from src.features.world.infrastructure.MySQLTokenRepository import MySQLTokenRep
 from src.features.world.application.token_service import TokenService
 from src.features.enemies.application.enemy_service import EnemyService
 from src.features.enemies.infrastructure.enemy_repository import EnemyRepository
+from src.features.simulation.application.simulation_service import SimulationService
+from src.features.analytics.application.dpr_service import DprService
+from src.features.analytics.infrastructure.file_analytics_cache import FileAnalyticsCache
 
 # Utils
 from src.shared.utils.gen_code import generate_campaign_code
@@ -83,6 +86,8 @@ def create_app(campaigns_dict: dict, worlds_dict: dict, game_states_dict: dict):
     token_service = TokenService(token_repo)
     enemy_repo = EnemyRepository()
     enemy_service = EnemyService(enemy_repo)
+    simulation_service = SimulationService(character_repo, enemy_repo)
+    dpr_service = DprService(FileAnalyticsCache())
     # Store shared dictionaries in app config
     app.config['CAMPAIGNS'] = campaigns_dict
     app.config['WORLDS'] = worlds_dict
@@ -105,6 +110,8 @@ def create_app(campaigns_dict: dict, worlds_dict: dict, game_states_dict: dict):
     def inject_services():
         g.auth_service = auth_service
         g.enemy_service = enemy_service
+        g.simulation_service = simulation_service
+        g.dpr_service = dpr_service
         g.character_service = character_service
         g.campaign_service = campaign_service
         g.world_service = world_service
@@ -117,7 +124,9 @@ def create_app(campaigns_dict: dict, worlds_dict: dict, game_states_dict: dict):
         "world_service": world_service,
         "section_service": section_service,
         "token_service": token_service,
-        "enemy_service": enemy_service
+        "enemy_service": enemy_service,
+        "simulation_service": simulation_service,
+        "dpr_service": dpr_service
     }
     app.extensions["repos"] = {
         "user_repo": user_repo,
@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, g
 from src.core.character.dndclass import CLASS_MAP
 classes_bp = Blueprint("classes", __name__)
 
@@ -52,3 +52,27 @@ def all_classes():
         }
 
     return jsonify(result)
+
+
+@classes_bp.route("/dpr")
+def damage_per_round():
+    """
+    Daño por ronda esperado y percentiles por nivel/arma contra un rango de AC.
+    Query params opcionales: class, ac_min, ac_max
+    """
+    class_name = request.args.get("class")
+
+    try:
+        ac_min = int(request.args.get("ac_min", 10))
+        ac_max = int(request.args.get("ac_max", 20))
+    except ValueError:
+        return jsonify({"error": "AC inválida"}), 400
+    if ac_min > ac_max or ac_max - ac_min > 30:
+        return jsonify({"error": "Rango de AC inválido"}), 400
+
+    try:
+        table = g.dpr_service.damage_table(range(ac_min, ac_max + 1), class_key=class_name)
+    except RuntimeError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(table)
@@ -1,5 +1,6 @@
 import os
 import uuid
+from eventlet import tpool
 from flask import Blueprint, request, jsonify, g
 
 enemy_bp = Blueprint("enemy", __name__)
@@ -10,6 +11,9 @@ enemy_bp = Blueprint("enemy", __name__)
 def get_enemy_service():
     return g.enemy_service
 
+def get_simulation_service():
+    return g.simulation_service
+
 def get_auth_service():
     return g.auth_service
 
@@ -148,6 +152,34 @@ def delete_enemy():
     return jsonify({"success": deleted}), 200
 
 
+@enemy_bp.post("/simulate")
+def simulate_encounter():
+    owner_id = get_current_user_id()
+    if not owner_id:
+        return jsonify({"error": "No autenticado"}), 401
+
+    data = request.json or {}
+    character_ids = data.get("character_ids", [])
+    enemies = data.get("enemies", [])
+    if not character_ids or not enemies:
+        return jsonify({"error": "Se requieren personajes y enemigos"}), 400
+
+    try:
+        # Corre en un hilo nativo: el pool de procesos no bloquea el hub de eventlet
+        report = tpool.execute(
+            get_simulation_service().simulate_encounter,
+            character_ids,
+            enemies,
+            runs=int(data.get("runs", 1000)),
+            seed=data.get("seed"),
+            owner_id=owner_id,
+        )
+    except (RuntimeError, ValueError, KeyError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(report), 200
+
+
 @enemy_bp.post("/upload")
 def upload_enemy_asset():
     if "file" not in request.files:
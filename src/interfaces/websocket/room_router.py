@@ -0,0 +1,134 @@
+"""
+Routing de broadcasts por sala de campaña.
+
+Toda emisión de estado de juego pasa por acá y siempre lleva campaña:
+nada sale a todos los clientes del nodo. Dentro de la campaña hay
+subsalas por rol (DM / jugadores) y una por usuario.
+"""
+
+from enum import Enum
+from typing import Any, Optional
+
+from flask_socketio import close_room, join_room, leave_room
+
+
+class Audience(Enum):
+    CAMPAIGN = "campaign"   # todos los de la campaña
+    DM = "dm"
+    PLAYERS = "players"
+    USER = "user"           # un usuario (todas sus pestañas)
+
+
+def campaign_room(campaign_code: str) -> str:
+    # La sala de la campaña es el propio código (lobby.js y game.js ya la usan)
+    return campaign_code
+
+
+def dm_room(campaign_code: str) -> str:
+    return f"{campaign_code}:dm"
+
+
+def players_room(campaign_code: str) -> str:
+    return f"{campaign_code}:players"
+
+
+def user_room(campaign_code: str, user_id: str) -> str:
+    return f"{campaign_code}:user:{user_id}"
+
+
+class RoomRouter:
+    def __init__(self, socketio):
+        self.socketio = socketio
+        # sid -> (campaña, salas a las que se unió)
+        self._memberships: dict[str, tuple[str, tuple[str, ...]]] = {}
+        # campaña -> usuarios con sala propia (para cerrarlas al terminar)
+        self._users: dict[str, set[str]] = {}
+
+    # =========================
+    # MEMBRESÍAS
+    # =========================
+
+    def join(self, sid: str, campaign_code: str, user_id: str, is_dm: bool) -> None:
+        """Une el socket a la sala de la campaña, la de su rol y la de su usuario"""
+        self.leave(sid)
+        rooms = (
+            campaign_room(campaign_code),
+            dm_room(campaign_code) if is_dm else players_room(campaign_code),
+            user_room(campaign_code, user_id),
+        )
+        for room in rooms:
+            join_room(room, sid=sid)
+        self._memberships[sid] = (campaign_code, rooms)
+        self._users.setdefault(campaign_code, set()).add(user_id)
+
+    def leave(self, sid: str) -> None:
+        membership = self._memberships.pop(sid, None)
+        if membership is None:
+            return
+        for room in membership[1]:
+            leave_room(room, sid=sid)
+
+    def forget(self, sid: str) -> None:
+        """Socket desconectado: Socket.IO ya lo sacó de sus salas"""
+        self._memberships.pop(sid, None)
+
+    def campaign_of(self, sid: str) -> Optional[str]:
+        membership = self._memberships.get(sid)
+        return membership[0] if membership else None
+
+    def is_dm(self, sid: str, campaign_code: str) -> bool:
+        """El socket se unió a la campaña como DM (está en su sala de rol)"""
+        membership = self._memberships.get(sid)
+        return bool(membership) and dm_room(campaign_code) in membership[1]
+
+    def close(self, campaign_code: str) -> None:
+        """Fin de la campaña: se cierran todas sus salas"""
+        rooms = [campaign_room(campaign_code), dm_room(campaign_code), players_room(campaign_code)]
+        rooms += [user_room(campaign_code, user_id) for user_id in self._users.pop(campaign_code, ())]
+        for room in rooms:
+            close_room(room)
+        for sid in [sid for sid, (code, _) in self._memberships.items() if code == campaign_code]:
+            del self._memberships[sid]
+
+    # =========================
+    # EMISIÓN
+    # =========================
+
+    def emit(
+        self,
+        event: str,
+        data: Any = None,
+        *,
+        campaign: str,
+        audience: Audience = Audience.CAMPAIGN,
+        user_id: Optional[str] = None,
+        skip_sid: Optional[str] = None,
+    ) -> None:
+        if not campaign:
+            raise RuntimeError(f"'{event}' sin campaña: no se emite a todo el servidor")
+
+        if audience is Audience.CAMPAIGN:
+            room = campaign_room(campaign)
+        elif audience is Audience.DM:
+            room = dm_room(campaign)
+        elif audience is Audience.PLAYERS:
+            room = players_room(campaign)
+        else:
+            if not user_id:
+                raise RuntimeError(f"'{event}' para un usuario sin user_id")
+            room = user_room(campaign, str(user_id))
+
+        args = () if data is None else (data,)
+        self.socketio.emit(event, *args, to=room, skip_sid=skip_sid)
+
+    def to_campaign(self, campaign: str, event: str, data: Any = None) -> None:
+        self.emit(event, data, campaign=campaign)
+
+    def to_dm(self, campaign: str, event: str, data: Any = None) -> None:
+        self.emit(event, data, campaign=campaign, audience=Audience.DM)
+
+    def to_players(self, campaign: str, event: str, data: Any = None) -> None:
+        self.emit(event, data, campaign=campaign, audience=Audience.PLAYERS)
+
+    def to_user(self, campaign: str, user_id: str, event: str, data: Any = None) -> None:
+        self.emit(event, data, campaign=campaign, audience=Audience.USER, user_id=user_id)
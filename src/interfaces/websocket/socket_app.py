@@ -3,27 +3,39 @@ WebSocket Handlers
 Handles all real-time socket communication events
 """
 
+import logging
 from uuid import UUID, uuid4
+from typing import Optional
+from eventlet import tpool
 from flask import request
-from flask_socketio import emit, join_room
+from flask_socketio import emit
 from numpy import character
 
 # Models and queries
 from src.core.combat.phase import Phase
-from src.core.game.Action import AttackAction, EndTurnAction, StartCombatAction
-from src.core.game.commands import AttackCommand, EndTurnCommand, StartCombatCommand
+from src.core.game.Action import AreaEffectAction, AttackAction, EndTurnAction, StartCombatAction
+from src.core.game.commands import AreaEffectCommand, AttackCommand, EndTurnCommand, StartCombatCommand
 from src.shared.utils.items_utils import serialize_item_instance, item_instances, ItemInstance
 from src.core.character.character import Character
+from src.core.character.minion_group import MAX_INVOKE_COUNT, new_group_id
 from src.shared.utils.game_state_builder import build_game_state
-from src.core.game.Event import MoveTokenEvent, Event
-from src.core.game.querys import GetArmorClass, GetEntities
+from src.core.game.Event import Event, InventoryChangedEvent
+from src.core.game.querys import GetArmorClass, GetArmorClassBatch, GetEntities, GetStatModifiersBatch
 
 # Services
 from src.features.auth.application.auth_service import AuthService
 from src.features.campaigns.infrastructure.mysql_campaign_repository import MySQLCampaignRepository
 from src.features.characters.infrastructure.character_repository import CharacterRepository
+from src.features.enemies.application.enemy_turn_planner import EnemyTurnPlanner, execute_plan
+from src.features.journal.application.journal_service import FLUSH_INTERVAL, journal_of
+from src.features.sync.application.delta_service import deltas_of
+from src.features.sync.application.movement_aggregator import MovementAggregator
+from src.features.sync.application.preview_relay import PreviewRelay
+from src.interfaces.websocket.room_router import RoomRouter
 from src.shared.utils.tokens_utils import serialize_token
 
+logger = logging.getLogger(__name__)
+
 def register_socket_handlers(
     socketio,
     campaigns_dict: dict,
@@ -32,7 +44,9 @@ def register_socket_handlers(
     socket_campaigns_dict: dict,
     auth_service: AuthService,
     campaign_repo: MySQLCampaignRepository,
-    character_repo: CharacterRepository
+    character_repo: CharacterRepository,
+    enemy_planner: Optional[EnemyTurnPlanner] = None,
+    room_router: Optional[RoomRouter] = None
 ):  
     
     """
@@ -47,7 +61,19 @@ def register_socket_handlers(
         auth_service: Authentication service
         campaign_repo: Campaign repository
         character_repo: Character repository
+        enemy_planner: Planificador de turnos automáticos de enemigos
+        room_router: Salas por campaña / rol / usuario para los broadcasts
     """
+    turn_planner = enemy_planner or EnemyTurnPlanner()
+    # Todo broadcast de juego sale por acá, siempre a una sala de la campaña
+    router = room_router or RoomRouter(socketio)
+    # Campañas con turnos de enemigos automáticos / con un plan en curso
+    enemy_autoplay: set[str] = set()
+    planning_turns: set[str] = set()
+    # Movimientos pendientes por campaña, aplicados por ticks
+    movement_aggregators: dict[str, MovementAggregator] = {}
+    # Canal efímero de previsualizaciones (arrastres, reglas, pings) por campaña
+    preview_relays: dict[str, PreviewRelay] = {}
     
     def get_game_state(campaign_code: str):
         """Helper to get or create game state"""
@@ -61,6 +87,36 @@ def register_socket_handlers(
             )
         return game_states_dict[campaign_code]
 
+    def broadcast_deltas(campaign_code: str) -> None:
+        """Publica a la sala de la campaña los cambios acumulados desde el último envío"""
+        state = game_states_dict.get(campaign_code)
+        deltas = deltas_of(state) if state is not None else None
+        if deltas is None:
+            return
+        batch = deltas.take()
+        if batch is not None:
+            router.to_campaign(campaign_code, "state_delta", batch)
+
+    def run_journal_flushes():
+        """
+        Cada FLUSH_INTERVAL lleva a disco el journal de todas las campañas,
+        aunque no llegue ningún evento más: nada queda solo en memoria.
+        Corre entre mensajes, así el checkpoint nunca ve una acción a medias.
+        """
+        while True:
+            socketio.sleep(FLUSH_INTERVAL)
+            for campaign_code, state in list(game_states_dict.items()):
+                journal = journal_of(state)
+                if journal is None:
+                    continue
+                try:
+                    journal.flush(state)
+                except Exception:
+                    # Una campaña con problemas no frena el journal del resto
+                    logger.exception("Journal de %s: no se pudo hacer el checkpoint", campaign_code)
+
+    socketio.start_background_task(run_journal_flushes)
+
     @socketio.on("connect")
     def handle_connect():
         sid = request.sid  # type: ignore
@@ -95,14 +151,14 @@ def register_socket_handlers(
         if not user:
             return
 
-        join_room(code)
         socket_campaigns_dict[request.sid] = code  # type: ignore
         user_id = str(user.id)
         campaign_id = campaigns_dict[code]["campaign_id"]
 
         # Determine if user is DM
         campaign = campaign_repo.get_by_id(campaign_id)
-        is_dm = campaign and str(campaign["owner_id"]) == user_id
+        is_dm = bool(campaign and str(campaign["owner_id"]) == user_id)
+        router.join(sid, code, user_id, is_dm)
 
         players = campaigns_dict[code]["players"]
 
@@ -115,11 +171,7 @@ def register_socket_handlers(
             "is_dm": is_dm
         }
 
-        emit(
-            "player_joined",
-            {"players": list(players.values())},
-            to=code
-        )
+        router.to_campaign(code, "player_joined", {"players": list(players.values())})
 
     @socketio.on("start_campaign")
     def start_game(data):
@@ -144,11 +196,7 @@ def register_socket_handlers(
             )
             return
 
-        emit(
-            "campaign_started",
-            {"code": code},
-            to=code
-        )
+        router.to_campaign(code, "campaign_started", {"code": code})
 
     @socketio.on("disconnect")
     def handle_disconnect():
@@ -156,6 +204,13 @@ def register_socket_handlers(
 
         if sid in connected_clients_dict:
             del connected_clients_dict[sid]
+        router.forget(sid)
+
+        # Sus previews vivas (un arrastre a medias) se borran para el resto de la sala
+        relay = preview_relays.get(socket_campaigns_dict.get(sid))
+        if relay is not None:
+            relay.drop_sender(sid)
+            start_preview_ticks(socket_campaigns_dict.get(sid), relay)
 
     @socketio.on("select_character")
     def handle_select_character(data):
@@ -176,11 +231,7 @@ def register_socket_handlers(
                 player["character_name"] = character["name"]
                 break
 
-        emit(
-            "player_joined",
-            {"players": list(campaigns_dict[code]["players"].values())},
-            to=code
-        )
+        router.to_campaign(code, "player_joined", {"players": list(campaigns_dict[code]["players"].values())})
 
     @socketio.on("chat_message")
     def handle_chat_message(data):
@@ -198,14 +249,10 @@ def register_socket_handlers(
                 sender = player["username"]
                 break
 
-        emit(
-            "chat_message",
-            {
-                "sender": sender,
-                "text": text
-            },
-            to=code
-        )
+        router.to_campaign(code, "chat_message", {
+            "sender": sender,
+            "text": text
+        })
 
     @socketio.on("get_ac")
     def handle_get_ac(data):
@@ -245,22 +292,79 @@ def register_socket_handlers(
     def handle_move_token(data):
         campaign_code = data["campaign_code"]
         token_id = data["token_id"]
-        x = data["x"]
-        y = data["y"]
-        state = game_states_dict[campaign_code]
-        event = MoveTokenEvent(token_id=token_id, x=x, y=y)  # type: ignore
+        state = game_states_dict.get(campaign_code)
+        if state is None:
+            emit("error", {"message": "Campaign not found"})
+            return
+        if token_id not in state.tokens:
+            emit("error", {"message": "Token no existe"})
+            return
+
+        # Solo se anota la última posición: se aplica en el próximo tick
+        aggregator = movement_aggregators.setdefault(campaign_code, MovementAggregator())
+        aggregator.submit(token_id, int(data["x"]), int(data["y"]))
+        if not aggregator.running:
+            aggregator.running = True
+            socketio.start_background_task(run_movement_ticks, campaign_code)
+
+    @socketio.on("preview")
+    def handle_preview(data):
+        """
+        Previsualización efímera (drag / ruler / ping): no toca el GameState
+        ni el event_log, solo se reenvía a la sala en el próximo tick.
+        """
+        sid = request.sid  # type: ignore
+        campaign_code = socket_campaigns_dict.get(sid)
+        if not campaign_code:
+            return
+
+        relay = preview_relays.setdefault(campaign_code, PreviewRelay())
         try:
-            state.dispatch(event)
-            
-            emit("token_moved", {
-                "token_id": token_id,
-                "x": x,
-                "y": y
-            }, to=campaign_code)
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
+            accepted = relay.submit(sid, data.get("kind"), data.get("data") or {})
+        except RuntimeError as e:
             emit("error", {"message": str(e)})
+            return
+        if accepted:
+            start_preview_ticks(campaign_code, relay)
+
+    def start_preview_ticks(campaign_code: str, relay: PreviewRelay) -> None:
+        if not relay.running and relay.has_pending():
+            relay.running = True
+            socketio.start_background_task(run_preview_ticks, campaign_code, relay)
+
+    def run_preview_ticks(campaign_code: str, relay: PreviewRelay):
+        """Un lote "previews" por tick mientras haya algo nuevo; se detiene al quedar quieto"""
+        try:
+            while True:
+                socketio.sleep(relay.tick_seconds)
+                if not relay.has_pending():
+                    return
+                router.to_campaign(campaign_code, "previews", {"items": relay.take()})
+        finally:
+            relay.running = False
+
+    def run_movement_ticks(campaign_code: str):
+        """
+        Loop de movimientos de una campaña: cada tick aplica el lote pendiente
+        y publica un solo state_delta con todos los tokens que cambiaron.
+        Termina en el primer tick sin movimientos (el próximo pedido lo relanza).
+        """
+        aggregator = movement_aggregators.get(campaign_code)
+        if aggregator is None:
+            return
+        try:
+            while True:
+                socketio.sleep(aggregator.tick_seconds)
+                state = game_states_dict.get(campaign_code)
+                if state is None or not aggregator.has_pending():
+                    return
+                try:
+                    aggregator.flush(state)
+                except RuntimeError as e:
+                    router.to_campaign(campaign_code, "error", {"message": str(e)})
+                broadcast_deltas(campaign_code)
+        finally:
+            aggregator.running = False
 
     @socketio.on("load_game_resources")
     def handle_load_game_resources(data):
@@ -454,14 +558,87 @@ def register_socket_handlers(
             traceback.print_exc()
             emit("error", {"message": str(e)})
             return
-        token_data = serialize_token(state.tokens[token_id])
-        token_data["enemy_id"] = enemy_id 
-        print(token_data)
-        socketio.emit(
-            "enemy_created",
-            token_data,
-            to=campaign_code
+        # Token y stat block nuevos viajan como deltas (token+ / entity+)
+        broadcast_deltas(campaign_code)
+
+    @socketio.on("invoke_minion_group")
+    def handle_invoke_minion_group(data):
+        campaign_code = data.get("campaign_code")
+        enemy_id = data.get("enemy_id")
+
+        if not campaign_code or not enemy_id:
+            emit("error", {"message": "Missing campaign_code or enemy_id"})
+            return
+
+        state = game_states_dict.get(campaign_code)
+        if not state:
+            emit("error", {"message": "Invalid campaign"})
+            return
+
+        try:
+            count = int(data.get("count", 1))
+        except (TypeError, ValueError):
+            count = 0
+        if count < 1:
+            emit("error", {"message": "Invalid count: must be at least 1"})
+            return
+        count = min(count, MAX_INVOKE_COUNT)
+
+        # Un solo fetch a la DB para todo el grupo
+        from flask import current_app
+        enemy = current_app.extensions["repos"]["enemy_repo"].get_by_id(enemy_id)
+        if not enemy:
+            emit("error", {"message": "Enemy not found"})
+            return
+
+        group_id = new_group_id()
+        event = Event(
+            type="create_minion_group",
+            payload={
+                "id": str(group_id),
+                "count": count,
+                "positions": [tuple(p) for p in data.get("positions", [])[:count]],
+                "name": enemy["name"],
+                "hp": enemy["hp"],
+                "max_hp": enemy["max_hp"],
+                "ac": enemy["ac"],
+                "asset_url": enemy.get("asset_url"),
+                "size": (enemy.get("size_x", 1), enemy.get("size_y", 1)),
+                "attributes": {
+                    "STR": enemy.get("str", 10),
+                    "DEX": enemy.get("dex", 10),
+                    "CON": enemy.get("con", 10),
+                    "INT": enemy.get("int_stat", 10),
+                    "WIS": enemy.get("wis", 10),
+                    "CHA": enemy.get("cha", 10),
+                },
+                "attacks": [
+                    {
+                        "name": atk["name"],
+                        "dice_count": atk["dice_count"],
+                        "dice_size": atk["dice_size"],
+                        "damage_bonus": atk.get("damage_bonus", 0),
+                        "attack_bonus": atk.get("attack_bonus", 0),
+                        "damage_type": atk.get("damage_type", "slashing"),
+                    }
+                    for atk in (enemy.get("attacks") or [])
+                ],
+            },
+            cancelable=False
         )
+
+        try:
+            state.dispatch(event)
+        except Exception as e:
+            emit("error", {"message": str(e)})
+            return
+
+        group_data = state.minion_groups[group_id].to_json()
+        group_data["enemy_id"] = enemy_id
+        broadcast_deltas(campaign_code)
+        # El stat block con los arrays del grupo es información del DM
+        router.to_dm(campaign_code, "minion_group_created", group_data)
+
     @socketio.on("get_entities")
     def handle_get_entities(data): 
         campaign_code = socket_campaigns_dict.get(request.sid)  # type: ignore
@@ -470,9 +647,17 @@ def register_socket_handlers(
             return
 
         state = get_game_state(campaign_code)
+        # Lo pendiente sale antes que el snapshot, así la versión del snapshot es la última
+        broadcast_deltas(campaign_code)
 
         try:
             result = state.query(GetEntities())
+            actor_ids = tuple(
+                actor.id for actor in (*result.get("characters", []), *result.get("enemies", []))
+            )
+            # Una sola pasada para AC y modificadores de todos los combatientes
+            armor_classes = state.query(GetArmorClassBatch(actor_ids=actor_ids, context="ui")).values
+            modifiers = state.query(GetStatModifiersBatch(actor_ids=actor_ids)).values
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -484,7 +669,8 @@ def register_socket_handlers(
                 "name": char.name,
                 "hp": char.hp,
                 "max_hp": char.max_hp,
-                "ac": char.calc_ac(),
+                "ac": armor_classes[char.id].value,
+                "modifiers": {attr: mod.value for attr, mod in modifiers[char.id].items()},
                 "texture": char.texture
                 
             }
@@ -497,15 +683,21 @@ def register_socket_handlers(
                 "name": enemy.name,
                 "hp": enemy.hp,
                 "max_hp": enemy.max_hp,
-                "ac": enemy.ac,
+                "ac": armor_classes[enemy.id].value,
+                "modifiers": {attr: mod.value for attr, mod in modifiers[enemy.id].items()},
                 "texture": enemy.asset_url
             }
             for enemy in result.get("enemies", [])
         ]
 
+        # Un grupo de minions viaja como un solo stat block con sus arrays
+        minion_groups = [group.to_json() for group in result.get("minion_groups", [])]
+
         emit("entities_result", {
+            "version": state.version,
             "characters": characters,
-            "enemies": enemies
+            "enemies": enemies,
+            "minion_groups": minion_groups
         })
 
     @socketio.on("create_enemy")
@@ -551,17 +743,18 @@ def register_socket_handlers(
             emit("error", {"message": str(e)})
             return
 
-        print(event.payload)
-        # En create_enemy:
-        socketio.emit("enemy_created", serialize_token(state.tokens[token_id]), to=data["campaign_code"])
+        broadcast_deltas(data["campaign_code"])
 
 
     @socketio.on("get_tokens")
     def handle_get_tokens(data):
         state = game_states_dict[data["campaign_code"]]
-        tokens = state.tokens.values()
-        
-        emit("tokens_sync", [serialize_token(t) for t in state.tokens.values()])
+        broadcast_deltas(data["campaign_code"])
+
+        emit("tokens_sync", {
+            "version": state.version,
+            "tokens": [serialize_token(t) for t in state.tokens.values()]
+        })
 
     @socketio.on("toggle_equip_item")
     def toggle_equip_item(data):
@@ -598,12 +791,16 @@ def register_socket_handlers(
             character.unequip(target_instance)
         else:
             character.equip(target_instance)
+        state.dispatch(InventoryChangedEvent(
+            character.id, item_id, "equipped" if target_instance.equipped else "unequipped"
+        ))
 
-        emit("item_equipped_toggled", {
+        # Solo le interesa al dueño del personaje (sus pestañas recargan la hoja)
+        router.to_user(campaign_code, str(character.owner_id), "item_equipped_toggled", {
             "character_id": character_id,
             "item_id": item_id,
             "equipped": target_instance.equipped
-        }, to=campaign_code)
+        })
 
     @socketio.on("update_character_inventory")
     def update_character_inventory(data):
@@ -672,16 +869,25 @@ def register_socket_handlers(
         for char in state.characters.values():  # char es instancia de Character
             character_service.save(char)
 
+        # Ya quedó todo en MySQL: el journal de la sesión deja de ser necesario
+        journal = journal_of(state)
+        if journal:
+            journal.detach(state)
+            journal.discard()
+
         # Limpiar estructuras de datos
         game_states_dict.pop(campaign_code, None)
         campaigns_dict.pop(campaign_code, None)
+        movement_aggregators.pop(campaign_code, None)
+        preview_relays.pop(campaign_code, None)
 
         # También eliminar cualquier socket asociado
         to_remove = [sid for sid, code in socket_campaigns_dict.items() if code == campaign_code]
         for sid in to_remove:
             socket_campaigns_dict.pop(sid, None)
 
-        emit("campaign_closed", {"campaign_code": campaign_code}, to=campaign_code)
+        router.to_campaign(campaign_code, "campaign_closed", {"campaign_code": campaign_code})
+        router.close(campaign_code)
 
     from uuid import uuid4
 
@@ -720,24 +926,21 @@ def register_socket_handlers(
         if not success:
             emit("error", {"message": "No se puede añadir el item al inventario"})
             return
-        # Buscar SID del jugador objetivo
+        state.dispatch(InventoryChangedEvent(character.id, item_id, "added"))
+        # Buscar al usuario dueño del personaje objetivo
         players = campaigns_dict[campaign_code]["players"]
 
-        target_sid = None
+        target_user = None
         for p in players.values():
             if p.get("character_uuid") == target_player_id:
-                target_sid = p.get("sid")
+                target_user = p if p.get("sid") else None
                 break
 
-        if not target_sid:
+        if not target_user:
             emit("error", {"message": "Jugador no conectado"})
             return
 
-        emit(
-            "dm_give_item_success",
-            {"player_id": target_player_id},
-            to=target_sid
-        )
+        router.to_user(campaign_code, target_user["user_id"], "dm_give_item_success", {"player_id": target_player_id})
 
     @socketio.on("get_attacks")
     def get_attacks(data):
@@ -760,7 +963,8 @@ def register_socket_handlers(
         )
         state = get_game_state(data["campaign_code"])
         StartCombatAction(start_cmd).execute(state)
-        emit("combat_started", to=data["campaign_code"])
+        broadcast_deltas(data["campaign_code"])
+        router.to_campaign(data["campaign_code"], "combat_started")
 
     @socketio.on("enemy_attack")
     def handle_enemy_attack(data):
@@ -775,9 +979,9 @@ def register_socket_handlers(
         )
         result = AttackAction(attack_command).execute(state)
         
-        socketio.emit("attack_result", result.payload)
+        router.to_campaign(data["campaig_code"], "attack_result", result.payload)
 
-        next_turn(state, data["character_id"])
+        next_turn(state, data["character_id"], data["campaig_code"])
     
     @socketio.on("player_attack")
     def handle_attack(data):
@@ -792,16 +996,146 @@ def register_socket_handlers(
         )
         result = AttackAction(attack_command).execute(state)
         print(result)
-        socketio.emit("attack_result", result.payload)
+        router.to_campaign(data["campaig_code"], "attack_result", result.payload)
+
+        next_turn(state, data["character_id"], data["campaig_code"])
+
+    @socketio.on("area_attack")
+    def handle_area_attack(data):
+        state = get_game_state(data["campaign_code"])
+        try:
+            area_command = AreaEffectCommand(
+                actor_id=UUID(data["character_id"]),
+                target_ids=tuple(UUID(t) for t in data["target_ids"]),
+                name=data.get("name", "Area"),
+                mode=data.get("mode", "save"),
+                damage_dice=data.get("damage_dice"),
+                attack_name=data.get("attack_name"),
+                damage_type=data.get("damage_type", "fire"),
+                save_attribute=data.get("save_attribute", "DEX"),
+                save_dc=int(data.get("save_dc", 10)),
+                half_on_save=data.get("half_on_save", True),
+                advantage=data.get("advantage", False),
+                disadvantage=data.get("disadvantage", False)
+            )
+            result = AreaEffectAction(area_command).execute(state)
+        except (KeyError, ValueError, RuntimeError) as e:
+            emit("error", {"message": str(e)})
+            return
+
+        # Un único attack_result con todos los objetivos (no uno por objetivo)
+        payload = {
+            "type": result.type,
+            "area": True,
+            "actor_id": data["character_id"],
+            "name": result.payload.get("name"),
+            "reason": result.payload.get("reason"),
+            "results": [
+                {
+                    **r,
+                    "target_id": str(r["target_id"]),
+                    "hp": getattr(state.get_actor(r["target_id"]), "hp", None)
+                }
+                for r in result.payload.get("results", [])
+            ]
+        }
+        router.to_campaign(data["campaign_code"], "attack_result", payload)
 
-        next_turn(state, data["character_id"])
+        next_turn(state, UUID(data["character_id"]), data["campaign_code"])
 
-    def next_turn(game_state, actor_id):
+    def next_turn(game_state, actor_id, campaign_code: str):
         end_turn_cmd = EndTurnCommand(actor_id=actor_id)
         EndTurnAction(end_turn_cmd).execute(game_state)
+        broadcast_deltas(campaign_code)
         if game_state.current_phase != Phase.COMBAT:
-            socketio.emit("combat_finished")
+            router.to_campaign(campaign_code, "combat_finished")
             return
         current_actor = game_state.current_actor
-        socketio.emit("next_combatient", {"current_actor" : str(current_actor)})
-        return
\ No newline at end of file
+        router.to_campaign(campaign_code, "next_combatient", {"current_actor" : str(current_actor)})
+
+        # Turno de un enemigo con autoplay: se juega en segundo plano
+        if campaign_code in enemy_autoplay and is_enemy_turn(game_state):
+            socketio.start_background_task(run_enemy_turn, campaign_code)
+        return
+
+    def is_enemy_turn(game_state) -> bool:
+        current = game_state.current_actor
+        return current in game_state.enemies or current in game_state.minion_groups
+
+    def run_enemy_turn(campaign_code: str):
+        """
+        Juega el turno del enemigo actual: foto del estado en el loop, plan en el
+        pool de procesos (el loop sigue atendiendo mientras tanto) y las acciones
+        de vuelta en el loop con las reglas reales.
+        """
+        state = game_states_dict.get(campaign_code)
+        if state is None or state.current_phase != Phase.COMBAT or not is_enemy_turn(state):
+            return
+        if campaign_code in planning_turns:
+            return  # ya hay un plan en curso para esta campaña
+
+        planning_turns.add(campaign_code)
+        try:
+            turn_id = state.current_actor
+            turn_request = turn_planner.snapshot(state, turn_id)
+            plan = tpool.execute(turn_planner.plan, turn_request)
+
+            # El DM pudo haber terminado el turno a mano mientras se planificaba
+            if state.current_actor != plan.turn_id or state.current_turn != plan.turn_number:
+                return
+            if not plan.complete and not plan.attacks:
+                # Sin plan no se pierde el turno: queda en manos del DM
+                router.to_dm(campaign_code, "error", {
+                    "message": "No se pudo planificar el turno del enemigo: queda en manos del DM"
+                })
+                return
+
+            for result in execute_plan(state, plan):
+                router.to_campaign(campaign_code, "attack_result", result.payload)
+            broadcast_deltas(campaign_code)
+
+            router.to_campaign(campaign_code, "enemy_turn_played", {
+                "actor_id": str(turn_id),
+                "attacks": len(plan.attacks),
+                "complete": plan.complete,
+                "elapsed_ms": round(plan.elapsed_ms, 2)
+            })
+        except (RuntimeError, ValueError) as e:
+            router.to_dm(campaign_code, "error", {"message": str(e)})
+            return
+        finally:
+            planning_turns.discard(campaign_code)
+
+        if state.current_phase != Phase.COMBAT:
+            router.to_campaign(campaign_code, "combat_finished")
+            return
+        next_turn(state, turn_id, campaign_code)
+
+    @socketio.on("enemy_auto_turn")
+    def handle_enemy_auto_turn(data):
+        """El DM pide que el enemigo actual juegue solo este turno"""
+        campaign_code = data["campaign_code"]
+        if not router.is_dm(request.sid, campaign_code):  # type: ignore
+            emit("error", {"message": "Solo el DM controla a los enemigos"})
+            return
+        if campaign_code not in game_states_dict:
+            emit("error", {"message": "Campaña no encontrada"})
+            return
+        socketio.start_background_task(run_enemy_turn, campaign_code)
+
+    @socketio.on("enemy_autoplay")
+    def handle_enemy_autoplay(data):
+        """Activa / desactiva los turnos automáticos de enemigos de la campaña"""
+        campaign_code = data["campaign_code"]
+        if not router.is_dm(request.sid, campaign_code):  # type: ignore
+            emit("error", {"message": "Solo el DM controla a los enemigos"})
+            return
+        if data.get("enabled", True):
+            enemy_autoplay.add(campaign_code)
+            tpool.execute(turn_planner.start)
+            state = game_states_dict.get(campaign_code)
+            if state is not None and state.current_phase == Phase.COMBAT and is_enemy_turn(state):
+                socketio.start_background_task(run_enemy_turn, campaign_code)
+        else:
+            enemy_autoplay.discard(campaign_code)
+        router.to_dm(campaign_code, "enemy_autoplay", {"enabled": campaign_code in enemy_autoplay})
\ No newline at end of file
@@ -1,7 +1,13 @@
 from src.core.game.Event import EventDispatcher, GameState
-from src.core.game.EventHandlers import *
-from src.core.game.querys import *
+from src.core.combat.phase import Phase
+from src.core.game.bootstrap import register_core_rules
 from src.features.characters.application.character_mapper import json_to_character
+from src.features.journal.application.journal_service import JournalService
+from src.features.journal.infrastructure.file_event_journal import FileEventJournal, JournalWriter
+from src.features.sync.application.delta_service import StateDeltaService
+
+# Un solo hilo de disco para los journals de todas las campañas del nodo
+journal_writer = JournalWriter()
 
 
 def build_game_state(campaign_code: str, campaigns, character_repository) -> GameState:
@@ -58,21 +64,26 @@ def build_game_state(campaign_code: str, campaigns, character_repository) -> Gam
         dispatcher=dispatcher
     )
 
-    # Registrar handlers
-    dispatcher.register("attack_roll", StunnedAttackHandler())
-    dispatcher.register("attack_hit", ApplyDamageHandler())
-    dispatcher.register("status_requested", ApplyStatusHandler())
-    dispatcher.register("attack_hit", RageDamageHandler())
-    dispatcher.register("token_moved", TokenMovedHandler())
-    dispatcher.register("create_enemy", CreateEnemyHandler())
-    dispatcher.register("combat_ended", CombatEndHandler())
-    dispatcher.register("turn_ended", TurnEndedHandler())
-    dispatcher.register("combat_started", CombatStartedHandler())
-    state.register_query_handler(GetArmorClass, GetArmorClassHandler())
-    state.register_query_handler(GetStatModifier, GetStatModifierHandler())
-    state.register_query_handler(GetEntities, GetEntitiesHandler())
-    state.register_query_handler(GetEntities, GetEntitiesHandler())
-    state.register_query_handler(GetProficiencyBonus, GetProficiencyBonusHandler())
+    # Registrar handlers de eventos y queries
+    register_core_rules(state)
+
+    # Journal en disco: si la sesión anterior se cortó, se recupera desde
+    # el último snapshot + tail del journal (más nuevo que lo guardado en DB)
+    journal_service = JournalService(
+        FileEventJournal(
+            campaign_key=str(campaign.get("campaign_id", campaign_code)),
+            writer=journal_writer
+        )
+    )
+    recovered = journal_service.recover(state)
+    journal_service.attach(state)
+
+    # Sesión nueva: semilla explícita, registrada en el journal como evento.
+    # Una sesión recuperada ya trae su RNG en el snapshot.
+    if not recovered:
+        state.seed_rng()
 
+    # Deltas para los clientes: la línea base es el estado ya recuperado
+    StateDeltaService().attach(state)
 
     return state
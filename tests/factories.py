@@ -0,0 +1,113 @@
+"""
+Actores y estados de juego deterministas para los tests.
+
+Los ids son fijos y el RNG de la campaña tiene semilla, así dos estados
+armados con las mismas llamadas son idénticos (sirve para comparar una
+sesión en vivo contra una recuperada).
+"""
+
+from enum import Enum
+from uuid import UUID
+
+from src.core.character.character import Character
+from src.core.character.dndclass import CLASS_MAP
+from src.core.character.enemy import Enemy, EnemyAttack
+from src.core.character.race import RACE_MAP
+from src.core.combat.phase import Phase
+from src.core.game.bootstrap import register_core_rules
+from src.core.game.Event import GameState
+from src.core.game.rng import DiceRNG
+from src.core.items.item import ItemInstance
+from src.core.items.items import ITEMS, LONG_SWORD
+
+HERO_ID = UUID(int=0x1000)
+OWNER_ID = UUID(int=0x2000)
+GOBLIN_ID = UUID(int=0x3000)
+SEED = 1234
+
+
+def make_hero(hero_id: UUID = HERO_ID, class_name: str = "Barbaro") -> Character:
+    hero = Character(
+        id=hero_id,
+        owner_id=OWNER_ID,
+        name="Subaru",
+        race=RACE_MAP["Human"],
+        dnd_class=CLASS_MAP[class_name]()
+    )
+    sword = ItemInstance(item=ITEMS[LONG_SWORD])
+    sword.instance_id = f"sword-{hero_id.int}"
+    hero.add_item(sword)
+    hero.equip(sword)
+    return hero
+
+
+def make_goblin(goblin_id: UUID = GOBLIN_ID, hp: int = 30, ac: int = 10) -> Enemy:
+    return Enemy(
+        id=goblin_id,
+        owner_id=None,
+        name="Goblin",
+        hp=hp,
+        max_hp=hp,
+        ac=ac,
+        asset_url="none",
+        attacks=[
+            EnemyAttack(name="Scimitar", dice_count=1, dice_size=6, damage_bonus=2,
+                        attack_bonus=4, damage_type="slashing"),
+        ]
+    )
+
+
+def make_state(*actors, seed: int = SEED) -> GameState:
+    """GameState con las reglas base, los actores dados y un RNG con semilla"""
+    state = GameState(current_turn=1, current_phase=Phase.EXPLORATION)
+    register_core_rules(state)
+    state.rng = DiceRNG(seed)
+    for actor in actors:
+        if isinstance(actor, Enemy):
+            state.add_enemy(actor)
+        else:
+            state.add_character(actor)
+    return state
+
+
+def state_dump(state: GameState) -> dict:
+    """Campos del snapshot como estructuras comparables con =="""
+    return {name: canonical(getattr(state, name)) for name in GameState.SNAPSHOT_FIELDS}
+
+
+def canonical(value, _path: frozenset = frozenset()):
+    """
+    Estructura plana y comparable de un objeto (orden de dicts incluido).
+    Los bytes de pickle no sirven para comparar: dependen de qué objetos
+    comparten referencia (un str interno vs uno recién deserializado).
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes, UUID)):
+        return value
+    if isinstance(value, Enum):
+        return (type(value).__name__, value.name)
+    if isinstance(value, type) or callable(value) and not hasattr(value, "__dict__"):
+        return getattr(value, "__qualname__", repr(value))
+    if id(value) in _path:
+        return ("ciclo", type(value).__name__)
+    path = _path | {id(value)}
+    if isinstance(value, dict):
+        return [(canonical(k, path), canonical(v, path)) for k, v in value.items()]
+    if isinstance(value, (list, tuple)):
+        return [canonical(v, path) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(canonical(v, path)) for v in value)
+
+    reduced = value.__reduce_ex__(4)
+    if isinstance(reduced, str):
+        return reduced
+    args = reduced[1] if len(reduced) > 1 else ()
+    state = reduced[2] if len(reduced) > 2 else None
+    items = list(reduced[3]) if len(reduced) > 3 and reduced[3] is not None else []
+    pairs = list(reduced[4]) if len(reduced) > 4 and reduced[4] is not None else []
+    return (
+        type(value).__qualname__,
+        canonical(args, path),
+        canonical(state, path),
+        canonical(items, path),
+        canonical(pairs, path),
+    )
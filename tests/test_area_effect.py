@@ -0,0 +1,91 @@
+import unittest
+
+from src.core.character.enemy import EnemyAttack
+from src.core.game.Action import AreaEffectAction, EndTurnAction, StartCombatAction
+from src.core.game.commands import AreaEffectCommand, EndTurnCommand, StartCombatCommand
+
+from factories import GOBLIN_ID, HERO_ID, make_goblin, make_hero, make_state
+
+
+class AreaEffectFailureTest(unittest.TestCase):
+    def setUp(self):
+        self.hero = make_hero()
+        self.state = make_state(self.hero, make_goblin())
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(self.state)
+        while self.state.current_actor != HERO_ID:
+            EndTurnAction(EndTurnCommand(actor_id=self.state.current_actor)).execute(self.state)
+
+    def area(self, **overrides):
+        fields = dict(actor_id=HERO_ID, target_ids=(GOBLIN_ID,), name="Fireball", damage_dice="8d6")
+        fields.update(overrides)
+        return AreaEffectAction(AreaEffectCommand(**fields)).execute(self.state)
+
+    def assertFailedBeforeDeclaring(self, event, reason: str):
+        self.assertEqual(event.type, "area_failed")
+        self.assertIn(reason, event.payload["reason"])
+        self.assertNotIn("area_roll", [e.type for e in self.state.event_log])
+        # Un efecto que no llegó a declararse no gasta la acción
+        self.assertEqual(self.state.resources[HERO_ID]["action"], 1)
+
+    def test_save_without_damage_dice(self):
+        self.assertFailedBeforeDeclaring(self.area(damage_dice=None), "Missing damage dice")
+
+    def test_invalid_save_attribute(self):
+        self.assertFailedBeforeDeclaring(self.area(save_attribute="LUCK"), "Invalid save attribute")
+
+    def test_attack_without_weapon(self):
+        self.hero.unequip(self.hero.inventory[0])
+        self.assertFailedBeforeDeclaring(self.area(mode="attack", damage_dice=None), "No weapon equipped")
+
+    def test_invalid_mode(self):
+        self.assertFailedBeforeDeclaring(self.area(mode="aura"), "Invalid mode")
+
+    def test_everyone_out_of_range(self):
+        self.state.get_actor(GOBLIN_ID).position = (10, 10)
+        self.assertFailedBeforeDeclaring(self.area(mode="attack", damage_dice=None), "Target out of range")
+
+    def test_valid_save_effect_is_declared_and_resolved(self):
+        event = self.area(save_dc=30)
+        self.assertEqual(event.type, "area_damage")
+        self.assertIn("area_roll", [e.type for e in self.state.event_log])
+        self.assertEqual(self.state.resources[HERO_ID]["action"], 0)
+
+
+class EnemyAreaAttackTest(unittest.TestCase):
+    def setUp(self):
+        self.goblin = make_goblin()
+        self.goblin.attacks.append(EnemyAttack(
+            name="Sling", dice_count=1, dice_size=4, damage_bonus=0, attack_bonus=4, damage_type="bludgeoning"
+        ))
+        hero = make_hero()
+        hero.hp = hero.max_hp = 500
+        self.state = make_state(hero, self.goblin)
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(self.state)
+        while self.state.current_actor != GOBLIN_ID:
+            EndTurnAction(EndTurnCommand(actor_id=self.state.current_actor)).execute(self.state)
+
+    def area(self, attack_name):
+        return AreaEffectAction(AreaEffectCommand(
+            actor_id=GOBLIN_ID, target_ids=(HERO_ID,), name="Volley", mode="attack", attack_name=attack_name
+        )).execute(self.state)
+
+    def test_uses_the_named_attack(self):
+        event = self.area("Sling")
+        self.assertEqual(event.type, "area_damage")
+        damage_rolls = [e for e in self.state.event_log if e.type == "roll_resolved" and e.payload["reason"] == "area_damage"]
+        self.assertTrue(damage_rolls)
+        self.assertTrue(all(e.payload["dice"] == "1d4" for e in damage_rolls))
+
+    def test_rolls_with_the_attack_bonus_of_the_stat_block(self):
+        event = self.area("Sling")
+        for result in event.payload["results"]:
+            self.assertEqual(result["total"] - result["natural_roll"], 4)
+
+    def test_unknown_attack_fails_before_declaring(self):
+        event = self.area("Fireball")
+        self.assertEqual(event.type, "area_failed")
+        self.assertNotIn("area_roll", [e.type for e in self.state.event_log])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from src.core.character.minion_group import MinionGroup
+from src.core.combat.conditions import (
+    Act,
+    Condition,
+    Roll,
+    auto_critical,
+    auto_fails,
+    blocking_condition,
+    can_act,
+    compile_conditions,
+    condition_mask,
+    condition_names,
+    roll_mode,
+)
+
+from factories import make_goblin, make_hero
+
+C = Condition
+
+
+class ConditionMaskTest(unittest.TestCase):
+    def test_implied_conditions_are_added(self):
+        mask = compile_conditions(["inconsciente"])
+        self.assertTrue(mask & C.INCAPACITADO)
+        self.assertTrue(mask & C.DERRIBADO)
+        self.assertEqual(set(condition_names(compile_conditions(["aturdido"]))), {"aturdido", "incapacitado"})
+
+    def test_statuses_that_are_not_conditions_are_ignored(self):
+        self.assertEqual(compile_conditions(["rage", "bendecido"]), 0)
+
+    def test_mask_of_character_and_minion(self):
+        hero = make_hero()
+        hero.status["envenenado"] = {"turns": 2}
+        hero.status["rage"] = {"turns": 3}
+        self.assertEqual(condition_mask(hero), int(C.ENVENENADO))
+
+        group = MinionGroup(make_goblin(), count=2)
+        group.add_condition(1, "paralizado")
+        self.assertEqual(condition_mask(group.member(0)), 0)
+        self.assertEqual(condition_mask(group.member(1)), int(C.PARALIZADO | C.INCAPACITADO))
+
+
+class ConditionTablesTest(unittest.TestCase):
+    def test_attacker_conditions(self):
+        self.assertEqual(roll_mode(Roll.ATTACK_MELEE, int(C.CEGADO)), (False, True))
+        self.assertEqual(roll_mode(Roll.ATTACK_RANGED, int(C.INVISIBLE)), (True, False))
+        # Envenenado afecta pruebas pero no salvaciones
+        self.assertEqual(roll_mode(Roll.ABILITY_CHECK, int(C.ENVENENADO)), (False, True))
+        self.assertEqual(roll_mode(Roll.SAVE_CON, int(C.ENVENENADO)), (False, False))
+
+    def test_prone_target_depends_on_distance(self):
+        prone = int(C.DERRIBADO)
+        self.assertEqual(roll_mode(Roll.ATTACK_MELEE, 0, prone), (True, False))
+        self.assertEqual(roll_mode(Roll.ATTACK_RANGED, 0, prone), (False, True))
+
+    def test_advantage_and_disadvantage_together(self):
+        self.assertEqual(roll_mode(Roll.ATTACK_MELEE, int(C.INVISIBLE), int(C.INVISIBLE)), (True, True))
+
+    def test_helpless_targets(self):
+        paralyzed = compile_conditions(["paralizado"])
+        self.assertTrue(auto_fails(Roll.SAVE_DEX, paralyzed))
+        self.assertTrue(auto_fails(Roll.SAVE_STR, paralyzed))
+        self.assertFalse(auto_fails(Roll.SAVE_WIS, paralyzed))
+        self.assertTrue(auto_critical(Roll.ATTACK_MELEE, paralyzed))
+        self.assertFalse(auto_critical(Roll.ATTACK_RANGED, paralyzed))
+        self.assertEqual(roll_mode(Roll.ATTACK_RANGED, 0, paralyzed), (True, False))
+
+    def test_blocking_condition_names_the_source(self):
+        stunned = compile_conditions(["aturdido"])
+        self.assertEqual(blocking_condition(Act.ACTION, stunned), "aturdido")
+        self.assertIsNone(blocking_condition(Act.ACTION, compile_conditions(["envenenado"])))
+
+    def test_grappled_can_act_but_not_move(self):
+        grappled = compile_conditions(["agarrado"])
+        self.assertTrue(can_act(Act.ACTION, grappled))
+        self.assertFalse(can_act(Act.MOVE, grappled))
+        self.assertEqual(blocking_condition(Act.MOVE, grappled), "agarrado")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from src.core.game.Action import EndTurnAction, StartCombatAction, StatusAction
+from src.core.game.commands import EndTurnCommand, StartCombatCommand, StatusCommand
+from src.core.game.Event import Event, EventContext, MoveTokenEvent
+from src.features.sync.application.delta_service import StateDeltaService
+
+from factories import GOBLIN_ID, HERO_ID, make_goblin, make_hero, make_state
+
+TOKEN_ID = str(GOBLIN_ID)
+
+
+class StateDeltaTest(unittest.TestCase):
+    def setUp(self):
+        self.goblin = make_goblin()
+        self.state = make_state(make_hero(), self.goblin)
+        self.state.add_token({"id": TOKEN_ID, "x": 0, "y": 0})
+        self.deltas = StateDeltaService()
+        self.deltas.attach(self.state)
+
+    def changes(self, batch: dict, kind: str) -> list[dict]:
+        return [c for c in batch["changes"] if c["t"] == kind]
+
+    def test_nothing_changed(self):
+        self.assertIsNone(self.deltas.take())
+        self.assertEqual(self.state.version, 0)
+
+    def test_one_version_per_committed_change(self):
+        for x in range(3):
+            self.state.dispatch(MoveTokenEvent(token_id=TOKEN_ID, x=x + 1, y=0))
+        self.assertEqual(self.state.version, 3)
+
+        batch = self.deltas.take()
+        self.assertEqual((batch["from"], batch["version"]), (0, 3))
+        # El token tocado tres veces viaja una sola vez, con su último valor
+        self.assertEqual(self.changes(batch, "token"), [{"t": "token", "id": TOKEN_ID, "x": 3, "y": 0}])
+
+    def test_batches_chain_by_version(self):
+        self.state.dispatch(MoveTokenEvent(token_id=TOKEN_ID, x=1, y=1))
+        first = self.deltas.take()
+        self.state.dispatch(MoveTokenEvent(token_id=TOKEN_ID, x=2, y=2))
+        second = self.deltas.take()
+        self.assertEqual(second["from"], first["version"])
+        self.assertIsNone(self.deltas.take())
+
+    def test_event_without_visible_change_keeps_the_version(self):
+        self.state.dispatch(Event(type="noop", context=EventContext(actor_id=HERO_ID), cancelable=False))
+        self.assertEqual(self.state.version, 0)
+        self.assertIsNone(self.deltas.take())
+
+    def test_hp_status_and_turn_changes(self):
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(self.state)
+        self.state.dispatch(Event(
+            type="attack_hit",
+            context=EventContext(actor_id=HERO_ID, target_id=GOBLIN_ID),
+            payload={"target_id": GOBLIN_ID, "damage": 4},
+            cancelable=False
+        ))
+        StatusAction(StatusCommand(HERO_ID, GOBLIN_ID, "envenenado", duration_turns=1)).execute(self.state)
+
+        batch = self.deltas.take()
+        self.assertEqual(self.changes(batch, "hp"), [{"t": "hp", "id": str(GOBLIN_ID), "hp": 26}])
+        self.assertEqual(self.changes(batch, "status"), [
+            {"t": "status", "id": str(GOBLIN_ID), "status": "envenenado", "on": True}
+        ])
+        self.assertEqual(len(self.changes(batch, "initiative")), 1)
+        self.assertEqual(self.changes(batch, "turn")[0]["actor"], str(self.state.current_actor))
+
+        # El estado vence con el fin de turno: sale como "on": False
+        EndTurnAction(EndTurnCommand(actor_id=self.state.current_actor)).execute(self.state)
+        batch = self.deltas.take()
+        self.assertIn(
+            {"t": "status", "id": str(GOBLIN_ID), "status": "envenenado", "on": False},
+            batch["changes"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
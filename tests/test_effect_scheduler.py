@@ -0,0 +1,121 @@
+import unittest
+from uuid import UUID
+
+from src.core.game.Action import EndTurnAction, StartCombatAction, StatusAction, TickEffectAction
+from src.core.game.commands import EndTurnCommand, StartCombatCommand, StatusCommand, TickEffectCommand
+from src.core.game.effect_scheduler import EffectScheduler
+
+from factories import GOBLIN_ID, HERO_ID, make_goblin, make_hero, make_state
+
+A = UUID(int=1)
+B = UUID(int=2)
+
+
+class ExpiryTest(unittest.TestCase):
+    def test_status_expires_on_its_tick(self):
+        scheduler = EffectScheduler()
+        self.assertEqual(scheduler.schedule_expiry(A, "aturdido", 2), 2)
+        scheduler.schedule_expiry(B, "cegado", 1)
+
+        self.assertEqual(scheduler.advance(), [(B, "cegado")])
+        self.assertEqual(scheduler.remaining(A, "aturdido"), 1)
+        self.assertEqual(scheduler.advance(), [(A, "aturdido")])
+        self.assertEqual(scheduler.advance(), [])
+
+    def test_reapplying_replaces_the_previous_expiry(self):
+        scheduler = EffectScheduler()
+        scheduler.schedule_expiry(A, "aturdido", 1)
+        scheduler.schedule_expiry(A, "aturdido", 3)
+
+        self.assertEqual(scheduler.advance(), [])
+        self.assertEqual(scheduler.advance(), [])
+        self.assertEqual(scheduler.advance(), [(A, "aturdido")])
+
+    def test_cancelled_expiry_never_fires(self):
+        scheduler = EffectScheduler()
+        scheduler.schedule_expiry(A, "aturdido", 1)
+        scheduler.cancel_expiry(A, "aturdido")
+        self.assertIsNone(scheduler.remaining(A, "aturdido"))
+        self.assertEqual(scheduler.advance(), [])
+
+    def test_zero_turns_lasts_one_turn(self):
+        scheduler = EffectScheduler()
+        scheduler.schedule_expiry(A, "derribado", 0)
+        self.assertEqual(scheduler.advance(), [(A, "derribado")])
+
+    def test_rebuilt_from_legacy_statuses(self):
+        hero = make_hero()
+        hero.status["envenenado"] = {"turns": 2}
+        hero.status["rage"] = {"bonus": 2}  # sin contador: no vence
+        scheduler = EffectScheduler.from_statuses([hero])
+        self.assertEqual(scheduler.remaining(HERO_ID, "envenenado"), 2)
+        self.assertIsNone(scheduler.remaining(HERO_ID, "rage"))
+
+
+class TickTest(unittest.TestCase):
+    def test_ticks_consume_their_charges(self):
+        scheduler = EffectScheduler()
+        poison = scheduler.add_tick(A, A, "veneno", "1d4", duration=2)
+        regen = scheduler.add_tick(A, A, "regeneración", "1d6", kind="heal")
+
+        self.assertEqual(scheduler.due_ticks(A), [poison, regen])
+        self.assertEqual(poison.remaining, 1)
+        self.assertEqual(scheduler.due_ticks(A), [poison, regen])
+        self.assertEqual(scheduler.due_ticks(A), [regen])
+        self.assertEqual(scheduler.due_ticks(B), [])
+
+    def test_remove_tick(self):
+        scheduler = EffectScheduler()
+        effect = scheduler.add_tick(A, A, "veneno", "1d4")
+        scheduler.remove_tick(effect.id)
+        self.assertEqual(scheduler.ticks_of(A), [])
+
+    def test_invalid_kind(self):
+        with self.assertRaises(RuntimeError):
+            EffectScheduler().add_tick(A, A, "raro", "1d4", kind="drain")
+
+
+class EffectsInCombatTest(unittest.TestCase):
+    def setUp(self):
+        self.goblin = make_goblin(hp=100)
+        self.state = make_state(make_hero(), self.goblin)
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(self.state)
+
+    def end_turn(self) -> None:
+        EndTurnAction(EndTurnCommand(actor_id=self.state.current_actor)).execute(self.state)
+
+    def test_status_lasts_its_turns(self):
+        StatusAction(StatusCommand(HERO_ID, GOBLIN_ID, "aturdido", duration_turns=2)).execute(self.state)
+        self.assertIn("aturdido", self.goblin.status)
+        self.end_turn()
+        self.assertIn("aturdido", self.goblin.status)
+        self.end_turn()
+        self.assertNotIn("aturdido", self.goblin.status)
+        self.assertIn("status_expired", [e.type for e in self.state.event_log])
+
+    def test_status_stores_the_tick_it_expires_on(self):
+        StatusAction(StatusCommand(HERO_ID, GOBLIN_ID, "envenenado", duration_turns=3)).execute(self.state)
+        expires_at = self.goblin.status["envenenado"]["expires_at"]
+        for remaining in (3, 2, 1):
+            self.assertEqual(expires_at - self.state.effects.tick, remaining)
+            self.assertEqual(self.state.effects.remaining(GOBLIN_ID, "envenenado"), remaining)
+            self.end_turn()
+        self.assertNotIn("envenenado", self.goblin.status)
+
+    def test_tick_applies_at_the_end_of_the_target_turn(self):
+        TickEffectAction(TickEffectCommand(HERO_ID, GOBLIN_ID, "veneno", "1d4", duration_turns=2)).execute(self.state)
+        ticks = []
+        for _ in range(6):
+            ending = self.state.current_actor
+            before = self.goblin.hp
+            self.end_turn()
+            if self.goblin.hp != before:
+                ticks.append(ending)
+
+        self.assertEqual(ticks, [GOBLIN_ID, GOBLIN_ID])
+        applied = [e for e in self.state.event_log if e.type == "effect_tick_applied"]
+        self.assertEqual(self.goblin.hp, 100 - sum(e.payload["amount"] for e in applied))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+from concurrent.futures import Executor, Future
+from uuid import UUID
+
+from src.core.character.minion_group import MinionGroup
+from src.core.combat.conditions import compile_conditions
+from src.core.combat.expected_damage import hit_chances
+from src.core.game.Action import AttackAction, EndTurnAction, StartCombatAction
+from src.core.game.commands import AttackCommand, EndTurnCommand, StartCombatCommand
+from src.features.enemies.application.enemy_turn_planner import (
+    EnemyTurnPlanner,
+    PlanAttack,
+    PlanAttacker,
+    PlanTarget,
+    TurnRequest,
+    execute_plan,
+    plan_turn,
+    snapshot_turn,
+)
+
+from factories import HERO_ID, make_goblin, make_hero, make_state
+
+TURN_ID = UUID(int=0x7 << 16)
+WEAK = UUID(int=0xA)
+STRONG = UUID(int=0xB)
+
+DAGGER = PlanAttack(name="Dagger", dice="1d4", attack_bonus=4)
+AXE = PlanAttack(name="Axe", dice="1d12+3", attack_bonus=4)
+BOW = PlanAttack(name="Bow", dice="1d8", attack_bonus=4, range_ft=60)
+
+
+def attacker(n: int, attacks=(DAGGER, AXE), x: int = 0, conditions: int = 0) -> PlanAttacker:
+    return PlanAttacker(id=UUID(int=(0x7 << 16) | n), x=x, y=0, conditions=conditions, attacks=tuple(attacks))
+
+
+def target(target_id: UUID, hp: int, x: int = 1, ac: int = 12) -> PlanTarget:
+    return PlanTarget(id=target_id, hp=hp, ac=ac, x=x, y=0, conditions=0)
+
+
+def plan(attackers, targets, budget_ms: int = 1000):
+    return plan_turn(TurnRequest(
+        turn_id=TURN_ID, turn_number=1, attackers=tuple(attackers), targets=tuple(targets), budget_ms=budget_ms
+    ))
+
+
+class PlanTurnTest(unittest.TestCase):
+    def test_picks_the_attack_with_most_expected_damage(self):
+        result = plan([attacker(1)], [target(STRONG, hp=50)])
+        self.assertEqual([a.attack_name for a in result.attacks], ["Axe"])
+        self.assertTrue(result.complete)
+
+    def test_focuses_the_weakest_then_moves_on(self):
+        # Un hachazo esperado alcanza para el de 3 HP: el segundo va al otro
+        result = plan([attacker(1), attacker(2)], [target(STRONG, hp=50), target(WEAK, hp=3)])
+        self.assertEqual([a.target_id for a in result.attacks], [WEAK, STRONG])
+
+    def test_only_attacks_in_range(self):
+        result = plan([attacker(1, attacks=(AXE, BOW))], [target(STRONG, hp=50, x=6)])
+        self.assertEqual([a.attack_name for a in result.attacks], ["Bow"])
+
+        result = plan([attacker(1, attacks=(AXE,))], [target(STRONG, hp=50, x=6)])
+        self.assertEqual(result.attacks, [])
+
+    def test_incapacitated_attacker_does_not_act(self):
+        stunned = attacker(1, conditions=compile_conditions(["aturdido"]))
+        result = plan([stunned, attacker(2)], [target(STRONG, hp=50)])
+        self.assertEqual([a.actor_id for a in result.attacks], [attacker(2).id])
+
+    def test_out_of_budget_marks_the_plan_incomplete(self):
+        result = plan([attacker(i) for i in range(1, 50)], [target(STRONG, hp=500)], budget_ms=-1)
+        self.assertFalse(result.complete)
+        self.assertEqual(result.attacks, [])
+
+
+class StalledExecutor(Executor):
+    """Un pool que todavía no levantó sus workers: nada termina"""
+    def submit(self, fn, /, *args, **kwargs):
+        return Future()
+
+
+class EnemyTurnPlannerTest(unittest.TestCase):
+    def test_cold_pool_falls_back_to_planning_in_process(self):
+        planner = EnemyTurnPlanner(executor=StalledExecutor())
+        request = TurnRequest(
+            turn_id=TURN_ID, turn_number=1, attackers=(attacker(1),), targets=(target(STRONG, hp=50),), budget_ms=50
+        )
+        result = planner.plan(request)
+        self.assertEqual([a.attack_name for a in result.attacks], ["Axe"])
+
+
+class SnapshotTurnTest(unittest.TestCase):
+    def test_members_that_already_acted_are_left_out(self):
+        hero = make_hero()
+        hero.hp = hero.max_hp = 500
+        state = make_state(hero)
+        group = MinionGroup(make_goblin(), count=3, id=TURN_ID)
+        state.add_minion_group(group)
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, TURN_ID])).execute(state)
+        while state.current_actor != TURN_ID:
+            EndTurnAction(EndTurnCommand(actor_id=state.current_actor)).execute(state)
+
+        AttackAction(AttackCommand(
+            actor_id=group.member_id(0), target_id=HERO_ID, mode="melee",
+            advantage=False, disadvantage=False, attack_name=None
+        )).execute(state)
+        group.set_hp(2, 0)
+
+        request = snapshot_turn(state, TURN_ID)
+        self.assertEqual([a.id for a in request.attackers], [group.member_id(1)])
+        self.assertEqual([t.id for t in request.targets], [HERO_ID])
+
+
+class ExecutePlanTest(unittest.TestCase):
+    def test_live_attack_uses_the_bonus_the_plan_scored(self):
+        hero = make_hero()
+        hero.hp = hero.max_hp = 500
+        goblin = make_goblin(TURN_ID)
+        state = make_state(hero, goblin)
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, TURN_ID])).execute(state)
+        while state.current_actor != TURN_ID:
+            EndTurnAction(EndTurnCommand(actor_id=state.current_actor)).execute(state)
+
+        request = snapshot_turn(state, TURN_ID)
+        execute_plan(state, plan_turn(request))
+        rolls = [e for e in state.event_log if e.type == "attack_roll"]
+        self.assertEqual(len(rolls), 1)
+        bonus = rolls[0].payload["attack_score"] - rolls[0].payload["natural_roll"]
+        self.assertEqual(bonus, request.attackers[0].attacks[0].attack_bonus)
+
+
+class HitChancesTest(unittest.TestCase):
+    def test_natural_one_is_not_an_automatic_miss(self):
+        # Igual que AttackAction: con bonus suficiente hasta el 1 natural impacta
+        self.assertEqual(hit_chances(10, 11), (1.0, 1 / 20))
+        self.assertEqual(hit_chances(0, 30), (1 / 20, 1 / 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from src.core.game.Action import AttackAction, EndTurnAction, StartCombatAction
+from src.core.game.commands import AttackCommand, EndTurnCommand, StartCombatCommand
+from src.core.game.Event import InventoryChangedEvent
+from src.features.journal.application.journal_service import JournalService
+from src.features.journal.infrastructure.file_event_journal import FileEventJournal, JournalWriter
+
+from factories import GOBLIN_ID, HERO_ID, make_goblin, make_hero, make_state, state_dump
+
+
+class JournalRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def journal(self, snapshot_every: int = 500, writer=None) -> JournalService:
+        return JournalService(
+            FileEventJournal(campaign_key="c1", base_dir=self.tmp.name, writer=writer),
+            snapshot_every=snapshot_every
+        )
+
+    def live_session(self, snapshot_every: int = 500, writer=None):
+        state = make_state(make_hero(), make_goblin())
+        journal = self.journal(snapshot_every, writer)
+        journal.attach(state)
+        return state, journal
+
+    def recovered(self):
+        state = make_state(make_hero(), make_goblin())
+        journal = self.journal()
+        self.assertTrue(journal.recover(state))
+        journal.close()
+        return state
+
+    def attack_and_end_turn(self, state) -> None:
+        actor_id = state.current_actor
+        target_id = GOBLIN_ID if actor_id == HERO_ID else HERO_ID
+        AttackAction(AttackCommand(
+            actor_id=actor_id, target_id=target_id, mode="melee",
+            advantage=False, disadvantage=False, attack_name=None
+        )).execute(state)
+        EndTurnAction(EndTurnCommand(actor_id=actor_id)).execute(state)
+
+    def test_recovered_state_matches_live_session(self):
+        live, journal = self.live_session()
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(live)
+        journal.flush(live)
+        self.attack_and_end_turn(live)
+        journal.flush(live)
+        journal.close()
+
+        # Lo que no pasa por handlers también tiene que volver igual
+        self.assertEqual(live.current_turn, 2)
+        self.assertEqual(live.effects.tick, 1)
+
+        recovered = self.recovered()
+        self.assertEqual(state_dump(recovered), state_dump(live))
+        self.assertEqual([e.id for e in recovered.event_log], [e.id for e in live.event_log])
+
+    def test_recovery_from_snapshot_and_tail(self):
+        live, journal = self.live_session(snapshot_every=5)
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(live)
+        for _ in range(3):
+            self.attack_and_end_turn(live)
+            journal.flush(live)
+        # Cambio hecho desde la UI (fuera de las reglas), anunciado con su evento
+        hero = live.characters[HERO_ID]
+        sword = hero.inventory[0]
+        hero.unequip(sword)
+        live.dispatch(InventoryChangedEvent(HERO_ID, sword.item.item_id, "unequipped"))
+        journal.flush(live)
+        journal.close()
+
+        self.assertEqual(state_dump(self.recovered()), state_dump(live))
+
+    def test_recovery_through_the_writer_thread(self):
+        live, journal = self.live_session(snapshot_every=5, writer=JournalWriter())
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(live)
+        for _ in range(3):
+            self.attack_and_end_turn(live)
+            journal.flush(live)
+        journal.close()
+
+        self.assertEqual(state_dump(self.recovered()), state_dump(live))
+
+    def test_state_after_last_checkpoint_is_not_half_applied(self):
+        live, journal = self.live_session()
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(live)
+        journal.flush(live)
+        expected = state_dump(live)
+
+        # Eventos ya en disco (lote lleno) pero sin su checkpoint: se ignoran
+        journal.journal.batch_size = 1
+        self.attack_and_end_turn(live)
+        journal.journal.close()
+
+        self.assertEqual(state_dump(self.recovered()), expected)
+
+    def test_snapshot_is_written_off_the_calling_thread(self):
+        writer = JournalWriter()
+        release = threading.Event()
+        writer.submit(release.wait)  # el hilo de disco queda ocupado
+        live, journal = self.live_session(writer=writer)
+        snapshot_path = journal.journal.snapshot_path
+
+        journal.snapshot(live)
+        self.assertFalse(os.path.exists(snapshot_path))
+
+        release.set()
+        writer.wait()
+        self.assertTrue(os.path.exists(snapshot_path))
+        journal.close()
+
+    def test_nothing_to_recover(self):
+        state = make_state(make_hero())
+        journal = self.journal()
+        self.assertFalse(journal.recover(state))
+        journal.discard()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from uuid import UUID
+
+from src.core.character.minion_group import MinionGroup
+from src.core.game.Action import AreaEffectAction, AttackAction, EndTurnAction, StartCombatAction
+from src.core.game.commands import AreaEffectCommand, AttackCommand, EndTurnCommand, StartCombatCommand
+from src.core.game.Event import Event, EventContext
+
+from factories import HERO_ID, make_goblin, make_hero, make_state
+
+GROUP_ID = UUID(int=0x5 << 16)
+
+
+class MinionActionsTest(unittest.TestCase):
+    def setUp(self):
+        hero = make_hero()
+        hero.hp = hero.max_hp = 500
+        self.state = make_state(hero)
+        self.group = MinionGroup(make_goblin(), count=3, id=GROUP_ID)
+        self.state.add_minion_group(self.group)
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GROUP_ID])).execute(self.state)
+        self.until_group_turn()
+
+    def until_group_turn(self) -> None:
+        while self.state.current_actor != GROUP_ID:
+            EndTurnAction(EndTurnCommand(actor_id=self.state.current_actor)).execute(self.state)
+
+    def attack(self, index: int):
+        return AttackAction(AttackCommand(
+            actor_id=self.group.member_id(index), target_id=HERO_ID, mode="melee",
+            advantage=False, disadvantage=False, attack_name=None
+        )).execute(self.state)
+
+    def test_group_gets_one_action_per_member(self):
+        self.assertEqual(self.state.resources[GROUP_ID]["action"], 3)
+
+    def test_member_cannot_take_the_actions_of_the_others(self):
+        self.assertIn(self.attack(0).type, ("attack_hit", "attack_miss"))
+        failed = self.attack(0)
+        self.assertEqual(failed.type, "attack_failed")
+        self.assertEqual(failed.payload["reason"], "No action available")
+        # Las acciones que quedan siguen siendo de los otros miembros
+        self.assertEqual(self.state.resources[GROUP_ID]["action"], 2)
+        self.assertIn(self.attack(1).type, ("attack_hit", "attack_miss"))
+
+    def test_area_effect_counts_as_the_member_action(self):
+        self.attack(2)
+        event = AreaEffectAction(AreaEffectCommand(
+            actor_id=self.group.member_id(2), target_ids=(HERO_ID,), name="Bomb", damage_dice="1d6"
+        )).execute(self.state)
+        self.assertEqual(event.type, "area_failed")
+        self.assertEqual(event.payload["reason"], "No action available")
+
+    def test_members_act_again_next_turn(self):
+        self.attack(0)
+        EndTurnAction(EndTurnCommand(actor_id=GROUP_ID)).execute(self.state)
+        self.until_group_turn()
+        self.assertEqual(list(self.group.acted), [0, 0, 0])
+        self.assertIn(self.attack(0).type, ("attack_hit", "attack_miss"))
+
+
+class MinionDamageTest(unittest.TestCase):
+    def setUp(self):
+        self.state = make_state(make_hero())
+        self.group = MinionGroup(make_goblin(hp=10), count=3, id=GROUP_ID)
+        self.state.add_minion_group(self.group)
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GROUP_ID])).execute(self.state)
+
+    def hit(self, index: int, damage: int) -> None:
+        member_id = self.group.member_id(index)
+        self.state.dispatch(Event(
+            type="attack_hit",
+            context=EventContext(actor_id=HERO_ID, target_id=member_id),
+            payload={"target_id": member_id, "damage": damage},
+            cancelable=False
+        ))
+
+    def test_damage_goes_to_one_member(self):
+        self.hit(1, 4)
+        self.assertEqual(list(self.group.hp), [10, 6, 10])
+        self.assertEqual(self.state.get_actor(self.group.member_id(1)).hp, 6)
+
+    def test_killed_member_leaves_the_group_in_initiative(self):
+        self.hit(0, 50)
+        self.assertEqual(self.group.hp[0], 0)
+        self.assertEqual(self.group.alive, 2)
+        self.assertIn(GROUP_ID, list(self.state.initiative))
+        self.assertEqual(self.state.resources[GROUP_ID]["action"], 3)
+        killed = [e.context.actor_id for e in self.state.event_log if e.type == "entity_killed"]
+        self.assertEqual(killed, [self.group.member_id(0)])
+
+    def test_last_member_ends_the_combat(self):
+        for i in range(3):
+            self.hit(i, 50)
+        self.assertEqual(self.group.alive, 0)
+        self.assertNotIn(GROUP_ID, list(self.state.initiative))
+        self.assertIn("combat_ended", [e.type for e in self.state.event_log])
+
+    def test_area_effect_hits_every_living_member(self):
+        self.hit(0, 50)
+        while self.state.current_actor != HERO_ID:
+            EndTurnAction(EndTurnCommand(actor_id=self.state.current_actor)).execute(self.state)
+        event = AreaEffectAction(AreaEffectCommand(
+            actor_id=HERO_ID, target_ids=(GROUP_ID,), name="Fireball", damage_dice="1d4", save_dc=1
+        )).execute(self.state)
+
+        self.assertEqual(event.type, "area_damage")
+        self.assertEqual([r["target_id"] for r in event.payload["results"]], [self.group.member_id(1), self.group.member_id(2)])
+        for result, index in zip(event.payload["results"], (1, 2)):
+            self.assertEqual(self.group.hp[index], 10 - result["damage"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from dataclasses import fields
+
+from src.core.game.Action import StartCombatAction
+from src.core.game.commands import StartCombatCommand
+from src.core.game.Event import Event, EventContext, GameState
+from src.core.game.shadow_state import ShadowState
+
+from factories import GOBLIN_ID, HERO_ID, make_goblin, make_hero, make_state, state_dump
+
+
+class ShadowStateTest(unittest.TestCase):
+    def setUp(self):
+        self.state = make_state(make_hero(), make_goblin())
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(self.state)
+
+    def test_covers_every_game_state_field(self):
+        shadow = ShadowState(self.state)
+        for f in fields(GameState):
+            self.assertTrue(hasattr(shadow, f.name) or hasattr(shadow, f"_{f.name}"), f.name)
+
+    def test_simulation_leaves_the_base_untouched(self):
+        before = state_dump(self.state)
+        log_size = len(self.state.event_log)
+
+        events = self.state.run_readonly_events([
+            Event(
+                type="attack_hit",
+                context=EventContext(actor_id=HERO_ID, target_id=GOBLIN_ID),
+                payload={"target_id": GOBLIN_ID, "damage": 100},
+                cancelable=False
+            ),
+            Event(type="status_requested", context=EventContext(actor_id=HERO_ID, target_id=HERO_ID),
+                  payload={"status": "aturdido", "duration_turns": 2}),
+        ])
+
+        # En la sombra el goblin murió y el héroe quedó aturdido...
+        self.assertIn("entity_killed", [e.type for e in events[0]])
+        self.assertIn("status_applied", [e.type for e in events[1]])
+        # ...y en el estado real no pasó nada
+        self.assertEqual(state_dump(self.state), before)
+        self.assertEqual(len(self.state.event_log), log_size)
+
+    def test_shadow_rng_does_not_consume_the_campaign_sequence(self):
+        shadow = ShadowState(self.state)
+        shadow.rng.randint(1, 20)
+        expected = make_state(make_hero(), make_goblin())
+        StartCombatAction(StartCombatCommand(participant_ids=[HERO_ID, GOBLIN_ID])).execute(expected)
+        self.assertEqual(self.state.rng.randint(1, 1000), expected.rng.randint(1, 1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from src.features.simulation.application.simulation_service import MAX_ENEMIES, SimulationService
+
+OWNER = "owner-1"
+
+
+class FakeRepo:
+    def __init__(self, rows: dict):
+        self.rows = rows
+        self.lookups = 0
+
+    def get_by_id(self, row_id):
+        self.lookups += 1
+        return self.rows.get(row_id)
+
+
+class SimulationLimitsTest(unittest.TestCase):
+    def setUp(self):
+        self.characters = FakeRepo({"hero": {"id": "hero", "owner_id": "otro"}})
+        self.enemies = FakeRepo({"gob": {"id": "gob", "owner_id": OWNER}})
+        self.service = SimulationService(self.characters, self.enemies, simulator=object())
+
+    def test_total_enemy_count_is_capped_before_loading(self):
+        enemies = [{"id": "gob", "count": MAX_ENEMIES}, {"id": "gob", "count": 1}]
+        with self.assertRaises(RuntimeError):
+            self.service.simulate_encounter(["hero"], enemies, runs=1, owner_id=OWNER)
+        self.assertEqual(self.characters.lookups + self.enemies.lookups, 0)
+
+    def test_count_must_be_positive(self):
+        with self.assertRaises(RuntimeError):
+            self.service.simulate_encounter(["hero"], [{"id": "gob", "count": -3}], runs=1, owner_id=OWNER)
+
+    def test_character_of_another_owner_is_rejected(self):
+        with self.assertRaisesRegex(RuntimeError, "Acceso denegado al personaje"):
+            self.service.simulate_encounter(["hero"], [{"id": "gob"}], runs=1, owner_id=OWNER)
+
+
+if __name__ == "__main__":
+    unittest.main()